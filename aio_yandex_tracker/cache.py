@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.http import HttpResponse
+
+CACHE_KEY = Tuple[str, Hashable]
+
+
+def freeze_mapping(mapping: Optional[Dict[str, Any]]) -> Tuple:
+    return tuple(sorted((str(k), str(v)) for k, v in (mapping or {}).items()))
+
+
+def make_cache_key(
+    endpoint: str, params: Optional[Dict[str, Any]] = None
+) -> CACHE_KEY:
+    return endpoint.strip("/"), freeze_mapping(params)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        max_size: int = const.CACHE_MAX_SIZE_DEFAULT,
+    ):
+        # TTLs are keyed by endpoint templates, e.g. const.TRANSITIONS_URL
+        self.ttls = {**const.CACHE_TTLS_DEFAULT, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (expires_at, issue_id, response)
+        self.__entries: "OrderedDict[CACHE_KEY, Tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get_ttl(self, template: Optional[str]) -> Optional[float]:
+        return self.ttls.get(template, self.default_ttl)
+
+    def get(self, key: CACHE_KEY) -> Optional[HttpResponse]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, response = entry
+        if expires_at <= monotonic():
+            del self.__entries[key]
+            self.misses += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        # Callers may change the body, e.g. through entities built on it
+        return response.copy()
+
+    def set(
+        self,
+        key: CACHE_KEY,
+        response: HttpResponse,
+        ttl: float,
+        issue_id: Optional[str] = None,
+    ) -> None:
+        self.__entries[key] = (monotonic() + ttl, issue_id, response.copy())
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.__entries.pop(make_cache_key(endpoint, params), None)
+
+    def invalidate_issues(self, issue_ids: Iterable[str]) -> None:
+        issue_ids = {str(issue_id) for issue_id in issue_ids if issue_id}
+        if not issue_ids:
+            return
+        for key in [
+            key
+            for key, (_, issue_id, _) in self.__entries.items()
+            if issue_id in issue_ids
+        ]:
+            del self.__entries[key]
+
+    def clear(self) -> None:
+        self.__entries.clear()
@@ -0,0 +1,129 @@
+import gzip
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
+
+from aio_yandex_tracker import const, errors
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class Decompressor(ABC):
+    @abstractmethod
+    def decompress(self, chunk: bytes) -> bytes:
+        pass
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class ZlibDecompressor(Decompressor):
+    def __init__(self, wbits: int):
+        self.__wbits = wbits
+        self.__started = False
+        self.__decompressor = zlib.decompressobj(wbits)
+
+    def decompress(self, chunk: bytes) -> bytes:
+        try:
+            data = self.__decompressor.decompress(chunk)
+        except zlib.error as exc:
+            if self.__started or self.__wbits != zlib.MAX_WBITS:
+                raise errors.DecompressionError(str(exc)) from exc
+            # Some servers send raw deflate data without zlib header
+            self.__wbits = -zlib.MAX_WBITS
+            self.__decompressor = zlib.decompressobj(self.__wbits)
+            try:
+                data = self.__decompressor.decompress(chunk)
+            except zlib.error as exc:
+                raise errors.DecompressionError(str(exc)) from exc
+        self.__started = True
+        return data
+
+    def flush(self) -> bytes:
+        try:
+            return self.__decompressor.flush()
+        except zlib.error as exc:
+            raise errors.DecompressionError(str(exc)) from exc
+
+
+class BrotliDecompressor(Decompressor):
+    def __init__(self):
+        if brotli is None:
+            raise ImportError("brotli is not installed")
+        self.__decompressor = brotli.Decompressor()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        try:
+            return self.__decompressor.process(chunk)
+        except brotli.error as exc:
+            raise errors.DecompressionError(str(exc)) from exc
+
+
+class ZstdDecompressor(Decompressor):
+    def __init__(self):
+        if zstandard is None:
+            raise ImportError("zstandard is not installed")
+        self.__decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        try:
+            return self.__decompressor.decompress(chunk)
+        except zstandard.ZstdError as exc:
+            raise errors.DecompressionError(str(exc)) from exc
+
+
+DECOMPRESSORS: Dict[str, Callable[[], Decompressor]] = {
+    "gzip": lambda: ZlibDecompressor(16 + zlib.MAX_WBITS),
+    "x-gzip": lambda: ZlibDecompressor(16 + zlib.MAX_WBITS),
+    "deflate": lambda: ZlibDecompressor(zlib.MAX_WBITS),
+    "br": BrotliDecompressor,
+    "zstd": ZstdDecompressor,
+}
+
+
+def get_accept_encoding() -> Tuple[str, ...]:
+    # Only encodings which can be decoded with installed libraries
+    encodings = ["gzip", "deflate"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return tuple(encodings)
+
+
+def create_decompressor(
+    content_encoding: Optional[str],
+) -> Optional[Decompressor]:
+    encoding = (content_encoding or "").strip().lower()
+    if not encoding or encoding == "identity":
+        return None
+    factory = DECOMPRESSORS.get(encoding)
+    try:
+        if factory is None:
+            raise ImportError()
+        return factory()
+    except ImportError as exc:
+        raise errors.UnsupportedEncodingError(
+            f"Unsupported response encoding: {content_encoding}"
+        ) from exc
+
+
+def decompress(body: bytes, content_encoding: Optional[str]) -> bytes:
+    decompressor = create_decompressor(content_encoding)
+    if decompressor is None or not body:
+        return body
+    return decompressor.decompress(body) + decompressor.flush()
+
+
+def compress(
+    body: bytes, level: int = const.COMPRESSION_LEVEL_DEFAULT
+) -> bytes:
+    return gzip.compress(body, compresslevel=level)
@@ -7,6 +7,12 @@ class API_VERSION_NAME(Enum):
     V2 = "v2"
 
 
+class ENTITY_MODE(Enum):
+    DEFAULT = "default"
+    COMPACT = "compact"
+    LAZY = "lazy"
+
+
 API_HEADERS_DEFAULT = {"Content-type": "application/json"}
 API_URL_SCHEMA = "https"
 API_URL_ROOT = "api.tracker.yandex.net"
@@ -25,15 +31,24 @@ TRANSITIONS_URL = f"{ISSUES_DIRECT_URL}/transitions"
 TRANSITIONS_EXEC_URL = f"{TRANSITIONS_URL}/{{transition_id}}/_execute"
 
 PRIORITIES_URL = "priorities"
+ENDPOINTS_RESOLVE_CACHE_SIZE = 4096
 
 
 # ---
 HTTP_METHODS = ["get", "patch", "post", "put", "delete"]
+HTTP_METHODS_IDEMPOTENT = ("get", "put", "delete")
+HTTP_METHODS_COALESCE = ("get",)
+REQUEST_KWARGS_COALESCE = {"params", "headers", "timeout", "deadline"}
 RESPONSE_ENCODING_DEFAULT = "utf-8"
 RESPONSE_CODES_OK = (
     HTTPStatus.OK,
     HTTPStatus.CREATED,
     HTTPStatus.NO_CONTENT,
+    HTTPStatus.NOT_MODIFIED,
+)
+RESPONSE_CODES_EMPTY = (
+    HTTPStatus.NO_CONTENT,
+    HTTPStatus.NOT_MODIFIED,
 )
 RESPONSE_CODES_RETRY = (
     HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -42,8 +57,76 @@ RESPONSE_CODES_RETRY = (
     HTTPStatus.GATEWAY_TIMEOUT,
     HTTPStatus.TOO_MANY_REQUESTS,
 )
+RESPONSE_CODES_RETRY_SAFE = (HTTPStatus.TOO_MANY_REQUESTS,)
 BACKOFF_RETRIES = 0
 BACKOFF_RETRY_INTERVAL = 1
+BACKOFF_MAX_DELAY = 30
+BACKOFF_MULTIPLIER = 2
+PAGINATION_CONCURRENCY_DEFAULT = 4
+BULK_BATCH_SIZE_DEFAULT = 100
+BULK_CONCURRENCY_DEFAULT = 8
+CHANGELOG_PER_PAGE_DEFAULT = 50
+REQUEST_TIMEOUT_TOTAL_DEFAULT = 5 * 60
+REQUEST_TIMEOUT_CONNECT_DEFAULT = 30
+# Response body size in bytes, bigger bodies are parsed in an executor
+OFFLOAD_THRESHOLD_DEFAULT = 256 * 1024
+# gzip level of compressed request bodies
+COMPRESSION_LEVEL_DEFAULT = 6
+# Size of body chunks read by streaming requests
+STREAM_CHUNK_SIZE_DEFAULT = 64 * 1024
+
+# Response cache, TTLs are in seconds
+CACHE_MAX_SIZE_DEFAULT = 1024
+CACHE_TTLS_DEFAULT = {
+    PRIORITIES_URL: 60 * 60,
+    TRANSITIONS_URL: 5 * 60,
+}
+
+# Connection pool
+CONNECTOR_LIMIT_DEFAULT = 100
+CONNECTOR_LIMIT_PER_HOST_DEFAULT = 0
+CONNECTOR_KEEPALIVE_TIMEOUT_DEFAULT = 60
+CONNECTOR_DNS_CACHE_TTL_DEFAULT = 300
+
+# Rate limiting, requests per second
+RATE_LIMIT_RATE_DEFAULT = 10.0
+RATE_LIMIT_MIN_RATE_DEFAULT = 0.5
+RATE_LIMIT_INCREASE_DEFAULT = 0.1
+RATE_LIMIT_DECREASE_DEFAULT = 0.5
+RATE_LIMIT_PAUSE_DEFAULT = 5
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RATE_LIMIT_RESET_HEADER = "X-RateLimit-Reset"
+RATE_LIMIT_RESET_EPOCH_THRESHOLD = 10**9
+
+
+# Persistent stores
+STORE_SQLITE_TABLE_DEFAULT = "store"
+MIRROR_SYNC_INTERVAL_DEFAULT = 60
+MIRROR_PER_PAGE_DEFAULT = 100
+
+# Multi-tenant pool
+POOL_MAX_TENANTS_DEFAULT = 256
+POOL_IDLE_TIMEOUT_DEFAULT = 600
+POOL_MAX_RATE_LIMITERS_DEFAULT = 4096
+
+# Synchronous client
+SYNC_THREAD_NAME_DEFAULT = "aio-yandex-tracker-loop"
+
+# Instrumentation
+METRICS_NAMESPACE_DEFAULT = "yandex_tracker"
+METRICS_ENDPOINT_UNKNOWN = "unknown"
+METRICS_LATENCY_BUCKETS_DEFAULT = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
 
 
 # Tests
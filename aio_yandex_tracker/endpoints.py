@@ -0,0 +1,43 @@
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Pattern, Tuple
+
+from aio_yandex_tracker import const
+
+# Static endpoints go first: "issues/_search" must not match "issues/{id}"
+ENDPOINT_TEMPLATES = (
+    const.ISSUES_URL,
+    const.ISSUES_COUNT_URL,
+    const.ISSUES_IMPORT_URL,
+    const.ISSUES_SEARCH_URL,
+    const.PRIORITIES_URL,
+    const.ISSUES_DIRECT_URL,
+    const.ISSUES_MOVE_URL,
+    const.CHANGELOG_URL,
+    const.LINKS_URL,
+    const.LINKS_DIRECT_URL,
+    const.TRANSITIONS_URL,
+    const.TRANSITIONS_EXEC_URL,
+)
+
+
+def compile_template(template: str) -> Pattern:
+    pattern = re.sub(
+        r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template.strip("/"))
+    )
+    return re.compile(f"^{pattern}/?$")
+
+
+_ENDPOINT_PATTERNS = tuple(
+    (template, compile_template(template)) for template in ENDPOINT_TEMPLATES
+)
+
+
+@lru_cache(maxsize=const.ENDPOINTS_RESOLVE_CACHE_SIZE)
+def resolve_endpoint(endpoint: str) -> Tuple[Optional[str], Dict[str, str]]:
+    endpoint = endpoint.strip("/")
+    for template, pattern in _ENDPOINT_PATTERNS:
+        match = pattern.match(endpoint)
+        if match:
+            return template, match.groupdict()
+    return None, {}
@@ -8,6 +8,10 @@ class ApiUnknownError(BaseException):
     pass
 
 
+class ApiTimeoutError(ApiUnknownError):
+    pass
+
+
 class HttpError(BaseException):
     def __init__(
         self,
@@ -42,6 +46,10 @@ class ApiBadRequestError(HttpError):
     pass
 
 
+class ConflictError(HttpError):
+    pass
+
+
 class IncorrectDataError(HttpError):
     pass
 
@@ -62,10 +70,23 @@ class PaginationProhibitedError(BaseException):
     pass
 
 
+class StreamParseError(BaseException):
+    pass
+
+
+class UnsupportedEncodingError(BaseException):
+    pass
+
+
+class DecompressionError(BaseException):
+    pass
+
+
 HTTP_ERRORS_MAPPING = {
     HTTPStatus.BAD_REQUEST: ApiBadRequestError,
     HTTPStatus.UNPROCESSABLE_ENTITY: IncorrectDataError,
     HTTPStatus.UNAUTHORIZED: AuthRequiredError,
     HTTPStatus.FORBIDDEN: AuthRequiredError,
     HTTPStatus.NOT_FOUND: NotFoundError,
+    HTTPStatus.CONFLICT: ConflictError,
 }
@@ -0,0 +1,319 @@
+from bisect import bisect_left
+from http import HTTPStatus
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aio_yandex_tracker import const
+from aiohttp import ClientSession, TraceConfig
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover
+    otel_trace = None
+
+
+class RequestInfo:
+    __slots__ = (
+        "method",
+        "url",
+        "endpoint",
+        "started_at",
+        "duration",
+        "attempts",
+        "status",
+        "bytes_sent",
+        "bytes_received",
+        "bytes_received_compressed",
+        "pool_wait",
+        "limiter_wait",
+        "context",
+    )
+
+    def __init__(
+        self, method: str, url: str, endpoint: str, bytes_sent: int = 0
+    ):
+        self.method = method
+        self.url = url
+        # Endpoint template, e.g. const.ISSUES_DIRECT_URL
+        self.endpoint = endpoint
+        self.started_at = monotonic()
+        self.duration: Optional[float] = None
+        self.attempts = 0
+        self.status: Optional[int] = None
+        self.bytes_sent = bytes_sent
+        self.bytes_received = 0
+        self.bytes_received_compressed = 0
+        # Time spent waiting for a free connection of the pool
+        self.pool_wait = 0.0
+        # Time spent waiting for the rate limiter
+        self.limiter_wait = 0.0
+        # Private data of hooks, e.g. tracing spans
+        self.context: Dict[Any, Any] = {}
+
+    def finish(self) -> None:
+        self.duration = monotonic() - self.started_at
+
+
+class RequestHooks:
+    def on_request_start(self, info: RequestInfo) -> None:
+        pass
+
+    def on_request_retry(self, info: RequestInfo, delay: float) -> None:
+        pass
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        # A streamed response ends once its body stream is closed
+        pass
+
+    def on_request_error(self, info: RequestInfo, exc: BaseException) -> None:
+        pass
+
+
+class CompositeHooks(RequestHooks):
+    def __init__(self, *hooks: RequestHooks):
+        self.hooks = hooks
+
+    def on_request_start(self, info: RequestInfo) -> None:
+        for hooks in self.hooks:
+            hooks.on_request_start(info)
+
+    def on_request_retry(self, info: RequestInfo, delay: float) -> None:
+        for hooks in self.hooks:
+            hooks.on_request_retry(info, delay)
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        for hooks in self.hooks:
+            hooks.on_request_end(info)
+
+    def on_request_error(self, info: RequestInfo, exc: BaseException) -> None:
+        for hooks in self.hooks:
+            hooks.on_request_error(info, exc)
+
+
+def create_trace_config() -> TraceConfig:
+    # Connection pool wait is only visible through aiohttp tracing
+    async def on_queued_start(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        ctx.queued_at = monotonic()
+
+    async def on_queued_end(
+        session: ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        info = ctx.trace_request_ctx
+        if isinstance(info, RequestInfo):
+            info.pool_wait += monotonic() - ctx.queued_at
+
+    trace_config = TraceConfig()
+    trace_config.on_connection_queued_start.append(on_queued_start)
+    trace_config.on_connection_queued_end.append(on_queued_end)
+    return trace_config
+
+
+class EndpointStats:
+    __slots__ = (
+        "requests",
+        "errors",
+        "retries",
+        "throttled",
+        "bytes_sent",
+        "bytes_received",
+        "bytes_received_compressed",
+        "pool_wait",
+        "latency_sum",
+        "latency_buckets",
+    )
+
+    def __init__(self, buckets: int):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bytes_received_compressed = 0
+        self.pool_wait = 0.0
+        self.latency_sum = 0.0
+        # The last bucket counts requests slower than every bound
+        self.latency_buckets = [0] * (buckets + 1)
+
+
+class MetricsCollector(RequestHooks):
+    def __init__(
+        self,
+        buckets: Iterable[float] = const.METRICS_LATENCY_BUCKETS_DEFAULT,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        # {(method, endpoint template): stats}
+        self.stats: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def get(self, method: str, endpoint: str) -> EndpointStats:
+        key = (method, endpoint)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = EndpointStats(len(self.buckets))
+        return stats
+
+    def on_request_retry(self, info: RequestInfo, delay: float) -> None:
+        stats = self.get(info.method, info.endpoint)
+        stats.retries += 1
+        if info.status == HTTPStatus.TOO_MANY_REQUESTS:
+            stats.throttled += 1
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        self.__observe(info)
+
+    def on_request_error(self, info: RequestInfo, exc: BaseException) -> None:
+        self.__observe(info).errors += 1
+
+    def __observe(self, info: RequestInfo) -> EndpointStats:
+        stats = self.get(info.method, info.endpoint)
+        stats.requests += 1
+        if info.status == HTTPStatus.TOO_MANY_REQUESTS:
+            stats.throttled += 1
+        stats.bytes_sent += info.bytes_sent
+        stats.bytes_received += info.bytes_received
+        stats.bytes_received_compressed += info.bytes_received_compressed
+        stats.pool_wait += info.pool_wait
+        stats.latency_sum += info.duration
+        stats.latency_buckets[bisect_left(self.buckets, info.duration)] += 1
+        return stats
+
+
+class PrometheusHooks(RequestHooks):
+    def __init__(
+        self,
+        registry: Optional[Any] = None,
+        namespace: str = const.METRICS_NAMESPACE_DEFAULT,
+        buckets: Iterable[float] = const.METRICS_LATENCY_BUCKETS_DEFAULT,
+    ):
+        if prometheus_client is None:
+            raise ImportError("prometheus_client is not installed")
+        registry = registry or prometheus_client.REGISTRY
+        labels = ["method", "endpoint"]
+        options = {"namespace": namespace, "registry": registry}
+        self.latency = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "Duration of Tracker API requests including retries",
+            [*labels, "status"],
+            buckets=tuple(buckets),
+            **options,
+        )
+        self.pool_wait = prometheus_client.Histogram(
+            "pool_wait_seconds",
+            "Time spent waiting for a free connection",
+            labels,
+            buckets=tuple(buckets),
+            **options,
+        )
+        self.retries = prometheus_client.Counter(
+            "request_retries",
+            "Retried Tracker API requests",
+            [*labels, "status"],
+            **options,
+        )
+        self.throttled = prometheus_client.Counter(
+            "throttled_responses",
+            "Responses with 429 Too Many Requests status",
+            labels,
+            **options,
+        )
+        self.bytes_sent = prometheus_client.Counter(
+            "sent_bytes", "Size of request bodies", labels, **options
+        )
+        self.bytes_received = prometheus_client.Counter(
+            "received_bytes", "Size of response bodies", labels, **options
+        )
+        self.bytes_received_compressed = prometheus_client.Counter(
+            "received_compressed_bytes",
+            "Size of response bodies as transferred",
+            labels,
+            **options,
+        )
+
+    def on_request_retry(self, info: RequestInfo, delay: float) -> None:
+        self.retries.labels(
+            info.method, info.endpoint, str(info.status or "error")
+        ).inc()
+        if info.status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.throttled.labels(info.method, info.endpoint).inc()
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        self.__observe(info, str(info.status))
+
+    def on_request_error(self, info: RequestInfo, exc: BaseException) -> None:
+        self.__observe(info, str(info.status or "error"))
+
+    def __observe(self, info: RequestInfo, status: str) -> None:
+        labels = (info.method, info.endpoint)
+        self.latency.labels(*labels, status).observe(info.duration)
+        self.pool_wait.labels(*labels).observe(info.pool_wait)
+        if info.status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.throttled.labels(*labels).inc()
+        self.bytes_sent.labels(*labels).inc(info.bytes_sent)
+        self.bytes_received.labels(*labels).inc(info.bytes_received)
+        self.bytes_received_compressed.labels(*labels).inc(
+            info.bytes_received_compressed
+        )
+
+
+class OpenTelemetryHooks(RequestHooks):
+    def __init__(self, tracer: Optional[Any] = None):
+        if otel_trace is None:
+            raise ImportError("opentelemetry-api is not installed")
+        self.tracer = tracer or otel_trace.get_tracer(__name__)
+
+    def on_request_start(self, info: RequestInfo) -> None:
+        info.context[self] = self.tracer.start_span(
+            f"{info.method.upper()} {info.endpoint}",
+            kind=otel_trace.SpanKind.CLIENT,
+            attributes={
+                "http.method": info.method.upper(),
+                "http.url": info.url,
+                "tracker.endpoint": info.endpoint,
+            },
+        )
+
+    def on_request_retry(self, info: RequestInfo, delay: float) -> None:
+        info.context[self].add_event(
+            "retry",
+            {
+                "attempt": info.attempts,
+                "delay": delay,
+                "http.status_code": info.status or 0,
+            },
+        )
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        self.__finish(info)
+
+    def on_request_error(self, info: RequestInfo, exc: BaseException) -> None:
+        span = info.context[self]
+        span.record_exception(exc)
+        span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+        self.__finish(info)
+
+    def __finish(self, info: RequestInfo) -> None:
+        span = info.context.pop(self)
+        attributes: List[Tuple[str, Any]] = [
+            ("tracker.attempts", info.attempts),
+            ("tracker.pool_wait", info.pool_wait),
+            ("tracker.limiter_wait", info.limiter_wait),
+            ("http.request_content_length", info.bytes_sent),
+            ("http.response_content_length", info.bytes_received_compressed),
+            (
+                "http.response_content_length_uncompressed",
+                info.bytes_received,
+            ),
+        ]
+        if info.status is not None:
+            attributes.append(("http.status_code", info.status))
+        for name, value in attributes:
+            span.set_attribute(name, value)
+        span.end()
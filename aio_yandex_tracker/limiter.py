@@ -0,0 +1,142 @@
+from asyncio import Lock, Semaphore, sleep
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from time import monotonic, time
+from types import TracebackType
+from typing import Optional, Type
+
+from aio_yandex_tracker import const, types
+
+
+def parse_retry_after(headers: types.HEADERS_OBJECT) -> Optional[float]:
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_reset(headers: types.HEADERS_OBJECT) -> Optional[float]:
+    remaining = headers.get(const.RATE_LIMIT_REMAINING_HEADER)
+    reset = headers.get(const.RATE_LIMIT_RESET_HEADER)
+    if remaining is None or reset is None:
+        return None
+    try:
+        if int(remaining) > 0:
+            return None
+        reset = float(reset)
+    except ValueError:
+        return None
+    # Either delta-seconds or an absolute unix timestamp
+    if reset > const.RATE_LIMIT_RESET_EPOCH_THRESHOLD:
+        reset -= time()
+    return max(reset, 0.0)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: float = const.RATE_LIMIT_RATE_DEFAULT,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        min_rate: float = const.RATE_LIMIT_MIN_RATE_DEFAULT,
+        rate_increase: float = const.RATE_LIMIT_INCREASE_DEFAULT,
+        rate_decrease: float = const.RATE_LIMIT_DECREASE_DEFAULT,
+        pause: float = const.RATE_LIMIT_PAUSE_DEFAULT,
+    ):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate_increase = rate_increase
+        self.rate_decrease = rate_decrease
+        self.pause = pause
+        self.burst = burst or max(int(rate), 1)
+        self.max_concurrency = max_concurrency
+        self.__rate = rate
+        self.__tokens = float(self.burst)
+        self.__updated_at = monotonic()
+        self.__paused_until = 0.0
+        self.__lock: Optional[Lock] = None
+        self.__semaphore: Optional[Semaphore] = None
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    @property
+    def paused_for(self) -> float:
+        return max(self.__paused_until - monotonic(), 0.0)
+
+    async def acquire(self) -> None:
+        # Primitives are created lazily so that the limiter may be
+        # instantiated outside of a running event loop
+        if self.__lock is None:
+            self.__lock = Lock()
+            if self.max_concurrency:
+                self.__semaphore = Semaphore(self.max_concurrency)
+
+        if self.__semaphore:
+            await self.__semaphore.acquire()
+        try:
+            async with self.__lock:
+                await self.__take_token()
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        if self.__semaphore:
+            self.__semaphore.release()
+
+    def on_response(self, status: int, headers: types.HEADERS_OBJECT) -> None:
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.__rate = max(self.__rate * self.rate_decrease, self.min_rate)
+            delay = parse_retry_after(headers)
+            self.pause_for(self.pause if delay is None else delay)
+            return
+
+        self.__rate = min(self.__rate + self.rate_increase, self.max_rate)
+        delay = parse_rate_limit_reset(headers)
+        if delay:
+            self.pause_for(delay)
+
+    def pause_for(self, delay: float) -> None:
+        self.__paused_until = max(self.__paused_until, monotonic() + delay)
+
+    async def __take_token(self) -> None:
+        while True:
+            now = monotonic()
+            delay = self.__paused_until - now
+            if delay <= 0:
+                self.__tokens = min(
+                    self.__tokens
+                    + max(now - self.__updated_at, 0.0) * self.__rate,
+                    self.burst,
+                )
+                self.__updated_at = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                delay = (1 - self.__tokens) / self.__rate
+            else:
+                # Nothing accumulates while the server asks us to back off
+                self.__tokens = 0.0
+                self.__updated_at = self.__paused_until
+            await sleep(delay)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.release()
@@ -0,0 +1,202 @@
+import sqlite3
+from asyncio import sleep
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.api import Issue, Issues
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS issues ("
+    "key TEXT PRIMARY KEY, "
+    "id TEXT, "
+    "queue TEXT, "
+    "status TEXT, "
+    "updated_at TEXT, "
+    "payload TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS issues_queue ON issues (queue)",
+    "CREATE INDEX IF NOT EXISTS issues_status ON issues (status)",
+    "CREATE INDEX IF NOT EXISTS issues_updated_at ON issues (updated_at)",
+    "CREATE TABLE IF NOT EXISTS sync (name TEXT PRIMARY KEY, value TEXT)",
+)
+
+
+def _reference_key(value: Any) -> Optional[str]:
+    # Queue and status are objects in issue payloads
+    if isinstance(value, dict):
+        return value.get("key") or value.get("id")
+    return value
+
+
+class IssueMirror:
+    # Issues which stop matching the filter, e.g. moved to another queue,
+    # are not reported by the delta search and keep their last mirrored
+    # state. Bootstrap into a new file to drop them
+    def __init__(
+        self,
+        issues: Issues,
+        path: str,
+        filter_params: Optional[Dict] = None,
+        per_page: int = const.MIRROR_PER_PAGE_DEFAULT,
+    ):
+        self.issues = issues
+        self.path = path
+        # Tracker search filter which defines the mirrored issues
+        self.filter_params = filter_params or {}
+        self.per_page = per_page
+        self.__codec = issues.session.json_codec
+        self.__connection = sqlite3.connect(path)
+        with self.__connection:
+            for statement in _SCHEMA:
+                self.__connection.execute(statement)
+
+    @property
+    def last_sync(self) -> Optional[str]:
+        # The latest updatedAt seen, server time is used to avoid clock skew
+        row = self.__connection.execute(
+            "SELECT value FROM sync WHERE name = 'updated_at'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        return self.__connection.execute(
+            "SELECT COUNT(*) FROM issues"
+        ).fetchone()[0]
+
+    async def bootstrap(self) -> int:
+        return await self.__load(None)
+
+    async def sync(self) -> int:
+        last_sync = self.last_sync
+        if last_sync is None:
+            return await self.bootstrap()
+        return await self.__load(last_sync)
+
+    async def run(
+        self, interval: float = const.MIRROR_SYNC_INTERVAL_DEFAULT
+    ) -> None:
+        while True:
+            await self.sync()
+            await sleep(interval)
+
+    def get(self, key: str) -> Optional[Issue]:
+        row = self.__connection.execute(
+            "SELECT payload FROM issues WHERE key = ?", (key,)
+        ).fetchone()
+        return (
+            self.issues.from_payload(self.__codec.loads(row[0]))
+            if row
+            else None
+        )
+
+    def query(
+        self,
+        queue: Optional[str] = None,
+        status: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        keys: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Issue]:
+        conditions: List[str] = []
+        values: List[Any] = []
+        for column, value in (("queue", queue), ("status", status)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                values.append(value)
+        if updated_since is not None:
+            conditions.append("updated_at >= ?")
+            values.append(updated_since)
+        if keys is not None:
+            keys = list(keys)
+            conditions.append(f"key IN ({', '.join('?' * len(keys))})")
+            values.extend(keys)
+
+        statement = "SELECT payload FROM issues"
+        if conditions:
+            statement += f" WHERE {' AND '.join(conditions)}"
+        statement += " ORDER BY updated_at, key"
+        if limit is not None:
+            statement += " LIMIT ?"
+            values.append(limit)
+        return [
+            self.issues.from_payload(self.__codec.loads(row[0]))
+            for row in self.__connection.execute(statement, values)
+        ]
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    async def __load(self, updated_since: Optional[str]) -> int:
+        # Keyset pagination: every request starts from the latest updatedAt
+        # seen, so issues updated meanwhile cannot shift the rest of the
+        # results past a page boundary. "from" is inclusive, issues updated
+        # at the same moment are loaded again rather than missed
+        loaded = 0
+        page_num = 1
+        previous_keys: Set[str] = set()
+        while True:
+            filter_params = {**self.filter_params}
+            if updated_since is not None:
+                filter_params["updatedAt"] = {"from": updated_since}
+            params = {"perPage": self.per_page}
+            if page_num > 1:
+                params["page"] = page_num
+            page = await self.issues.search(
+                {"filter": filter_params, "order": "+updatedAt"}, params
+            )
+            payloads = [issue.original_payload for issue in page]
+            # Pages are written one by one, an interrupted sync resumes from
+            # the last stored updatedAt
+            self.__store(payloads)
+            keys = {payload["key"] for payload in payloads}
+            loaded += len(keys - previous_keys)
+            previous_keys = keys
+            if len(payloads) < self.per_page:
+                return loaded
+            latest = max(
+                payload.get("updatedAt") or "" for payload in payloads
+            )
+            if not latest or latest == updated_since:
+                # A whole page updated at the same moment, the cursor cannot
+                # move, so that moment is paged through by numbers
+                page_num += 1
+            else:
+                updated_since = latest
+                page_num = 1
+
+    def __store(self, payloads: List[Dict]) -> None:
+        if not payloads:
+            return
+        rows: List[Tuple] = [
+            (
+                payload["key"],
+                payload.get("id"),
+                _reference_key(payload.get("queue")),
+                _reference_key(payload.get("status")),
+                payload.get("updatedAt"),
+                self.__codec.dumps(payload).decode(),
+            )
+            for payload in payloads
+        ]
+        updated_at = max(
+            (row[4] for row in rows if row[4]), default=self.last_sync
+        )
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO issues "
+                "(key, id, queue, status, updated_at, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if updated_at is not None:
+                self.__connection.execute(
+                    "INSERT INTO sync (name, value) VALUES ('updated_at', ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = "
+                    "MAX(value, excluded.value)",
+                    (updated_at,),
+                )
+
+    def __enter__(self) -> "IssueMirror":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,32 +1,161 @@
+import os
 import uuid
-from typing import Any, Dict, Optional, Type, Union
-
-from aio_yandex_tracker import const, errors
+from asyncio import Future, Semaphore, ensure_future, gather, get_running_loop
+from collections import deque
+from http import HTTPStatus
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from aio_yandex_tracker import const, errors, types
+from aio_yandex_tracker.models.bulk import (
+    BULK_ITEM_RESULT,
+    BulkResult,
+    as_async_iterator,
+    iter_bounded,
+    make_unique_key,
+    read_jsonl,
+)
 from aio_yandex_tracker.models.http import HttpResponse
 from aio_yandex_tracker.session import HttpSession
+from aio_yandex_tracker.storage import BaseStore
 
 # from yarl import URL
 
 
+# {(entity_cls, entity_mode, keep_payload): variant_cls}
+_ENTITY_VARIANTS: Dict[Tuple, Type["BaseEntity"]] = {}
+# {(entity_cls, fields): projected_cls}
+_ENTITY_PROJECTIONS: Dict[Tuple, Type["BaseEntity"]] = {}
+
+
 class BaseEntity:
+    # Entity classes declare no instance storage: DEFAULT instances get
+    # a __dict__ from their variant, COMPACT ones get slots only
+    __slots__ = ()
     __original_payload = None
     # {field_name: (is_required, alias_name)}
     _fields = {}
+    # Attributes set on instances besides the fields
+    _instance_attrs = ("_session", "_parent_id")
+    _entity_mode = const.ENTITY_MODE.DEFAULT
+    _keep_payload = True
+    _parent_id = None
 
-    def __init__(self, payload: Dict[str, Any], session: HttpSession):
+    def __init__(
+        self,
+        payload: Dict[str, Any],
+        session: HttpSession,
+        parent_id: Optional[str] = None,
+    ):
         self._session = session
+        if parent_id is not None:
+            self._parent_id = parent_id
         self.original_payload = payload
 
+    def __new__(cls, *args, **kwargs) -> "BaseEntity":
+        # Declared entity classes are instantiated as their DEFAULT variant
+        if "_variant_base" not in cls.__dict__ and not cls.__dictoffset__:
+            cls = cls.variant()
+        return super(BaseEntity, cls).__new__(cls)
+
     @property
     def original_payload(self) -> Dict[str, Any]:
+        if not self._keep_payload:
+            return self.as_dict(original_names=True)
         return self.__original_payload
 
     @original_payload.setter
     def original_payload(self, value: Dict[str, Any]) -> None:
         self.set_fields(value)
-        self.__original_payload = value
+        if self._keep_payload:
+            self.__original_payload = value
+
+    @classmethod
+    def variant(
+        cls,
+        entity_mode: Union[str, const.ENTITY_MODE] = const.ENTITY_MODE.DEFAULT,
+        keep_payload: bool = True,
+    ) -> Type["BaseEntity"]:
+        entity_mode = const.ENTITY_MODE(entity_mode)
+        if entity_mode is const.ENTITY_MODE.LAZY:
+            # Lazy entities resolve their fields from the payload
+            keep_payload = True
+        # Variants are always derived from the plain entity class
+        base_cls = cls.__dict__.get("_variant_base", cls)
+        if entity_mode is const.ENTITY_MODE.DEFAULT:
+            if base_cls.__dictoffset__:
+                # Subclasses without __slots__ have a __dict__ already
+                return base_cls
+            keep_payload = True
+
+        key = (base_cls, entity_mode, keep_payload)
+        if key not in _ENTITY_VARIANTS:
+            _ENTITY_VARIANTS[key] = _ENTITY_VARIANT_FACTORIES[entity_mode](
+                base_cls, keep_payload
+            )
+        return _ENTITY_VARIANTS[key]
+
+    @classmethod
+    def projected(
+        cls, fields: Optional[Iterable[str]] = None
+    ) -> Type["BaseEntity"]:
+        # Entities of a partial response expect only the requested fields,
+        # and none of them is required: empty fields are omitted by the API
+        if not fields:
+            return cls
+        key = (cls, frozenset(fields))
+        if key not in _ENTITY_PROJECTIONS:
+            _ENTITY_PROJECTIONS[key] = type(
+                f"Projected{cls.__name__}",
+                (cls,),
+                {
+                    "__slots__": (),
+                    "__module__": cls.__module__,
+                    "_fields": {
+                        name: (False, alias)
+                        for name, (_, alias) in cls._fields.items()
+                        if name in key[1]
+                    },
+                },
+            )
+        return _ENTITY_PROJECTIONS[key]
+
+    @classmethod
+    def _variant_of(cls, entity_cls: Type["BaseEntity"]) -> Type["BaseEntity"]:
+        return entity_cls.variant(cls._entity_mode, cls._keep_payload)
+
+    @classmethod
+    def _field_attrs(cls) -> List[str]:
+        return [
+            alias
+            for alias in (
+                meta[1] or name for name, meta in cls._fields.items()
+            )
+            if not alias.startswith("__") and alias != "original_payload"
+        ]
 
     def set_fields(self, payload: Dict[str, Any]) -> None:
+        for alias, value in self._iter_field_values(payload):
+            setattr(self, alias, value)
+
+    def _iter_field_values(
+        self, payload: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Any]]:
         for name, meta in self._fields.items():
             required, alias = meta
             alias = alias or name
@@ -35,7 +164,6 @@ class BaseEntity:
 
             try:
                 value = payload[name]
-                setattr(self, alias, value)
             except KeyError:
                 if not required:
                     continue
@@ -43,6 +171,7 @@ class BaseEntity:
                     f"Required field for {self.__class__.__name__} "
                     f"is missing: {name}"
                 )
+            yield alias, value
 
     def as_dict(self, original_names: bool = False) -> Dict[str, Any]:
         output = {}
@@ -58,6 +187,188 @@ class BaseEntity:
         return output
 
 
+def _create_compact_variant(
+    entity_cls: Type[BaseEntity], keep_payload: bool
+) -> Type[BaseEntity]:
+    # Instances have no __dict__. Fields get slots only when the payload
+    # has them: every set of fields present is a subclass of its own, so
+    # absent fields of sparse payloads take no memory at all
+    slots = [*entity_cls._instance_attrs, "_extra_fields"]
+    if keep_payload:
+        slots.append("_BaseEntity__original_payload")
+    slots = tuple(dict.fromkeys(slots))
+    # Slots hide class level defaults, so instances get them explicitly
+    defaults = {
+        slot: getattr(entity_cls, slot, None)
+        for slot in slots
+        if hasattr(entity_cls, slot) or slot == "_extra_fields"
+    }
+
+    def __new__(cls, payload: Optional[Dict] = None, *args, **kwargs):
+        if payload is None:
+            # Copies are restored into the class of the original
+            return object.__new__(cls)
+        base = cls.__dict__.get("_shape_base", cls)
+        shapes = base.__dict__.get("_shapes")
+        if shapes is None:
+            shapes = {}
+            type.__setattr__(base, "_shapes", shapes)
+        names = frozenset(base._fields.keys() & payload.keys())
+        shape_cls = shapes.get(names)
+        if shape_cls is None:
+            shape_cls = shapes[names] = _create_compact_shape(base, names)
+        return object.__new__(shape_cls)
+
+    def __init__(self, *args, **kwargs) -> None:
+        for attr, value in defaults.items():
+            setattr(self, attr, value)
+        entity_cls.__init__(self, *args, **kwargs)
+
+    return type(
+        f"Compact{entity_cls.__name__}",
+        (entity_cls,),
+        {
+            "__slots__": slots,
+            "__new__": __new__,
+            "__init__": __init__,
+            "__getattr__": _get_extra_field,
+            "__module__": entity_cls.__module__,
+            "set_fields": _set_fields_compact,
+            "_variant_base": entity_cls,
+            "_entity_mode": const.ENTITY_MODE.COMPACT,
+            "_keep_payload": keep_payload,
+        },
+    )
+
+
+def _create_compact_shape(
+    base: Type[BaseEntity], names: FrozenSet[str]
+) -> Type[BaseEntity]:
+    field_attrs = set(base._field_attrs())
+    slots = tuple(
+        alias
+        for alias in (
+            meta[1] or name
+            for name, meta in base._fields.items()
+            if name in names
+        )
+        if alias in field_attrs
+    )
+    return type(
+        base.__name__,
+        (base,),
+        {
+            "__slots__": slots,
+            "__module__": base.__module__,
+            "__qualname__": base.__qualname__,
+            "_shape_base": base,
+            "_variant_base": base.__dict__.get("_variant_base", base),
+        },
+    )
+
+
+def _set_fields_compact(self: BaseEntity, payload: Dict[str, Any]) -> None:
+    for alias, value in self._iter_field_values(payload):
+        try:
+            setattr(self, alias, value)
+        except AttributeError:
+            # A reloaded payload may bring fields the shape has no slot for
+            if self._extra_fields is None:
+                self._extra_fields = {}
+            self._extra_fields[alias] = value
+
+
+def _get_extra_field(self: BaseEntity, name: str) -> Any:
+    # Only called when there is neither a slot nor a class attribute
+    if name != "_extra_fields":
+        extra_fields = self._extra_fields
+        if extra_fields is not None and name in extra_fields:
+            return extra_fields[name]
+    raise AttributeError(name)
+
+
+class LazyField:
+    __slots__ = ("name", "attr", "default")
+    __missing = object()
+
+    def __init__(self, name: str, attr: str, default: Any = __missing):
+        self.name = name
+        self.attr = attr
+        self.default = default
+
+    def __get__(self, instance: Optional[BaseEntity], owner: Type) -> Any:
+        if instance is None:
+            return self
+        try:
+            return instance._BaseEntity__original_payload[self.name]
+        except KeyError:
+            if self.default is self.__missing:
+                raise AttributeError(self.attr) from None
+            return self.default
+
+
+def _set_fields_lazy(self: BaseEntity, payload: Dict[str, Any]) -> None:
+    missing = self._required_fields.difference(payload)
+    if missing:
+        raise errors.FieldMissingError(
+            f"Required field for {self.__class__.__name__} "
+            f"is missing: {', '.join(sorted(missing))}"
+        )
+    # Values assigned explicitly are shadowed by a reloaded payload
+    if "_BaseEntity__original_payload" in self.__dict__:
+        for attr in self._lazy_attrs:
+            self.__dict__.pop(attr, None)
+
+
+def _create_lazy_variant(
+    entity_cls: Type[BaseEntity], keep_payload: bool
+) -> Type[BaseEntity]:
+    # Descriptors are generated once per class, instances only wrap payload
+    namespace = {
+        "__module__": entity_cls.__module__,
+        "_variant_base": entity_cls,
+        "_entity_mode": const.ENTITY_MODE.LAZY,
+        "_keep_payload": True,
+        "_required_fields": frozenset(
+            name for name, meta in entity_cls._fields.items() if meta[0]
+        ),
+        "_lazy_attrs": tuple(entity_cls._field_attrs()),
+        "set_fields": _set_fields_lazy,
+    }
+    for name, (_, alias) in entity_cls._fields.items():
+        attr = alias or name
+        if attr in namespace["_lazy_attrs"]:
+            if hasattr(entity_cls, attr):
+                namespace[attr] = LazyField(
+                    name, attr, getattr(entity_cls, attr)
+                )
+            else:
+                namespace[attr] = LazyField(name, attr)
+    return type(f"Lazy{entity_cls.__name__}", (entity_cls,), namespace)
+
+
+def _create_default_variant(
+    entity_cls: Type[BaseEntity], keep_payload: bool
+) -> Type[BaseEntity]:
+    # Keeps the name of the entity class, instances get a __dict__
+    return type(
+        entity_cls.__name__,
+        (entity_cls,),
+        {
+            "__module__": entity_cls.__module__,
+            "__qualname__": entity_cls.__qualname__,
+            "_variant_base": entity_cls,
+        },
+    )
+
+
+_ENTITY_VARIANT_FACTORIES = {
+    const.ENTITY_MODE.DEFAULT: _create_default_variant,
+    const.ENTITY_MODE.COMPACT: _create_compact_variant,
+    const.ENTITY_MODE.LAZY: _create_lazy_variant,
+}
+
+
 class Collection(list):
     def __init__(
         self,
@@ -68,12 +379,8 @@ class Collection(list):
         parent_id: Optional[str] = None,
         payload: Optional[Dict] = None,
     ):
-        parent_id_dict = {"__parent_id": parent_id} if parent_id else {}
         super(Collection, self).__init__(
-            [
-                entity_cls({**x, **parent_id_dict}, session)
-                for x in response.body
-            ]
+            [entity_cls(x, session, parent_id) for x in response.body]
         )
         self._session = session
         self._entity_cls = entity_cls
@@ -86,6 +393,24 @@ class Collection(list):
         self._request_method = method
         self._request_payload = payload or {}
 
+    def __aiter__(self) -> AsyncIterator[BaseEntity]:
+        return self.iter_entities()
+
+    @property
+    def has_next(self) -> bool:
+        return False
+
+    async def load_next(self) -> "Collection":
+        raise errors.PaginationProhibitedError("No next page found")
+
+    def iter_pages(self, prefetch: bool = True) -> AsyncIterator["Collection"]:
+        return _iter_pages(self, prefetch)
+
+    def iter_entities(
+        self, prefetch: bool = True
+    ) -> AsyncIterator[BaseEntity]:
+        return _iter_entities(self.iter_pages(prefetch))
+
 
 class PaginatedCollection(Collection):
     def __init__(
@@ -121,12 +446,47 @@ class PaginatedCollection(Collection):
     def total_entities(self) -> int:
         return self._total_entities
 
+    @property
+    def has_next(self) -> bool:
+        return self._page < self._total_pages
+
     async def load_next(self):
         return await self.load_page_num(self._page + 1)
 
     async def load_prev(self):
         return await self.load_page_num(self._page - 1)
 
+    async def load_all(
+        self, concurrency: int = const.PAGINATION_CONCURRENCY_DEFAULT
+    ) -> List["PaginatedCollection"]:
+        # All pages starting from the first one, whichever page this is
+        _check_concurrency(concurrency)
+        semaphore = Semaphore(concurrency)
+
+        async def load(page: int) -> "PaginatedCollection":
+            if page == self._page:
+                return self
+            async with semaphore:
+                return await self._fetch_page(page)
+
+        tasks = [
+            ensure_future(load(page))
+            for page in range(1, max(self._total_pages, self._page) + 1)
+        ]
+        try:
+            return await gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def iter_all(
+        self, concurrency: int = const.PAGINATION_CONCURRENCY_DEFAULT
+    ) -> AsyncIterator["PaginatedCollection"]:
+        # All pages starting from the first one, whichever page this is
+        _check_concurrency(concurrency)
+        return _iter_pages_concurrently(self, concurrency)
+
     async def load_page_num(self, page: int):
         if page < 1 or page > self._total_pages or page == self._page:
             raise errors.PaginationProhibitedError(
@@ -134,18 +494,24 @@ class PaginatedCollection(Collection):
             )
         if self._page >= self.total_pages:
             raise errors.PaginationProhibitedError("No next page found")
+        return await self._fetch_page(page)
+
+    async def _fetch_page(self, page: int) -> "PaginatedCollection":
         response = await self._session.fetch(
             self._endpoint,
             self._request_method,
             params={**self._url_params, "page": page},
             json=self._request_payload,
+            idempotent=True,
         )
-        return self.__class__(
+        return await build_collection(
             response,
             self._session,
             self._entity_cls,
             self._request_method,
+            self._parent_id,
             self._request_payload,
+            self.__class__,
         )
 
 
@@ -171,6 +537,10 @@ class RestrictedPaginatedCollection(Collection):
         self._first_page_url = links.get("first")
         self._next_page_url = links.get("next")
 
+    @property
+    def has_next(self) -> bool:
+        return bool(self._next_page_url)
+
     async def load_first(self):
         if not self._first_page_url:
             raise errors.PaginationProhibitedError("No first page found")
@@ -186,13 +556,16 @@ class RestrictedPaginatedCollection(Collection):
             url,
             self._request_method,
             json=self._request_payload,
+            idempotent=True,
         )
-        return self.__class__(
+        return await build_collection(
             response,
             self._session,
             self._entity_cls,
             self._request_method,
+            self._parent_id,
             self._request_payload,
+            self.__class__,
         )
 
 
@@ -201,6 +574,108 @@ ANY_COLLECTION_TYPE = Union[
 ]
 
 
+async def _iter_pages(
+    page: Collection, prefetch: bool
+) -> AsyncIterator[Collection]:
+    # Only the page being consumed (and the prefetched one) stays referenced
+    while True:
+        next_page: Optional[Future] = None
+        if prefetch and page.has_next:
+            next_page = ensure_future(page.load_next())
+        try:
+            yield page
+        except BaseException:
+            if next_page is not None:
+                next_page.cancel()
+            raise
+
+        if next_page is not None:
+            page = await next_page
+        elif page.has_next:
+            page = await page.load_next()
+        else:
+            return
+
+
+async def _iter_pages_concurrently(
+    collection: PaginatedCollection, concurrency: int
+) -> AsyncIterator[PaginatedCollection]:
+    # Sliding window: at most `concurrency` pages are in flight or buffered,
+    # and they are yielded strictly in page order
+    pending: Deque[Future] = deque()
+    page, last_page = 1, max(collection.total_pages, collection.page)
+    try:
+        while pending or page <= last_page:
+            while page <= last_page and len(pending) < concurrency:
+                if page == collection.page:
+                    # Already loaded page takes its place in the order
+                    loaded: Future = get_running_loop().create_future()
+                    loaded.set_result(collection)
+                    pending.append(loaded)
+                else:
+                    pending.append(ensure_future(collection._fetch_page(page)))
+                page += 1
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be positive, got {concurrency}")
+
+
+async def _iter_entities(
+    pages: AsyncIterator[Collection],
+) -> AsyncIterator[BaseEntity]:
+    async for page in pages:
+        for entity in page:
+            yield entity
+
+
+async def _stream_entities(
+    session: HttpSession,
+    endpoint: str,
+    method: str,
+    entity_cls: Type[BaseEntity],
+    params: Optional[Dict] = None,
+    payload: Optional[Dict] = None,
+    parent_id: Optional[str] = None,
+) -> AsyncIterator[BaseEntity]:
+    # Pages are parsed item by item as they arrive and never materialized
+    params = {**(params or {})}
+    url = None
+    while True:
+        if url is None:
+            response = await session.fetch(
+                endpoint,
+                method,
+                params=params,
+                json=payload,
+                idempotent=True,
+                stream=True,
+            )
+        else:
+            response = await session.request(
+                url, method, json=payload, idempotent=True, stream=True
+            )
+        try:
+            async for item in response.body:
+                yield entity_cls(item, session, parent_id)
+        finally:
+            await response.body.aclose()
+
+        page = int(params.get("page", 1))
+        links = session.serialize_headers_links(response.headers)
+        if page < int(response.headers.get("X-Total-Pages", 0)):
+            params["page"] = page + 1
+        elif links.get("next"):
+            url = links["next"]
+        else:
+            return
+
+
 def create_collection(
     response: HttpResponse,
     session: HttpSession,
@@ -232,7 +707,30 @@ def create_collection(
         )
 
 
+async def build_collection(
+    response: HttpResponse,
+    session: HttpSession,
+    entity_cls: Type[BaseEntity],
+    method: str,
+    parent_id: Optional[str] = None,
+    payload: Optional[Dict] = None,
+    collection_cls: Optional[Type[Collection]] = None,
+) -> ANY_COLLECTION_TYPE:
+    factory = collection_cls or create_collection
+    args = (response, session, entity_cls, method, parent_id, payload)
+    offload = session.offload
+    if (
+        offload is None
+        or not offload.builds_entities
+        or not offload.should_offload(response.size)
+    ):
+        return factory(*args)
+    # Entities of a big page are constructed off the event loop
+    return await offload.run(factory, *args)
+
+
 class Link(BaseEntity):
+    __slots__ = ()
     _fields = {
         "self": (True, "self_url"),
         "id": (True, None),
@@ -256,6 +754,7 @@ class Link(BaseEntity):
 
 
 class Priority(BaseEntity):
+    __slots__ = ()
     _fields = {
         "self": (True, "self_url"),
         "id": (True, None),
@@ -275,13 +774,13 @@ class Priority(BaseEntity):
 
 
 class Transition(BaseEntity):
+    __slots__ = ()
     _fields = {
         "self": (True, "self_url"),
         "id": (True, None),
         "display": (True, None),
         "to": (False, None),
     }
-    __parent_id = None
     id = None
 
     def __repr__(self):
@@ -294,24 +793,25 @@ class Transition(BaseEntity):
         self, payload: Optional[Dict] = None, comment: Optional[str] = None
     ) -> ANY_COLLECTION_TYPE:
         endpoint = const.TRANSITIONS_EXEC_URL.format(
-            id=self.__parent_id, transition_id=self.id
+            id=self._parent_id, transition_id=self.id
         )
-        payload = payload or {}
+        payload = {**(payload or {})}
         if comment:
             payload["comment"] = comment
 
-        response = await self._session.fetch(endpoint, "post", payload)
+        response = await self._session.fetch(endpoint, "post", json=payload)
         return create_collection(
             response,
             self._session,
-            Transition,
+            self.__class__,
             "post",
-            self.__parent_id,
+            self._parent_id,
             payload,
         )
 
 
 class IssueChangelog(BaseEntity):
+    __slots__ = ()
     _fields = {
         "self": (True, "self_url"),
         "type": (True, None),
@@ -332,6 +832,7 @@ class IssueChangelog(BaseEntity):
 
 
 class Issue(BaseEntity):
+    __slots__ = ()
     _fields = {
         "self": (True, "self_url"),
         "id": (True, None),
@@ -362,7 +863,10 @@ class Issue(BaseEntity):
         "version": (False, None),
         "votes": (False, None),
     }
+    _instance_attrs = (*BaseEntity._instance_attrs, "etag", "last_modified")
     key = None
+    etag = None
+    last_modified = None
 
     def __repr__(self):
         return f"{self.__class__.__name__} <{self.key}>"
@@ -370,38 +874,100 @@ class Issue(BaseEntity):
     def __str__(self):
         return self.key
 
-    async def reload(self) -> Union["Issue", bool]:
+    def set_validators(self, headers: types.HEADERS_OBJECT) -> None:
+        self.etag = headers.get("ETag", self.etag)
+        self.last_modified = headers.get("Last-Modified", self.last_modified)
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    async def reload(
+        self,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> Union["Issue", bool]:
         if not self.key:
             return False
         endpoint = const.ISSUES_DIRECT_URL.format(id=self.key)
-        data = await self._session.fetch(endpoint, "get")
-        self.original_payload = data.body
+        data = await self._session.fetch(
+            endpoint,
+            "get",
+            headers=self.conditional_headers,
+            timeout=timeout,
+            deadline=deadline,
+        )
+        self.set_validators(data.headers)
+        if data.status == HTTPStatus.NOT_MODIFIED:
+            return self
+
+        # Same version means the issue has not changed since the last load
+        version = self.original_payload.get("version")
+        if version is None or data.body.get("version") != version:
+            self.original_payload = data.body
+        return self
 
-    async def links(self) -> ANY_COLLECTION_TYPE:
+    async def links(
+        self,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> ANY_COLLECTION_TYPE:
         endpoint = const.LINKS_URL.format(id=self.key)
-        response = await self._session.fetch(endpoint, "get")
+        response = await self._session.fetch(
+            endpoint, "get", timeout=timeout, deadline=deadline
+        )
         return create_collection(
-            response, self._session, Link, "get", self.key
+            response, self._session, self._variant_of(Link), "get", self.key
         )
 
-    async def add_link(self, relation_type: str, issue: str) -> Link:
+    async def add_link(
+        self,
+        relation_type: str,
+        issue: str,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> Link:
         endpoint = const.LINKS_URL.format(id=self.key)
         payload = {
             "relationship": relation_type,
             "issue": issue,
         }
-        response = await self._session.fetch(endpoint, "post", json=payload)
-        return Link(response.body, self._session)
+        response = await self._session.fetch(
+            endpoint, "post", json=payload, timeout=timeout, deadline=deadline
+        )
+        return self._variant_of(Link)(response.body, self._session)
 
-    async def delete_link(self, link_id: int) -> None:
+    async def delete_link(
+        self,
+        link_id: int,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
         endpoint = const.LINKS_DIRECT_URL.format(id=self.key, link_id=link_id)
-        await self._session.fetch(endpoint, "delete")
+        await self._session.fetch(
+            endpoint, "delete", timeout=timeout, deadline=deadline
+        )
 
-    async def transitions(self) -> ANY_COLLECTION_TYPE:
+    async def transitions(
+        self,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> ANY_COLLECTION_TYPE:
         endpoint = const.TRANSITIONS_URL.format(id=self.key)
-        response = await self._session.fetch(endpoint, "get")
+        response = await self._session.fetch(
+            endpoint, "get", timeout=timeout, deadline=deadline
+        )
         return create_collection(
-            response, self._session, Transition, "get", self.key
+            response,
+            self._session,
+            self._variant_of(Transition),
+            "get",
+            self.key,
         )
 
     async def apply_transition(
@@ -409,101 +975,564 @@ class Issue(BaseEntity):
         transition_id: str,
         payload: Optional[Dict] = None,
         comment: Optional[str] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
     ) -> ANY_COLLECTION_TYPE:
         endpoint = const.TRANSITIONS_EXEC_URL.format(
             id=self.key, transition_id=transition_id
         )
-        payload = payload or {}
+        payload = {**(payload or {})}
         if comment:
             payload["comment"] = comment
 
-        response = await self._session.fetch("post", endpoint, json=payload)
+        response = await self._session.fetch(
+            endpoint, "post", json=payload, timeout=timeout, deadline=deadline
+        )
         return create_collection(
-            response, self._session, Transition, "post", self.key, payload
+            response,
+            self._session,
+            self._variant_of(Transition),
+            "post",
+            self.key,
+            payload,
         )
 
     async def changelog(
-        self, params: Optional[Dict] = None
+        self,
+        params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
     ) -> ANY_COLLECTION_TYPE:
         endpoint = const.CHANGELOG_URL.format(id=self.key)
         response = await self._session.fetch(
-            endpoint, "get", params=params or {}
+            endpoint,
+            "get",
+            params=params or {},
+            timeout=timeout,
+            deadline=deadline,
         )
-        return create_collection(
-            response, self._session, IssueChangelog, "get", self.key
+        return await build_collection(
+            response,
+            self._session,
+            self._variant_of(IssueChangelog),
+            "get",
+            self.key,
         )
 
 
 class Priorities:
     __single_entity_cls = Priority
 
-    def __init__(self, session: HttpSession):
+    def __init__(
+        self,
+        session: HttpSession,
+        entity_mode: Union[str, const.ENTITY_MODE] = const.ENTITY_MODE.DEFAULT,
+        keep_payload: bool = True,
+    ):
         self.__session = session
+        self.__entity_cls = self.__single_entity_cls.variant(
+            entity_mode, keep_payload
+        )
 
-    async def get(self, params: Optional[Dict] = None) -> ANY_COLLECTION_TYPE:
+    async def get(
+        self,
+        params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> ANY_COLLECTION_TYPE:
         endpoint = const.PRIORITIES_URL
-        response = await self.__session.request(
-            "get", endpoint, params=params or {}
+        response = await self.__session.fetch(
+            endpoint,
+            "get",
+            params=params or {},
+            timeout=timeout,
+            deadline=deadline,
+        )
+        return create_collection(
+            response, self.__session, self.__entity_cls, "get"
         )
-        return create_collection(response, self.__session, Priority, "get")
 
 
 class Issues:
     __single_entity_cls = Issue
 
-    def __init__(self, session: HttpSession):
+    def __init__(
+        self,
+        session: HttpSession,
+        entity_mode: Union[str, const.ENTITY_MODE] = const.ENTITY_MODE.DEFAULT,
+        keep_payload: bool = True,
+    ):
         self.__session = session
+        self.__entity_cls = self.__single_entity_cls.variant(
+            entity_mode, keep_payload
+        )
+
+    @property
+    def session(self) -> HttpSession:
+        return self.__session
+
+    def from_payload(self, payload: Dict[str, Any]) -> Issue:
+        return self.__entity_cls(payload, self.__session)
+
+    def __build_issue(
+        self, response: HttpResponse, entity_cls: Optional[Type[Issue]] = None
+    ) -> Issue:
+        issue = (entity_cls or self.__entity_cls)(
+            response.body, self.__session
+        )
+        issue.set_validators(response.headers)
+        return issue
+
+    def __project(
+        self, params: Optional[Dict], fields: Optional[Iterable[str]]
+    ) -> Tuple[Dict, Type[Issue]]:
+        if not fields:
+            return params or {}, self.__entity_cls
+        fields = list(dict.fromkeys(fields))
+        return (
+            {**(params or {}), "fields": ",".join(fields)},
+            self.__entity_cls._variant_of(
+                self.__single_entity_cls.projected(fields)
+            ),
+        )
 
     async def get(
-        self, entity_id: str, params: Optional[Dict] = None
+        self,
+        entity_id: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> Issue:
         endpoint = const.ISSUES_DIRECT_URL.format(id=entity_id)
+        params, entity_cls = self.__project(params, fields)
         response = await self.__session.fetch(
-            endpoint, "get", params=params or {}
+            endpoint,
+            "get",
+            params=params,
+            timeout=timeout,
+            deadline=deadline,
         )
-        return Issue(response.body, self.__session)
+        return self.__build_issue(response, entity_cls)
+
+    async def get_many(
+        self,
+        keys: Iterable[str],
+        batch_size: int = const.BULK_BATCH_SIZE_DEFAULT,
+        concurrency: int = const.BULK_CONCURRENCY_DEFAULT,
+        params: Optional[Dict] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> BulkResult:
+        keys = list(dict.fromkeys(keys))
+        if fields:
+            # Found issues are matched to the requested keys by these
+            fields = [*fields, "key", "aliases"]
+        batches = [
+            keys[pos : pos + batch_size]  # noqa E203
+            for pos in range(0, len(keys), batch_size)
+        ]
+        result = BulkResult()
+        # Searches and their one by one fallbacks share the limit, so no
+        # more than `concurrency` requests are in flight at any time
+        semaphore = Semaphore(concurrency)
+
+        async def get_batch(batch: List[str]) -> Dict[str, Issue]:
+            try:
+                async with semaphore:
+                    return await self.__search_keys(batch, params, fields)
+            except (errors.ApiBadRequestError, errors.IncorrectDataError):
+                # Search by keys is not possible, load issues one by one
+                return await self.__get_keys(
+                    batch, semaphore, concurrency, params, fields
+                )
 
-    async def transitions(self, entity_id: str) -> ANY_COLLECTION_TYPE:
+        async for batch, found, exc in iter_bounded(
+            get_batch, batches, concurrency
+        ):
+            for key in batch:
+                if exc is not None:
+                    result.add(key, None, exc)
+                elif isinstance(found.get(key), BaseException):
+                    result.add(key, None, found[key])
+                elif key in found:
+                    result.add(key, found[key])
+                else:
+                    result.missing.append(key)
+        return result
+
+    async def __search_keys(
+        self,
+        keys: List[str],
+        params: Optional[Dict] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Issue]:
+        found = {}
+        collection = await self.search(
+            {"keys": keys},
+            {**(params or {}), "perPage": len(keys)},
+            fields=fields,
+        )
+        async for issue in collection:
+            # Moved issues are found by their old keys as well
+            for key in [issue.key, *(getattr(issue, "aliases", None) or [])]:
+                found[key] = issue
+        return found
+
+    async def __get_keys(
+        self,
+        keys: List[str],
+        semaphore: Semaphore,
+        concurrency: int,
+        params: Optional[Dict] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Union[Issue, BaseException]]:
+        found = {}
+
+        async def get(key: str) -> Issue:
+            async with semaphore:
+                return await self.get(key, params, fields=fields)
+
+        async for key, issue, exc in iter_bounded(get, keys, concurrency):
+            if exc is None:
+                found[key] = issue
+            elif not isinstance(exc, errors.NotFoundError):
+                found[key] = exc
+        return found
+
+    async def transitions(
+        self,
+        entity_id: str,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> ANY_COLLECTION_TYPE:
         endpoint = const.TRANSITIONS_URL.format(id=entity_id)
-        response = await self.__session.fetch(endpoint, "get")
+        response = await self.__session.fetch(
+            endpoint, "get", timeout=timeout, deadline=deadline
+        )
         return create_collection(
-            response, self.__session, Transition, "get", entity_id
+            response,
+            self.__session,
+            self.__entity_cls._variant_of(Transition),
+            "get",
+            entity_id,
+        )
+
+    async def changelog(
+        self,
+        entity_id: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> ANY_COLLECTION_TYPE:
+        endpoint = const.CHANGELOG_URL.format(id=entity_id)
+        response = await self.__session.fetch(
+            endpoint,
+            "get",
+            params=params or {},
+            timeout=timeout,
+            deadline=deadline,
+        )
+        return await build_collection(
+            response,
+            self.__session,
+            self.__entity_cls._variant_of(IssueChangelog),
+            "get",
+            entity_id,
+        )
+
+    async def iter_changelog(
+        self,
+        entity_id: str,
+        cursor: Optional[BaseStore] = None,
+        per_page: int = const.CHANGELOG_PER_PAGE_DEFAULT,
+        params: Optional[Dict] = None,
+    ) -> AsyncIterator[IssueChangelog]:
+        pages = (
+            await self.__changelog_after(entity_id, cursor, per_page, params)
+        ).iter_pages()
+        async for page in pages:
+            for entry in page:
+                yield entry
+            # One cursor write per page: entries of a page left unfinished
+            # are delivered again on the next run
+            if cursor is not None and page:
+                cursor.set(entity_id, page[-1].id)
+
+    async def __changelog_after(
+        self,
+        entity_id: str,
+        cursor: Optional[BaseStore],
+        per_page: int,
+        params: Optional[Dict] = None,
+    ) -> ANY_COLLECTION_TYPE:
+        # Cursor keeps the id of the last consumed entry per issue, so only
+        # entries which appeared after it are fetched
+        params = {**(params or {}), "perPage": per_page}
+        last_id = cursor.get(entity_id) if cursor is not None else None
+        if last_id is not None:
+            params["id"] = last_id
+        return await self.changelog(entity_id, params)
+
+    async def sync_changelogs(
+        self,
+        entity_ids: Iterable[str],
+        cursor: BaseStore,
+        per_page: int = const.CHANGELOG_PER_PAGE_DEFAULT,
+        concurrency: int = const.BULK_CONCURRENCY_DEFAULT,
+    ) -> AsyncIterator[
+        Tuple[str, Optional[List[IssueChangelog]], Optional[BaseException]]
+    ]:
+        async def load_new(entity_id: str) -> List[IssueChangelog]:
+            collection = await self.__changelog_after(
+                entity_id, cursor, per_page
+            )
+            return [entry async for entry in collection.iter_entities()]
+
+        async for entity_id, entries, exc in iter_bounded(
+            load_new, entity_ids, concurrency
+        ):
+            yield entity_id, entries, exc
+            # Cursor moves only when the consumer is done with the entries
+            if entries:
+                cursor.set(entity_id, entries[-1].id)
+
+    async def create(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> Issue:
+        return await self.__post_unique(
+            const.ISSUES_URL, payload, timeout, deadline
+        )
+
+    async def import_issue(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> Issue:
+        return await self.__post_unique(
+            const.ISSUES_IMPORT_URL, payload, timeout, deadline
         )
 
-    async def create(self, payload: Dict[str, Any]) -> Issue:
-        endpoint = const.ISSUES_URL
-        payload.setdefault("unique", uuid.uuid4().hex)
-        response = await self.__session.fetch(endpoint, "post", json=payload)
-        return Issue(response.body, self.__session)
+    async def __post_unique(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout: Optional[types.REQUEST_TIMEOUT],
+        deadline: Optional[float],
+    ) -> Issue:
+        generated = "unique" not in payload
+        # "unique" makes the server deduplicate repeated creation requests.
+        # The caller's payload is left intact, so it may be reused
+        payload = dict(payload)
+        if generated:
+            payload["unique"] = uuid.uuid4().hex
+        try:
+            response = await self.__session.fetch(
+                endpoint,
+                "post",
+                json=payload,
+                idempotent=True,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        except errors.ConflictError:
+            # A generated key conflicts only with an earlier attempt of this
+            # call, which was processed although its response was lost
+            if not generated:
+                raise
+            issue = await self.__find_unique(payload["unique"])
+            if issue is None:
+                raise
+            return issue
+        return self.__build_issue(response)
+
+    async def __find_unique(self, unique: str) -> Optional[Issue]:
+        collection = await self.search({"filter": {"unique": unique}})
+        return collection[0] if collection else None
+
+    async def import_stream(
+        self,
+        source: Union[str, Iterable[Dict], AsyncIterable[Dict]],
+        concurrency: int = const.BULK_CONCURRENCY_DEFAULT,
+        checkpoint: Optional[BaseStore] = None,
+        source_id: Optional[str] = None,
+        id_field: Optional[str] = None,
+    ) -> AsyncIterator[BULK_ITEM_RESULT]:
+        # Records without "unique" get a key of their place in the source:
+        # the id_field value or the record number, plus the source id.
+        # Identical records therefore stay distinct issues
+        if isinstance(source, str):
+            source_id = source_id or os.path.abspath(source)
+            source = read_jsonl(source)
+
+        async def pending_payloads() -> AsyncIterator[Dict]:
+            position = 0
+            async for payload in as_async_iterator(source):
+                position += 1
+                if "unique" not in payload:
+                    if source_id is None:
+                        raise ValueError(
+                            "source_id is required for records without "
+                            "a 'unique' key"
+                        )
+                    payload = {
+                        **payload,
+                        "unique": make_unique_key(
+                            source_id,
+                            payload[id_field] if id_field else position,
+                        ),
+                    }
+                if checkpoint is None or payload["unique"] not in checkpoint:
+                    yield payload
+
+        async def import_payload(payload: Dict) -> Optional[Issue]:
+            try:
+                issue = await self.import_issue(payload)
+            except errors.ConflictError:
+                # Issue with the same "unique" key was already imported
+                issue = None
+            if checkpoint is not None:
+                checkpoint.set(payload["unique"], issue.key if issue else True)
+            return issue
+
+        async for payload, issue, exc in iter_bounded(
+            import_payload, pending_payloads(), concurrency
+        ):
+            yield payload["unique"], issue, exc
 
     async def edit(
         self,
         entity_id: str,
         payload: Dict[str, Any],
         params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
     ) -> Issue:
         endpoint = const.ISSUES_DIRECT_URL.format(id=entity_id)
         response = await self.__session.fetch(
-            endpoint, "patch", params=params or {}, json=payload
+            endpoint,
+            "patch",
+            params=params or {},
+            json=payload,
+            timeout=timeout,
+            deadline=deadline,
         )
-        return Issue(response.body, self.__session)
+        return self.__build_issue(response)
 
     async def move(
-        self, entity_id: str, queue: str, params: Optional[Dict] = None
+        self,
+        entity_id: str,
+        queue: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
     ) -> Issue:
         endpoint = const.ISSUES_MOVE_URL.format(id=entity_id)
-        params = params or {}
-        params["queue"] = queue
+        params = {**(params or {}), "queue": queue}
         response = await self.__session.fetch(
-            endpoint, "post", params=params or {}
+            endpoint,
+            "post",
+            params=params,
+            timeout=timeout,
+            deadline=deadline,
         )
-        return Issue(response.body, self.__session)
+        return self.__build_issue(response)
+
+    async def apply_transition(
+        self,
+        entity_id: str,
+        transition_id: str,
+        payload: Optional[Dict] = None,
+        comment: Optional[str] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> ANY_COLLECTION_TYPE:
+        endpoint = const.TRANSITIONS_EXEC_URL.format(
+            id=entity_id, transition_id=transition_id
+        )
+        payload = {**(payload or {})}
+        if comment:
+            payload["comment"] = comment
+
+        response = await self.__session.fetch(
+            endpoint, "post", json=payload, timeout=timeout, deadline=deadline
+        )
+        return create_collection(
+            response,
+            self.__session,
+            self.__entity_cls._variant_of(Transition),
+            "post",
+            entity_id,
+            payload,
+        )
+
+    async def edit_many(
+        self,
+        changes: Union[Dict[str, Dict], Iterable[Tuple[str, Dict]]],
+        params: Optional[Dict] = None,
+        concurrency: int = const.BULK_CONCURRENCY_DEFAULT,
+    ) -> BulkResult:
+        items = changes.items() if isinstance(changes, dict) else changes
+        return await self.__run_many(
+            lambda item: self.edit(item[0], item[1], params),
+            items,
+            concurrency,
+            key=lambda item: item[0],
+        )
+
+    async def move_many(
+        self,
+        entity_ids: Iterable[str],
+        queue: str,
+        params: Optional[Dict] = None,
+        concurrency: int = const.BULK_CONCURRENCY_DEFAULT,
+    ) -> BulkResult:
+        return await self.__run_many(
+            lambda entity_id: self.move(entity_id, queue, {**(params or {})}),
+            entity_ids,
+            concurrency,
+        )
+
+    async def transition_many(
+        self,
+        entity_ids: Iterable[str],
+        transition_id: str,
+        payload: Optional[Dict] = None,
+        comment: Optional[str] = None,
+        concurrency: int = const.BULK_CONCURRENCY_DEFAULT,
+    ) -> BulkResult:
+        return await self.__run_many(
+            lambda entity_id: self.apply_transition(
+                entity_id, transition_id, payload, comment
+            ),
+            entity_ids,
+            concurrency,
+        )
+
+    @staticmethod
+    async def __run_many(
+        func: Callable[[Any], Awaitable],
+        items: Iterable,
+        concurrency: int,
+        key: Callable[[Any], str] = lambda item: item,
+    ) -> BulkResult:
+        # Every item is applied independently: a failure is reported in
+        # the result and does not stop the rest of the batch
+        result = BulkResult()
+        async for item, value, exc in iter_bounded(func, items, concurrency):
+            result.add(key(item), value, exc)
+        return result
 
     async def count(
         self,
         filter_params: Optional[Dict] = None,
         search_query: Optional[str] = None,
         params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
     ) -> Union[Dict, int]:
         endpoint = const.ISSUES_COUNT_URL.format()
         payload = {}
@@ -513,7 +1542,13 @@ class Issues:
             payload["query"] = search_query
 
         response = await self.__session.fetch(
-            endpoint, "post", params=params or {}, json=payload
+            endpoint,
+            "post",
+            params=params or {},
+            json=payload,
+            idempotent=True,
+            timeout=timeout,
+            deadline=deadline,
         )
         return response.body
 
@@ -521,12 +1556,57 @@ class Issues:
         self,
         search_request: Optional[Dict] = None,
         params: Optional[Dict] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> ANY_COLLECTION_TYPE:
         endpoint = const.ISSUES_SEARCH_URL.format()
         payload = search_request or {}
+        # Next pages keep the "fields" param of the first one
+        params, entity_cls = self.__project(params, fields)
         response = await self.__session.fetch(
-            endpoint, "post", params=params or {}, json=payload
+            endpoint,
+            "post",
+            params=params,
+            json=payload,
+            idempotent=True,
+            timeout=timeout,
+            deadline=deadline,
         )
-        return create_collection(
-            response, self.__session, Issue, "post", payload
+        return await build_collection(
+            response,
+            self.__session,
+            entity_cls,
+            "post",
+            payload=payload,
         )
+
+    async def iter_search(
+        self,
+        search_request: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        prefetch: bool = True,
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[Issue]:
+        if stream:
+            params, entity_cls = self.__project(params, fields)
+            # Memory depends on a single issue rather than on perPage
+            async for issue in _stream_entities(
+                self.__session,
+                const.ISSUES_SEARCH_URL,
+                "post",
+                entity_cls,
+                params,
+                search_request or {},
+            ):
+                yield issue
+            return
+
+        # The first page is not kept in a local, so that it is released
+        # as soon as the iteration moves past it
+        pages = (
+            await self.search(search_request, params, fields=fields)
+        ).iter_pages(prefetch)
+        async for issue in _iter_entities(pages):
+            yield issue
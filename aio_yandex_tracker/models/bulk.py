@@ -0,0 +1,118 @@
+import json
+from asyncio import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    ensure_future,
+    wait,
+)
+from hashlib import sha1
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from aio_yandex_tracker.serialization import JsonCodec, get_default_codec
+
+# Errors which must never be swallowed into a bulk report
+NOT_ISOLATED_ERRORS = (CancelledError, KeyboardInterrupt, SystemExit)
+BULK_ITEM_RESULT = Tuple[Any, Any, Optional[BaseException]]
+
+
+class BulkResult(dict):
+    def __init__(self):
+        super(BulkResult, self).__init__()
+        self.errors: Dict[Any, BaseException] = {}
+        self.missing: List[Any] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.missing
+
+    def add(
+        self, key: Any, result: Any, exc: Optional[BaseException] = None
+    ) -> None:
+        if exc is None:
+            self[key] = result
+        else:
+            self.errors[key] = exc
+
+
+async def as_async_iterator(
+    items: Union[Iterable, AsyncIterable]
+) -> AsyncIterator:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _call_isolated(
+    func: Callable[[Any], Awaitable], item: Any
+) -> BULK_ITEM_RESULT:
+    try:
+        return item, await func(item), None
+    except NOT_ISOLATED_ERRORS:
+        raise
+    except BaseException as exc:
+        return item, None, exc
+
+
+async def iter_bounded(
+    func: Callable[[Any], Awaitable],
+    items: Union[Iterable, AsyncIterable],
+    concurrency: int,
+) -> AsyncIterator[BULK_ITEM_RESULT]:
+    # Items are pulled lazily, so neither the source nor the results
+    # have to fit into memory; results are yielded as they complete
+    source = as_async_iterator(items)
+    pending: Set[Future] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(ensure_future(_call_isolated(func, item)))
+            if not pending:
+                return
+            done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await source.aclose()
+
+
+def make_unique_key(source_id: str, record_id: Union[int, str]) -> str:
+    # Stable across runs, so a restarted import sends the same keys.
+    # Built from where the record comes from, not from its content
+    return sha1(
+        json.dumps([source_id, record_id], ensure_ascii=False).encode()
+    ).hexdigest()
+
+
+async def read_jsonl(
+    path: str, codec: Optional[JsonCodec] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    codec = codec or get_default_codec()
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield codec.loads(line)
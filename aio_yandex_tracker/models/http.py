@@ -1,4 +1,5 @@
-from typing import Dict, List, Union
+from copy import deepcopy
+from typing import Dict, List, Optional, Union
 
 from aio_yandex_tracker import types
 from yarl import URL
@@ -14,9 +15,29 @@ class HttpResponse:
         url: URL,
         headers: types.HEADERS_OBJECT,
         body: Union[Dict, List, int],
+        size: int = 0,
+        compressed_size: Optional[int] = None,
     ):
         self.status = status
         self.reason = reason
         self.headers = headers
         self.url = url
         self.body = body
+        # Size of the decompressed response body in bytes
+        self.size = size
+        # Size of the body as it was transferred
+        self.compressed_size = (
+            size if compressed_size is None else compressed_size
+        )
+
+    def copy(self) -> "HttpResponse":
+        # Entities keep the body, so every consumer gets its own one
+        return HttpResponse(
+            self.status,
+            self.reason,
+            self.url,
+            self.headers,
+            deepcopy(self.body),
+            self.size,
+            self.compressed_size,
+        )
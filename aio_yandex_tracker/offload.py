@@ -0,0 +1,34 @@
+from asyncio import get_running_loop
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from aio_yandex_tracker import const
+
+
+class Offloader:
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        threshold: int = const.OFFLOAD_THRESHOLD_DEFAULT,
+    ):
+        # None stands for the default thread pool of the event loop
+        self.executor = executor
+        # Response body size in bytes starting from which work is offloaded
+        self.threshold = threshold
+        self.offloaded = 0
+
+    @property
+    def builds_entities(self) -> bool:
+        # Entities reference the session and cannot leave the process,
+        # so a process pool only returns plain decoded bodies
+        return not isinstance(self.executor, ProcessPoolExecutor)
+
+    def should_offload(self, size: int) -> bool:
+        return size >= self.threshold
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        self.offloaded += 1
+        return await get_running_loop().run_in_executor(
+            self.executor, partial(func, *args)
+        )
@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from time import monotonic
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.cache import ResponseCache
+from aio_yandex_tracker.instrumentation import create_trace_config
+from aio_yandex_tracker.limiter import RateLimiter
+from aio_yandex_tracker.session import create_connector
+from aio_yandex_tracker.tracker import YandexTracker
+from aiohttp import ClientSession, TCPConnector
+
+
+class _Tenant:
+    __slots__ = ("token", "tracker", "used_at")
+
+    def __init__(self, token: str, tracker: YandexTracker):
+        self.token = token
+        self.tracker = tracker
+        self.used_at = monotonic()
+
+
+class TrackerPool:
+    def __init__(
+        self,
+        max_tenants: int = const.POOL_MAX_TENANTS_DEFAULT,
+        idle_timeout: Optional[float] = const.POOL_IDLE_TIMEOUT_DEFAULT,
+        rate_limiter_factory: Optional[
+            Callable[[], RateLimiter]
+        ] = RateLimiter,
+        max_rate_limiters: int = const.POOL_MAX_RATE_LIMITERS_DEFAULT,
+        cache_factory: Optional[Callable[[], ResponseCache]] = None,
+        connector: Optional[TCPConnector] = None,
+        connector_options: Optional[Dict[str, Any]] = None,
+        **tracker_options,
+    ):
+        self.max_tenants = max_tenants
+        # Tenants unused for this many seconds are evicted, None keeps them
+        # until max_tenants is reached
+        self.idle_timeout = idle_timeout
+        self.rate_limiter_factory = rate_limiter_factory
+        self.max_rate_limiters = max_rate_limiters
+        # Cache keys hold neither org nor token, so a cache shared by
+        # tenants would serve one organization's data to another
+        if "cache" in tracker_options:
+            raise TypeError("Use cache_factory to give tenants a cache")
+        self.cache_factory = cache_factory
+        # Options of every tenant's YandexTracker, e.g. retry_policy.
+        # coalesce_requests is safe, every tracker coalesces on its own
+        self.tracker_options = tracker_options
+        self.evicted = 0
+        self.__connector = connector
+        self.__connector_options = connector_options
+        self.__session: Optional[ClientSession] = None
+        # Least recently used tenants first
+        self.__tenants: "OrderedDict[str, _Tenant]" = OrderedDict()
+        # Limiters outlive evicted trackers, so a throttled tenant stays
+        # throttled when it comes back. Least recently used first as well
+        self.__rate_limiters: "OrderedDict[str, RateLimiter]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__tenants)
+
+    def __contains__(self, org_id: Union[int, str]) -> bool:
+        return str(org_id) in self.__tenants
+
+    @property
+    def is_closed(self) -> bool:
+        return self.__session is not None and self.__session.closed
+
+    def get(self, org_id: Union[int, str], token: str) -> YandexTracker:
+        org_id = str(org_id)
+        self.evict_idle()
+        tenant = self.__tenants.get(org_id)
+        rate_limiter = self.__get_rate_limiter(org_id)
+        # A rotated token gets a new tracker, the rate limiter is kept
+        if tenant is None or tenant.token != token:
+            tenant = _Tenant(
+                token, self.__create_tracker(org_id, token, rate_limiter)
+            )
+            self.__tenants[org_id] = tenant
+            while len(self.__tenants) > self.max_tenants:
+                self.__tenants.popitem(last=False)
+                self.evicted += 1
+        tenant.used_at = monotonic()
+        self.__tenants.move_to_end(org_id)
+        return tenant.tracker
+
+    def get_rate_limiter(
+        self, org_id: Union[int, str]
+    ) -> Optional[RateLimiter]:
+        return self.__rate_limiters.get(str(org_id))
+
+    def evict(self, org_id: Union[int, str]) -> bool:
+        if self.__tenants.pop(str(org_id), None) is None:
+            return False
+        self.evicted += 1
+        return True
+
+    def evict_idle(self) -> int:
+        if self.idle_timeout is None:
+            return 0
+        expired_at = monotonic() - self.idle_timeout
+        evicted = 0
+        # Tenants are ordered by use, so the scan stops at the first fresh
+        while self.__tenants:
+            tenant = next(iter(self.__tenants.values()))
+            if tenant.used_at > expired_at:
+                break
+            self.__tenants.popitem(last=False)
+            evicted += 1
+        self.evicted += evicted
+        return evicted
+
+    async def close(self) -> None:
+        # Tenant trackers only borrow the shared session
+        self.__tenants.clear()
+        self.__rate_limiters.clear()
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+
+    def __get_rate_limiter(self, org_id: str) -> Optional[RateLimiter]:
+        if self.rate_limiter_factory is None:
+            return None
+        rate_limiter = self.__rate_limiters.get(org_id)
+        if rate_limiter is None:
+            rate_limiter = self.rate_limiter_factory()
+            self.__rate_limiters[org_id] = rate_limiter
+            while len(self.__rate_limiters) > self.max_rate_limiters:
+                self.__rate_limiters.popitem(last=False)
+        self.__rate_limiters.move_to_end(org_id)
+        return rate_limiter
+
+    def __create_tracker(
+        self, org_id: str, token: str, rate_limiter: Optional[RateLimiter]
+    ) -> YandexTracker:
+        if self.__session is None:
+            self.__session = self.__create_session()
+        elif self.__session.closed:
+            raise RuntimeError("Tracker pool is closed")
+        return YandexTracker(
+            token,
+            org_id,
+            rate_limiter=rate_limiter,
+            cache=self.cache_factory() if self.cache_factory else None,
+            client_session=self.__session,
+            **self.tracker_options,
+        )
+
+    def __create_session(self) -> ClientSession:
+        # Created on the first use, so that it belongs to the running loop
+        connector_owner = self.__connector is None
+        connector = self.__connector or create_connector(
+            **(self.__connector_options or {})
+        )
+        instrumentation = self.tracker_options.get("instrumentation")
+        return ClientSession(
+            connector=connector,
+            connector_owner=connector_owner,
+            auto_decompress=False,
+            trace_configs=[create_trace_config()] if instrumentation else None,
+        )
+
+    async def __aenter__(self) -> "TrackerPool":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
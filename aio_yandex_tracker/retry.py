@@ -0,0 +1,98 @@
+from asyncio import TimeoutError
+from copy import copy
+from random import uniform
+from time import monotonic
+from typing import Any, Iterable, Optional, Tuple, Type
+
+from aio_yandex_tracker import const, types
+from aio_yandex_tracker.limiter import parse_retry_after
+from aiohttp import ClientConnectionError
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        retries: int = const.BACKOFF_RETRIES,
+        base_delay: float = const.BACKOFF_RETRY_INTERVAL,
+        max_delay: float = const.BACKOFF_MAX_DELAY,
+        multiplier: float = const.BACKOFF_MULTIPLIER,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        statuses: Iterable[int] = const.RESPONSE_CODES_RETRY,
+        methods: Iterable[str] = const.HTTP_METHODS_IDEMPOTENT,
+        safe_statuses: Iterable[int] = const.RESPONSE_CODES_RETRY_SAFE,
+        respect_retry_after: bool = True,
+        exceptions: Tuple[Type[BaseException], ...] = (
+            ClientConnectionError,
+            TimeoutError,
+        ),
+    ):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(methods)
+        # Statuses which guarantee that the request was not processed,
+        # so even non-idempotent requests may be repeated
+        self.safe_statuses = frozenset(safe_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.exceptions = exceptions
+
+    def replace(self, **options: Any) -> "RetryPolicy":
+        policy = copy(self)
+        for name, value in options.items():
+            if not hasattr(policy, name):
+                raise TypeError(f"Unknown retry policy option: {name}")
+            setattr(policy, name, value)
+        return policy
+
+    def is_idempotent(
+        self, method: str, idempotent: Optional[bool] = None
+    ) -> bool:
+        if idempotent is not None:
+            return idempotent
+        return method.lower() in self.methods
+
+    def should_retry(
+        self, method: str, status: int, idempotent: Optional[bool] = None
+    ) -> bool:
+        if status in self.safe_statuses:
+            return True
+        return status in self.statuses and self.is_idempotent(
+            method, idempotent
+        )
+
+    def should_retry_error(
+        self,
+        method: str,
+        exc: BaseException,
+        idempotent: Optional[bool] = None,
+    ) -> bool:
+        return isinstance(exc, self.exceptions) and self.is_idempotent(
+            method, idempotent
+        )
+
+    def get_delay(
+        self, attempt: int, headers: Optional[types.HEADERS_OBJECT] = None
+    ) -> float:
+        if self.respect_retry_after and headers:
+            retry_after = parse_retry_after(headers)
+            # A huge or bogus Retry-After must not stall the caller
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+
+        delay = min(
+            self.base_delay * self.multiplier**attempt, self.max_delay
+        )
+        # "Full jitter" spreads retries of many clients across the window
+        return uniform(0, delay) if self.jitter else delay
+
+    def allows(self, attempt: int, started_at: float, delay: float) -> bool:
+        if attempt >= self.retries:
+            return False
+        if self.deadline is None:
+            return True
+        return monotonic() - started_at + delay < self.deadline
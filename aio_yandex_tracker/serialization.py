@@ -0,0 +1,68 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+class JsonCodec:
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+    def loads(self, value: Union[bytes, str]) -> Any:
+        return json.loads(value)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, value: Union[bytes, str]) -> Any:
+        return orjson.loads(value)
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("ujson is not installed")
+
+    def dumps(self, value: Any) -> bytes:
+        return ujson.dumps(value, ensure_ascii=False).encode()
+
+    def loads(self, value: Union[bytes, str]) -> Any:
+        return ujson.loads(value)
+
+
+_DEFAULT_CODEC: Optional[JsonCodec] = None
+
+
+def get_default_codec() -> JsonCodec:
+    # The fastest installed library wins
+    global _DEFAULT_CODEC
+    if _DEFAULT_CODEC is None:
+        if orjson is not None:
+            _DEFAULT_CODEC = OrjsonCodec()
+        elif ujson is not None:
+            _DEFAULT_CODEC = UjsonCodec()
+        else:
+            _DEFAULT_CODEC = JsonCodec()
+    return _DEFAULT_CODEC
@@ -1,11 +1,111 @@
-from asyncio import AbstractEventLoop, sleep
+import logging
+from asyncio import AbstractEventLoop, TimeoutError, sleep, wait_for
 from http import HTTPStatus
-from typing import Dict, Optional, Union
+from ssl import SSLContext, create_default_context
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from aio_yandex_tracker import const, errors, types
+from aio_yandex_tracker.cache import (
+    ResponseCache,
+    freeze_mapping,
+    make_cache_key,
+)
+from aio_yandex_tracker.compression import (
+    Decompressor,
+    compress,
+    create_decompressor,
+    decompress,
+    get_accept_encoding,
+)
+from aio_yandex_tracker.endpoints import resolve_endpoint
+from aio_yandex_tracker.instrumentation import (
+    RequestHooks,
+    RequestInfo,
+    create_trace_config,
+)
+from aio_yandex_tracker.limiter import RateLimiter
 from aio_yandex_tracker.models.http import HttpResponse
+from aio_yandex_tracker.offload import Offloader
+from aio_yandex_tracker.retry import RetryPolicy
+from aio_yandex_tracker.serialization import JsonCodec, get_default_codec
+from aio_yandex_tracker.singleflight import SingleFlight
+from aio_yandex_tracker.streaming import ResponseStream, iter_json_array
 from aio_yandex_tracker.types import HEADERS_OBJECT
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
+
+logger = logging.getLogger(__name__)
+
+
+def create_connector(
+    limit: int = const.CONNECTOR_LIMIT_DEFAULT,
+    limit_per_host: int = const.CONNECTOR_LIMIT_PER_HOST_DEFAULT,
+    keepalive_timeout: float = const.CONNECTOR_KEEPALIVE_TIMEOUT_DEFAULT,
+    ttl_dns_cache: Optional[int] = const.CONNECTOR_DNS_CACHE_TTL_DEFAULT,
+    ssl_context: Optional[SSLContext] = None,
+    loop: Optional[AbstractEventLoop] = None,
+) -> TCPConnector:
+    # A single SSL context is shared by all connections of the connector,
+    # so CA certificates are loaded once and not per TLS handshake
+    return TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=ttl_dns_cache != 0,
+        ttl_dns_cache=ttl_dns_cache,
+        ssl=ssl_context or create_default_context(),
+        loop=loop,
+    )
+
+
+def decode_json(
+    body: bytes,
+    encoding: str = const.RESPONSE_ENCODING_DEFAULT,
+    codec: Optional[JsonCodec] = None,
+) -> Any:
+    if not body.strip():
+        return None
+    codec = codec or get_default_codec()
+    # UTF-8 is decoded by the codec straight from bytes
+    if encoding.lower().replace("-", "") == "utf8":
+        return codec.loads(body)
+    return codec.loads(body.decode(encoding))
+
+
+def _decompress_and_decode(
+    raw_body: bytes,
+    content_encoding: Optional[str],
+    encoding: str,
+    codec: JsonCodec,
+    empty: bool,
+) -> Tuple[Any, int]:
+    body = decompress(raw_body, content_encoding)
+    return None if empty else decode_json(body, encoding, codec), len(body)
+
+
+async def _iter_counted(
+    chunks: AsyncIterator[bytes], info: RequestInfo, counter: str
+) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        setattr(info, counter, getattr(info, counter) + len(chunk))
+        yield chunk
+
+
+async def _iter_decompressed(
+    chunks: AsyncIterator[bytes], decompressor: Decompressor
+) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        yield decompressor.decompress(chunk)
+    yield decompressor.flush()
 
 
 class HttpSession:
@@ -21,74 +121,417 @@ class HttpSession:
         loop: Optional[AbstractEventLoop] = None,
         retries: Optional[int] = const.BACKOFF_RETRIES,
         retry_interval: Optional[int] = const.BACKOFF_RETRY_INTERVAL,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connector: Optional[TCPConnector] = None,
+        connector_options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        json_codec: Optional[JsonCodec] = None,
+        offload: Optional[Offloader] = None,
+        instrumentation: Optional[RequestHooks] = None,
+        accept_encoding: Optional[Iterable[str]] = None,
+        compress_threshold: Optional[int] = None,
+        client_session: Optional[ClientSession] = None,
     ):
         api_root = api_root or const.API_URL_ROOT
         api_schema = api_schema or const.API_URL_SCHEMA
-        self.retries = retries
-        self.retry_interval = retry_interval
+        self.retry_policy = retry_policy or RetryPolicy(
+            retries=retries, base_delay=retry_interval
+        )
+        self.rate_limiter = rate_limiter
+        self.timeout = self.build_timeout(timeout) or ClientTimeout(
+            total=const.REQUEST_TIMEOUT_TOTAL_DEFAULT,
+            sock_connect=const.REQUEST_TIMEOUT_CONNECT_DEFAULT,
+        )
+        self.deadline = deadline
+        self.cache = cache
+        self.json_codec = json_codec or get_default_codec()
+        self.offload = offload
+        self.instrumentation = instrumentation
+        # Request bodies of this size in bytes and bigger are gzipped
+        self.compress_threshold = compress_threshold
+        if accept_encoding is None:
+            accept_encoding = get_accept_encoding()
+        self.__in_flight = SingleFlight() if coalesce_requests else None
+        self.__limited_streams: Set[ClientResponse] = set()
         self.api_version = api_version or const.API_VERSION_NAME.V2.value
         self.base_url = f"{api_schema}://{api_root}"
         self._api_url = "{base}/{version}/{endpoint}"
         user_headers = headers or {}
         self.headers = {
             **const.API_HEADERS_DEFAULT,
+            "Accept-Encoding": ", ".join(accept_encoding) or "identity",
             **user_headers,
             "Host": api_root.split("/")[0],
             "Authorization": f"OAuth {token}",
             "X-Org-ID": str(org_id),
         }
         self.response_encoding = response_encoding
-        self.__session: Optional[ClientSession] = ClientSession(
-            headers=self.headers, loop=loop
+        if client_session is not None:
+            # A shared session (e.g. of TrackerPool) serves many tokens and
+            # organizations, so auth and org headers are sent per request.
+            # It has to be created with auto_decompress=False
+            self.__session: Optional[ClientSession] = client_session
+            self.__session_owner = False
+            return
+        self.__session_owner = True
+        # Shared connector stays open when a single session is closed
+        connector_owner = connector is None
+        if connector is None:
+            connector = create_connector(
+                **(connector_options or {}), loop=loop
+            )
+        self.__session = ClientSession(
+            headers=self.headers,
+            loop=loop,
+            connector=connector,
+            connector_owner=connector_owner,
+            timeout=self.timeout,
+            # Bodies are decompressed by the session itself, so that both
+            # compressed and decompressed sizes are known
+            auto_decompress=False,
+            # Tracing is only set up when someone listens to it
+            trace_configs=[create_trace_config()] if instrumentation else None,
         )
 
     async def fetch(self, endpoint, method, *args, **kwargs):
-        return await self.request(
-            self._api_url.format(
-                base=self.base_url, version=self.api_version, endpoint=endpoint
-            ),
-            method,
-            *args,
-            **kwargs,
+        url = self._api_url.format(
+            base=self.base_url, version=self.api_version, endpoint=endpoint
         )
+        if self.cache is None:
+            return await self.request(url, method, *args, **kwargs)
+        return await self.__fetch_cached(
+            url, endpoint, method, *args, **kwargs
+        )
+
+    async def __fetch_cached(
+        self, url: str, endpoint: str, method: str, *args, **kwargs
+    ) -> HttpResponse:
+        template, endpoint_params = resolve_endpoint(endpoint)
+        issue_id = endpoint_params.get("id")
+        if method != "get":
+            try:
+                response = await self.request(url, method, *args, **kwargs)
+            finally:
+                # Even a failed mutation may have been partially applied
+                self.cache.invalidate_issues([issue_id])
+            if isinstance(response.body, dict):
+                self.cache.invalidate_issues(
+                    [response.body.get("key"), response.body.get("id")]
+                )
+            return response
+
+        ttl = self.cache.get_ttl(template)
+        # Requests with custom headers (e.g. conditional) bypass the cache
+        if not ttl or args or kwargs.get("headers") or kwargs.get("stream"):
+            return await self.request(url, method, *args, **kwargs)
+
+        key = make_cache_key(endpoint, kwargs.get("params"))
+        response = self.cache.get(key)
+        if response is None:
+            response = await self.request(url, method, *args, **kwargs)
+            if response.status == HTTPStatus.OK:
+                self.cache.set(key, response, ttl, issue_id)
+        return response
 
     async def request(
         self, url: str, method: str, *args, **kwargs
     ) -> HttpResponse:
-        retry = 0
-        retry_limit = kwargs.get("retries", self.retries)
-        retry_interval = kwargs.get("retry_interval", self.retry_interval)
-        response = await self.__send_request(
-            url,
+        if (
+            self.__in_flight is None
+            or method not in const.HTTP_METHODS_COALESCE
+            or args
+            or kwargs.keys() - const.REQUEST_KWARGS_COALESCE
+        ):
+            return await self.__request(url, method, *args, **kwargs)
+
+        # Identical concurrent requests share a single round trip. Calls
+        # with other timeouts or deadlines are not attached to each other
+        key = (
             method,
-            *args,
-            **kwargs,
+            url,
+            freeze_mapping(kwargs.get("params")),
+            freeze_mapping(kwargs.get("headers")),
+            kwargs.get("timeout"),
+            kwargs.get("deadline"),
         )
-        while retry < retry_limit and self.retry_needed(response):
-            response = await self.__send_request(
-                url,
+        return await self.__in_flight.do(
+            key,
+            lambda: self.__request(url, method, **kwargs),
+            HttpResponse.copy,
+        )
+
+    async def __request(
+        self, url: str, method: str, *args, **kwargs
+    ) -> HttpResponse:
+        policy = kwargs.pop("retry_policy", None) or self.retry_policy
+        idempotent = kwargs.pop("idempotent", None)
+        overrides = {
+            option: kwargs.pop(kwarg)
+            for kwarg, option in (
+                ("retries", "retries"),
+                ("retry_interval", "base_delay"),
+            )
+            if kwarg in kwargs
+        }
+        deadline = kwargs.pop("deadline", None)
+        if deadline is None:
+            deadline = self.deadline
+        if deadline is not None:
+            overrides["deadline"] = deadline
+        if overrides:
+            policy = policy.replace(**overrides)
+        timeout = self.build_timeout(kwargs.pop("timeout", None))
+        if timeout:
+            kwargs["timeout"] = timeout
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self.json_codec.dumps(kwargs.pop("json"))
+        if self.compress_threshold is not None:
+            self.compress_request(kwargs)
+        stream = kwargs.get("stream", False)
+
+        hooks = self.instrumentation
+        info = None
+        if hooks is not None:
+            data = kwargs.get("data")
+            info = RequestInfo(
                 method,
-                *args,
-                **kwargs,
+                url,
+                self.get_endpoint_template(url),
+                len(data) if isinstance(data, (bytes, bytearray)) else 0,
+            )
+            kwargs["trace_request_ctx"] = info
+            hooks.on_request_start(info)
+
+        response = None
+        try:
+            response = await self.__send_with_retries(
+                url, method, policy, idempotent, info, *args, **kwargs
+            )
+            await self.validate_http_response(
+                response, self.response_encoding, self.json_codec
             )
-            if not self.retry_needed(response):
-                break
-            retry += 1
-            # TODO add log message
-            if response.status == HTTPStatus.TOO_MANY_REQUESTS:
-                await sleep(5)
+            if stream:
+                result = HttpResponse(
+                    response.status,
+                    response.reason,
+                    response.url,
+                    response.headers,
+                    self.iter_body(response, info),
+                )
             else:
-                await sleep(retry_interval)
+                raw_body = await response.read()
+                body, size = await self.decode_response_body(
+                    raw_body,
+                    response.headers.get("Content-Encoding"),
+                    response.status in const.RESPONSE_CODES_EMPTY,
+                )
+                result = HttpResponse(
+                    response.status,
+                    response.reason,
+                    response.url,
+                    response.headers,
+                    body,
+                    size,
+                    len(raw_body),
+                )
+        except BaseException as exc:
+            if stream and response is not None:
+                self.release_response(response)
+            if info is not None:
+                info.finish()
+                hooks.on_request_error(info, exc)
+            raise
 
-        await self.validate_http_response(response, self.response_encoding)
-        return HttpResponse(
-            response.status,
-            response.reason,
-            response.url,
-            response.headers,
-            await response.json(encoding=self.response_encoding),
+        # A streamed request ends when its body is closed, see iter_body()
+        if info is not None and not stream:
+            info.bytes_received = result.size
+            info.bytes_received_compressed = result.compressed_size
+            info.finish()
+            hooks.on_request_end(info)
+        return result
+
+    async def __send_with_retries(
+        self,
+        url: str,
+        method: str,
+        policy: RetryPolicy,
+        idempotent: Optional[bool],
+        info: Optional[RequestInfo],
+        *args,
+        **kwargs,
+    ) -> ClientResponse:
+        attempt = 0
+        started_at = monotonic()
+        # Deadline covers the whole sequence: attempts, limiter waits, sleeps
+        deadline_at = (
+            started_at + policy.deadline
+            if policy.deadline is not None
+            else None
+        )
+        while True:
+            if info is not None:
+                info.attempts += 1
+            try:
+                response = await self.__send_attempt(
+                    url, method, deadline_at, *args, **kwargs
+                )
+            except errors.ApiUnknownError as exc:
+                if not policy.should_retry_error(
+                    method, exc.__cause__, idempotent
+                ):
+                    raise
+                delay = policy.get_delay(attempt)
+                if not policy.allows(attempt, started_at, delay):
+                    raise
+                if info is not None:
+                    info.status = None
+            else:
+                if info is not None:
+                    info.status = response.status
+                if not policy.should_retry(
+                    method, response.status, idempotent
+                ):
+                    return response
+                delay = policy.get_delay(attempt, response.headers)
+                if not policy.allows(attempt, started_at, delay):
+                    return response
+                self.release_response(response)
+                if (
+                    response.status == HTTPStatus.TOO_MANY_REQUESTS
+                    and self.rate_limiter
+                ):
+                    # Rate limiter has already been paused by the response
+                    delay = 0
+
+            attempt += 1
+            if info is not None:
+                self.instrumentation.on_request_retry(info, delay)
+            await sleep(delay)
+
+    def get_endpoint_template(self, url: str) -> str:
+        # Metrics are labeled by templates, not by concrete URLs
+        prefix = f"{self.base_url}/{self.api_version}/"
+        if url.startswith(prefix):
+            endpoint = url[len(prefix) :].split("?")[0]  # noqa E203
+            template, _ = resolve_endpoint(endpoint)
+            if template:
+                return template
+        return const.METRICS_ENDPOINT_UNKNOWN
+
+    async def decode_body(self, body: bytes) -> Any:
+        if self.offload is None or not self.offload.should_offload(len(body)):
+            return decode_json(body, self.response_encoding, self.json_codec)
+        # Big bodies are decoded off the event loop
+        return await self.offload.run(
+            decode_json, body, self.response_encoding, self.json_codec
         )
 
+    async def decode_response_body(
+        self,
+        raw_body: bytes,
+        content_encoding: Optional[str],
+        empty: bool = False,
+    ) -> Tuple[Any, int]:
+        # Returns the decoded body and its decompressed size
+        if self.offload is None or not self.offload.should_offload(
+            len(raw_body)
+        ):
+            body = decompress(raw_body, content_encoding)
+            return None if empty else await self.decode_body(body), len(body)
+        # Decompression of a big body blocks the loop just as decoding
+        return await self.offload.run(
+            _decompress_and_decode,
+            raw_body,
+            content_encoding,
+            self.response_encoding,
+            self.json_codec,
+            empty,
+        )
+
+    def compress_request(self, kwargs: Dict[str, Any]) -> None:
+        data = kwargs.get("data")
+        if (
+            not isinstance(data, (bytes, bytearray))
+            or len(data) < self.compress_threshold
+        ):
+            return
+        kwargs["data"] = compress(data)
+        kwargs["headers"] = {
+            **(kwargs.get("headers") or {}),
+            "Content-Encoding": "gzip",
+        }
+
+    def iter_body(
+        self, response: ClientResponse, info: Optional[RequestInfo] = None
+    ) -> ResponseStream:
+        def on_close(exc: Optional[BaseException]) -> None:
+            self.release_response(response)
+            if info is None:
+                return
+            # Duration and sizes cover reading of the body as well
+            info.finish()
+            if exc is None:
+                self.instrumentation.on_request_end(info)
+            else:
+                self.instrumentation.on_request_error(info, exc)
+
+        return ResponseStream(self.__iter_items(response, info), on_close)
+
+    def release_response(self, response: ClientResponse) -> None:
+        response.release()
+        # Streamed responses hold their limiter slot until released
+        if response in self.__limited_streams:
+            self.__limited_streams.discard(response)
+            self.rate_limiter.release()
+
+    async def __iter_items(
+        self, response: ClientResponse, info: Optional[RequestInfo] = None
+    ) -> AsyncIterator:
+        # Items of a JSON array body are parsed as the body arrives
+        if response.status in const.RESPONSE_CODES_EMPTY:
+            return
+        chunks = response.content.iter_chunked(const.STREAM_CHUNK_SIZE_DEFAULT)
+        if info is not None:
+            chunks = _iter_counted(chunks, info, "bytes_received_compressed")
+        decompressor = create_decompressor(
+            response.headers.get("Content-Encoding")
+        )
+        if decompressor is not None:
+            chunks = _iter_decompressed(chunks, decompressor)
+        if info is not None:
+            chunks = _iter_counted(chunks, info, "bytes_received")
+        async for item in iter_json_array(
+            chunks, self.response_encoding, self.json_codec
+        ):
+            yield item
+
+    async def __send_attempt(
+        self,
+        url: str,
+        method: str,
+        deadline_at: Optional[float],
+        *args,
+        **kwargs,
+    ) -> ClientResponse:
+        if deadline_at is None:
+            return await self.__send_request(url, method, *args, **kwargs)
+
+        remaining = deadline_at - monotonic()
+        try:
+            if remaining <= 0:
+                raise TimeoutError()
+            return await wait_for(
+                self.__send_request(url, method, *args, **kwargs), remaining
+            )
+        except TimeoutError as exc:
+            raise errors.ApiTimeoutError(
+                f"Request deadline exceeded: {method.upper()} {url}"
+            ) from exc
+
     async def __send_request(
         self, endpoint: str, method: str, *args, **kwargs
     ) -> ClientResponse:
@@ -97,33 +540,86 @@ class HttpSession:
                 "Instance session is not active. Re-create instance"
             )
         http_method = self.validate_http_method(self.__session, method)
+        if not self.__session_owner:
+            kwargs["headers"] = {
+                **self.headers,
+                **(kwargs.get("headers") or {}),
+            }
+            kwargs.setdefault("timeout", self.timeout)
+        if not self.rate_limiter:
+            return await self.__send(http_method, endpoint, *args, **kwargs)
+
+        info = kwargs.get("trace_request_ctx")
+        stream = kwargs.get("stream", False)
+        queued_at = monotonic()
+        await self.rate_limiter.acquire()
         try:
-            return await http_method(endpoint, *args, **kwargs)
+            if info is not None:
+                info.limiter_wait += monotonic() - queued_at
+            response = await self.__send(
+                http_method, endpoint, *args, **kwargs
+            )
+        except BaseException:
+            self.rate_limiter.release()
+            raise
+        if stream:
+            # In-flight limit covers the body, which is read by the caller
+            self.__limited_streams.add(response)
+        else:
+            self.rate_limiter.release()
+        self.rate_limiter.on_response(response.status, response.headers)
+        return response
+
+    @staticmethod
+    async def __send(http_method, endpoint: str, *args, **kwargs):
+        # Body is read as a part of the attempt, so that timeouts, deadline
+        # and in-flight limits cover the whole response. Streaming requests
+        # leave the body to be consumed by the caller
+        stream = kwargs.pop("stream", False)
+        try:
+            response = await http_method(endpoint, *args, **kwargs)
+            if not stream:
+                await response.read()
+            return response
+        except TimeoutError as exc:
+            raise errors.ApiTimeoutError(
+                f"{exc.__class__.__name__} - {exc}"
+            ) from exc
         except Exception as exc:
-            raise errors.ApiUnknownError(f"{exc.__class__.__name__} - {exc}")
+            raise errors.ApiUnknownError(
+                f"{exc.__class__.__name__} - {exc}"
+            ) from exc
 
     @staticmethod
-    def retry_needed(response: ClientResponse) -> bool:
-        if response.status in const.RESPONSE_CODES_RETRY:
-            return True
-        return False
+    def build_timeout(
+        timeout: Optional[types.REQUEST_TIMEOUT],
+    ) -> Optional[ClientTimeout]:
+        if timeout is None or isinstance(timeout, ClientTimeout):
+            return timeout
+        return ClientTimeout(total=timeout)
 
     @staticmethod
     async def validate_http_response(
-        response: ClientResponse, encoding=const.RESPONSE_ENCODING_DEFAULT
+        response: ClientResponse,
+        encoding=const.RESPONSE_ENCODING_DEFAULT,
+        codec: Optional[JsonCodec] = None,
     ) -> None:
         if response.status in const.RESPONSE_CODES_OK:
             return
 
         try:
-            error_body = await response.json(encoding=encoding)
+            body = decompress(
+                await response.read(), response.headers.get("Content-Encoding")
+            )
+            error_body = decode_json(body, encoding, codec)
         except Exception:
-            # FIXME log exception
+            logger.debug(
+                "Cannot decode error response body of %s",
+                response.url,
+                exc_info=True,
+            )
             error_body = None
 
-        # if error_body:
-        #     # FIXME add logging
-        #     pass
         exc_class = errors.HTTP_ERRORS_MAPPING.get(
             response.status, errors.ApiUnavailableError
         )(
@@ -157,6 +653,26 @@ class HttpSession:
                 links[link_type.strip('""')] = link.strip("<>")
         return links
 
+    @property
+    def retries(self) -> Optional[int]:
+        return self.retry_policy.retries
+
+    @retries.setter
+    def retries(self, value: Optional[int]):
+        self.retry_policy = self.retry_policy.replace(retries=value)
+
+    @property
+    def retry_interval(self) -> Optional[float]:
+        return self.retry_policy.base_delay
+
+    @retry_interval.setter
+    def retry_interval(self, value: Optional[float]):
+        self.retry_policy = self.retry_policy.replace(base_delay=value)
+
+    @property
+    def connector(self) -> Optional[TCPConnector]:
+        return self.__session.connector if self.__session else None
+
     @property
     def is_closed(self):
         return (
@@ -165,7 +681,8 @@ class HttpSession:
 
     async def close(self):
         if self.is_closed:
-            await self.__session.close()
+            if self.__session_owner:
+                await self.__session.close()
             self.__session = None
             return True
         return False
@@ -0,0 +1,34 @@
+from asyncio import Future, ensure_future, shield
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    def __init__(self):
+        self.__calls: Dict[Hashable, Future] = {}
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    async def do(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        share: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        call = self.__calls.get(key)
+        if call is None:
+            call = ensure_future(factory())
+            self.__calls[key] = call
+            call.add_done_callback(lambda _: self.__forget(key, call))
+            # Cancellation of one caller must not cancel the shared call
+            return await shield(call)
+        result = await shield(call)
+        # Joined callers get their own copy of a mutable result
+        return share(result) if share is not None else result
+
+    def __forget(self, key: Hashable, call: Future) -> None:
+        if self.__calls.get(key) is call:
+            del self.__calls[key]
+        if not call.cancelled():
+            # Mark exception as retrieved when every caller has gone away
+            call.exception()
@@ -0,0 +1,160 @@
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from aio_yandex_tracker import const
+
+
+class BaseStore(ABC):
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __enter__(self) -> "BaseStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class MemoryStore(BaseStore):
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        self._data = dict(data or {})
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class FileStore(MemoryStore):
+    # Append-only JSON lines log, the last record of a key wins on load.
+    # Superseded records are dropped by rewriting the log as a snapshot
+    # of the current values on load and on close
+    def __init__(self, path: str):
+        super(FileStore, self).__init__()
+        self.path = path
+        # Records in the log, compared to the number of keys to tell
+        # whether the log has anything to drop
+        self.__records = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    self.__records += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Tail of a log which was interrupted mid-write
+                        continue
+                    if "value" in record:
+                        self._data[record["key"]] = record["value"]
+                    else:
+                        self._data.pop(record["key"], None)
+            self.compact()
+        self.__file = open(path, "a", encoding="utf-8")
+
+    def set(self, key: str, value: Any) -> None:
+        super(FileStore, self).set(key, value)
+        self.__write({"key": key, "value": value})
+
+    def delete(self, key: str) -> None:
+        super(FileStore, self).delete(key)
+        self.__write({"key": key})
+
+    def compact(self) -> None:
+        if self.__records <= len(self._data):
+            return
+        # Written aside and renamed, so a crash leaves either log intact
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for key, value in self._data.items():
+                file.write(self.__dump({"key": key, "value": value}))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        self.__records = len(self._data)
+
+    def close(self) -> None:
+        if not self.__file.closed:
+            self.__file.close()
+            self.compact()
+
+    def __write(self, record: Dict[str, Any]) -> None:
+        self.__file.write(self.__dump(record))
+        self.__file.flush()
+        self.__records += 1
+
+    @staticmethod
+    def __dump(record: Dict[str, Any]) -> str:
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class SQLiteStore(BaseStore):
+    def __init__(
+        self, path: str, table: str = const.STORE_SQLITE_TABLE_DEFAULT
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"Incorrect table name: {table}")
+        self.path = path
+        self.table = table
+        self.__connection = sqlite3.connect(path)
+        with self.__connection:
+            self.__connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        cursor = self.__connection.execute(
+            f"SELECT COUNT(*) FROM {self.table}"
+        )
+        return cursor.fetchone()[0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        cursor = self.__connection.execute(
+            f"SELECT value FROM {self.table} WHERE key = ?", (key,)
+        )
+        row = cursor.fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        with self.__connection:
+            self.__connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) "
+                "VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self.__connection:
+            self.__connection.execute(
+                f"DELETE FROM {self.table} WHERE key = ?", (key,)
+            )
+
+    def close(self) -> None:
+        self.__connection.close()
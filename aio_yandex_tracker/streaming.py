@@ -0,0 +1,223 @@
+import codecs
+import re
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Type,
+)
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.serialization import JsonCodec, get_default_codec
+
+_WHITESPACE = " \t\n\r"
+_STRUCTURE_RE = re.compile(r'[{}\[\]"]')
+_STRING_RE = re.compile(r'["\\]')
+_SCALAR_END_RE = re.compile(r"[\s,\]]")
+
+
+class JsonArrayParser:
+    # Items of a top-level JSON array are returned as soon as they are
+    # complete, so only the item being parsed is kept in memory
+    def __init__(
+        self,
+        encoding: str = const.RESPONSE_ENCODING_DEFAULT,
+        codec: Optional[JsonCodec] = None,
+    ):
+        self.codec = codec or get_default_codec()
+        self.__decoder = codecs.getincrementaldecoder(encoding)()
+        # Text of the unfinished item received with previous chunks.
+        # Every chunk is scanned once and joined once, when the item ends
+        self.__parts: List[str] = []
+        self.__in_item = False
+        self.__first = ""
+        self.__depth = 0
+        self.__in_string = False
+        self.__escaped = False
+        self.__started = False
+        self.__finished = False
+
+    @property
+    def finished(self) -> bool:
+        return self.__finished
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        if self.__finished:
+            if chunk.strip():
+                raise errors.StreamParseError("Data after the end of array")
+            return []
+        return self.__parse(self.__decoder.decode(chunk))
+
+    def close(self) -> List[Any]:
+        items = self.__parse(
+            self.__decoder.decode(b"", final=True), final=True
+        )
+        if not self.__finished:
+            raise errors.StreamParseError("Unexpected end of JSON array")
+        return items
+
+    def __parse(self, text: str, final: bool = False) -> List[Any]:
+        items = []
+        size = len(text)
+        pos = 0
+        # An unfinished item continues from the start of the chunk
+        item_start = 0 if self.__in_item else None
+        while (pos < size or final and item_start is not None) and (
+            not self.__finished
+        ):
+            if item_start is None:
+                char = text[pos]
+                if char in _WHITESPACE:
+                    pos += 1
+                elif not self.__started:
+                    if char != "[":
+                        raise errors.StreamParseError(
+                            "Response body is not a JSON array"
+                        )
+                    self.__started = True
+                    pos += 1
+                elif char == ",":
+                    pos += 1
+                elif char == "]":
+                    self.__finished = True
+                    pos += 1
+                else:
+                    item_start = pos
+                    self.__in_item = True
+                    self.__first = char
+                continue
+
+            end = self.__scan_item(text, pos, final)
+            if end is None:
+                break
+            self.__parts.append(text[item_start:end])
+            items.append(self.codec.loads("".join(self.__parts)))
+            self.__parts = []
+            self.__in_item = False
+            item_start = None
+            pos = end
+        if item_start is not None:
+            self.__parts.append(text[item_start:])
+        return items
+
+    def __scan_item(self, text: str, pos: int, final: bool) -> Optional[int]:
+        # Returns the end of the current item or None when more data needed
+        size = len(text)
+        if self.__first not in '{["':
+            match = _SCALAR_END_RE.search(text, pos)
+            if match is None:
+                return size if final else None
+            return match.start()
+
+        while pos < size:
+            if self.__in_string:
+                if self.__escaped:
+                    # Escaped character of the previous chunk
+                    self.__escaped = False
+                    pos += 1
+                    continue
+                match = _STRING_RE.search(text, pos)
+                if match is None:
+                    return None
+                if match.group() == "\\":
+                    if match.end() >= size:
+                        self.__escaped = True
+                        return None
+                    pos = match.end() + 1
+                    continue
+                self.__in_string = False
+                pos = match.end()
+            else:
+                match = _STRUCTURE_RE.search(text, pos)
+                if match is None:
+                    return None
+                char = match.group()
+                pos = match.end()
+                if char == '"':
+                    self.__in_string = True
+                elif char in "{[":
+                    self.__depth += 1
+                else:
+                    self.__depth -= 1
+            if self.__depth == 0 and not self.__in_string:
+                return pos
+        return None
+
+
+class ResponseStream:
+    # Owns a streamed response: its connection is returned when the items
+    # are exhausted, on aclose() or when the stream is garbage collected.
+    # on_close gets the error which interrupted reading, if any
+    def __init__(
+        self,
+        items: AsyncIterator[Any],
+        on_close: Callable[[Optional[BaseException]], None],
+    ):
+        self.__items = items
+        self.__on_close = on_close
+        self.__closed = False
+        self.__error: Optional[BaseException] = None
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def __aiter__(self) -> "ResponseStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.__closed:
+            raise StopAsyncIteration
+        try:
+            return await self.__items.__anext__()
+        except StopAsyncIteration:
+            await self.aclose()
+            raise
+        except BaseException as exc:
+            self.__error = exc
+            await self.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        if self.__closed:
+            return
+        try:
+            await self.__items.aclose()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if not self.__closed:
+            self.__closed = True
+            self.__on_close(self.__error)
+
+    def __del__(self) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "ResponseStream":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes],
+    encoding: str = const.RESPONSE_ENCODING_DEFAULT,
+    codec: Optional[JsonCodec] = None,
+) -> AsyncIterator[Any]:
+    parser = JsonArrayParser(encoding, codec)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
@@ -0,0 +1,248 @@
+from asyncio import (
+    AbstractEventLoop,
+    all_tasks,
+    current_task,
+    gather,
+    new_event_loop,
+    run_coroutine_threadsafe,
+    set_event_loop,
+)
+from inspect import isawaitable
+from threading import Thread, get_ident
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from aio_yandex_tracker import const, types
+from aio_yandex_tracker.models.api import BaseEntity, Collection
+from aio_yandex_tracker.models.bulk import BulkResult
+from aio_yandex_tracker.models.http import HttpResponse
+from aio_yandex_tracker.tracker import YandexTracker
+
+T = TypeVar("T")
+
+
+class LoopThread:
+    def __init__(self, name: str = const.SYNC_THREAD_NAME_DEFAULT):
+        self.loop: AbstractEventLoop = new_event_loop()
+        # Daemon, so that a forgotten close() does not block interpreter exit
+        self.__thread = Thread(target=self.__run, name=name, daemon=True)
+        self.__thread.start()
+
+    @property
+    def is_closed(self) -> bool:
+        return self.loop.is_closed()
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        if self.is_closed:
+            raise RuntimeError("Event loop thread is closed")
+        if get_ident() == self.__thread.ident:
+            # Blocking the loop on its own result would never return
+            raise RuntimeError("Blocking call from the event loop thread")
+        future = run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        try:
+            while True:
+                try:
+                    item = self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            # An abandoned iteration still releases its response
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None and not self.is_closed:
+                self.run(aclose())
+
+    def close(self) -> None:
+        if self.is_closed:
+            return
+        if self.__thread.is_alive():
+            run_coroutine_threadsafe(self.__shutdown(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.__thread.join()
+        self.loop.close()
+
+    async def __shutdown(self) -> None:
+        # Same clean up as asyncio.run() does before closing its loop
+        tasks = [task for task in all_tasks() if task is not current_task()]
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+        await self.loop.shutdown_asyncgens()
+        await self.loop.shutdown_default_executor()
+
+    def __run(self) -> None:
+        set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+class SyncProxy:
+    def __init__(self, wrapped: Any, runner: LoopThread):
+        self.__dict__["wrapped"] = wrapped
+        self.__dict__["_runner"] = runner
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self.wrapped, name)
+        if not callable(value):
+            return self._wrap(value)
+
+        def blocking(*args, **kwargs) -> Any:
+            args = [_unwrap(arg) for arg in args]
+            kwargs = {key: _unwrap(arg) for key, arg in kwargs.items()}
+            return self._wrap(value(*args, **kwargs))
+
+        return blocking
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.wrapped, name, _unwrap(value))
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self._wrap(item) for item in self.wrapped)
+
+    def __len__(self) -> int:
+        return len(self.wrapped)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._wrap(self.wrapped[index])
+
+    def __repr__(self) -> str:
+        return repr(self.wrapped)
+
+    def __str__(self) -> str:
+        return str(self.wrapped)
+
+    def _wrap(self, value: Any) -> Any:
+        if isawaitable(value):
+            value = self._runner.run(value)
+        elif hasattr(value, "__anext__"):
+            return (self._wrap(item) for item in self._runner.iterate(value))
+        return self._wrap_value(value)
+
+    def _wrap_value(self, value: Any) -> Any:
+        # Entities and pages keep blocking methods, e.g. load_next()
+        if isinstance(value, (BaseEntity, Collection)):
+            return SyncProxy(value, self._runner)
+        if isinstance(value, BulkResult):
+            result = BulkResult()
+            result.update(
+                (key, self._wrap_value(item)) for key, item in value.items()
+            )
+            result.errors = value.errors
+            result.missing = value.missing
+            return result
+        # Containers are rebuilt only when they hold entities, so plain
+        # payloads keep their identity
+        if type(value) in (list, tuple):
+            items = [self._wrap_value(item) for item in value]
+            if any(new is not old for new, old in zip(items, value)):
+                return type(value)(items)
+        elif type(value) is dict:
+            items = {
+                key: self._wrap_value(item) for key, item in value.items()
+            }
+            if any(items[key] is not item for key, item in value.items()):
+                return items
+        return value
+
+
+def _unwrap(value: Any) -> Any:
+    return value.wrapped if isinstance(value, SyncProxy) else value
+
+
+class SyncYandexTracker:
+    def __init__(
+        self,
+        *args,
+        thread_name: str = const.SYNC_THREAD_NAME_DEFAULT,
+        **kwargs,
+    ):
+        self.__runner = LoopThread(thread_name)
+        # Created in the loop thread, so that the session, its connector
+        # and locks belong to the background loop
+        try:
+            self.__tracker = self.__runner.run(
+                _create_tracker(*args, **kwargs)
+            )
+        except BaseException:
+            self.__runner.close()
+            raise
+        self.__issues = SyncProxy(self.__tracker.issues, self.__runner)
+        self.__priorities = SyncProxy(self.__tracker.priorities, self.__runner)
+
+    @property
+    def tracker(self) -> YandexTracker:
+        return self.__tracker
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        return self.__runner.loop
+
+    @property
+    def issues(self) -> SyncProxy:
+        return self.__issues
+
+    @property
+    def priorities(self) -> SyncProxy:
+        return self.__priorities
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        return self.__runner.run(coro, timeout)
+
+    def wrap(self, value: Any) -> Any:
+        return SyncProxy(value, self.__runner) if value is not None else None
+
+    def raw_query(
+        self,
+        url: str,
+        method: str,
+        params: Optional[types.PARAMS_OBJECT] = None,
+        headers: Optional[types.HEADERS_OBJECT] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+    ) -> HttpResponse:
+        return self.__runner.run(
+            self.__tracker.raw_query(
+                url, method, params, headers, payload, timeout, deadline
+            )
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self.__runner.is_closed
+
+    def close(self) -> None:
+        if self.__runner.is_closed:
+            return
+        self.__runner.run(self.__tracker.close())
+        self.__runner.close()
+
+    def __enter__(self) -> "SyncYandexTracker":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+async def _create_tracker(*args, **kwargs) -> YandexTracker:
+    return YandexTracker(*args, **kwargs)
@@ -1,12 +1,19 @@
 from asyncio import AbstractEventLoop
 from types import TracebackType
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Iterable, Optional, Type, Union
 
 from aio_yandex_tracker import const, types
+from aio_yandex_tracker.cache import ResponseCache
+from aio_yandex_tracker.instrumentation import RequestHooks
+from aio_yandex_tracker.limiter import RateLimiter
 from aio_yandex_tracker.models import api as api_models
 from aio_yandex_tracker.models.http import HttpResponse
+from aio_yandex_tracker.offload import Offloader
+from aio_yandex_tracker.retry import RetryPolicy
+from aio_yandex_tracker.serialization import JsonCodec
 from aio_yandex_tracker.session import HttpSession
 from aio_yandex_tracker.types import HEADERS_OBJECT
+from aiohttp import ClientSession, TCPConnector
 
 
 class YandexTracker:
@@ -22,6 +29,22 @@ class YandexTracker:
         loop: Optional[AbstractEventLoop] = None,
         retries: Optional[int] = const.BACKOFF_RETRIES,
         retry_interval: Optional[int] = const.BACKOFF_RETRY_INTERVAL,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connector: Optional[TCPConnector] = None,
+        connector_options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        entity_mode: Union[str, const.ENTITY_MODE] = const.ENTITY_MODE.DEFAULT,
+        keep_payload: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        offload: Optional[Offloader] = None,
+        instrumentation: Optional[RequestHooks] = None,
+        accept_encoding: Optional[Iterable[str]] = None,
+        compress_threshold: Optional[int] = None,
+        client_session: Optional[ClientSession] = None,
     ):
         self.__session = HttpSession(
             token=token,
@@ -34,9 +57,27 @@ class YandexTracker:
             loop=loop,
             retries=retries,
             retry_interval=retry_interval,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            connector=connector,
+            connector_options=connector_options,
+            timeout=timeout,
+            deadline=deadline,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            json_codec=json_codec,
+            offload=offload,
+            instrumentation=instrumentation,
+            accept_encoding=accept_encoding,
+            compress_threshold=compress_threshold,
+            client_session=client_session,
+        )
+        self.__issues = api_models.Issues(
+            self.__session, entity_mode, keep_payload
+        )
+        self.__priorities = api_models.Priorities(
+            self.__session, entity_mode, keep_payload
         )
-        self.__issues = api_models.Issues(self.__session)
-        self.__priorities = api_models.Priorities(self.__session)
 
     @property
     def issues(self):
@@ -53,12 +94,16 @@ class YandexTracker:
         params: Optional[types.PARAMS_OBJECT] = None,
         headers: Optional[types.HEADERS_OBJECT] = None,
         payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[types.REQUEST_TIMEOUT] = None,
+        deadline: Optional[float] = None,
     ) -> HttpResponse:
         opts = {
             "url": url,
             "method": method,
             "params": params or {},
             "headers": headers or {},
+            "timeout": timeout,
+            "deadline": deadline,
         }
         if payload:
             opts["json"] = payload
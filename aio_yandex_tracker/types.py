@@ -1,5 +1,8 @@
 from typing import Dict, Union
 
+from aiohttp import ClientTimeout
+
 HEADERS_OBJECT = Dict[str, Union[int, str]]
 PARAMS_OBJECT = Dict[str, Union[int, str]]
 SESSION_PRESET = Dict[str, Union[str, int, Dict[str, Union[str, int]]]]
+REQUEST_TIMEOUT = Union[ClientTimeout, float]
@@ -0,0 +1,162 @@
+from asyncio import sleep
+from json import dumps
+from random import Random
+from typing import Dict, Iterable, Optional
+
+from aiohttp import web
+from multidict import CIMultiDict
+from yarl import URL
+
+API_VERSION = "v2"
+
+
+class FakeTrackerConfig:
+    def __init__(
+        self,
+        total_issues: int = 1000,
+        per_page: int = 50,
+        latency: float = 0.0,
+        fail_rate: float = 0.0,
+        fail_statuses: Iterable[int] = (429, 503),
+        retry_after: Optional[float] = 0,
+        scroll: bool = False,
+        issue_fields: int = 10,
+        seed: int = 0,
+    ):
+        self.total_issues = total_issues
+        self.per_page = per_page
+        # Seconds added to every response
+        self.latency = latency
+        # Share of requests failed with one of fail_statuses
+        self.fail_rate = fail_rate
+        self.fail_statuses = tuple(fail_statuses)
+        self.retry_after = retry_after
+        # Link: next pagination instead of page numbers
+        self.scroll = scroll
+        # Extra payload fields, so that issues have a realistic size
+        self.issue_fields = issue_fields
+        # Faults are random, but the same for every run
+        self.seed = seed
+
+
+def make_issue(num: int, fields: int = 10) -> Dict:
+    key = f"BENCH-{num}"
+    return {
+        "self": f"http://tracker/{API_VERSION}/issues/{key}",
+        "id": str(num),
+        "key": key,
+        "version": 1,
+        "summary": f"Benchmark issue {num}",
+        "description": "Lorem ipsum dolor sit amet " * 8,
+        "status": {"self": "http://tracker/statuses/1", "key": "open"},
+        "queue": {"self": "http://tracker/queues/BENCH", "key": "BENCH"},
+        "tags": ["bench", "fake"],
+        "createdAt": "2026-01-01T00:00:00.000+0000",
+        "updatedAt": "2026-01-02T00:00:00.000+0000",
+        **{f"custom{field}": f"value {field}" for field in range(fields)},
+    }
+
+
+def create_app(config: Optional[FakeTrackerConfig] = None) -> web.Application:
+    config = config or FakeTrackerConfig()
+    app = web.Application()
+    app["config"] = config
+    app["requests"] = 0
+    random = Random(config.seed)
+    json_headers = {"Content-type": "application/json"}
+
+    @web.middleware
+    async def faults(request: web.Request, handler) -> web.Response:
+        app["requests"] += 1
+        if config.latency:
+            await sleep(config.latency)
+        if config.fail_rate and random.random() < config.fail_rate:
+            status = random.choice(config.fail_statuses)
+            headers = dict(json_headers)
+            if config.retry_after is not None:
+                headers["Retry-After"] = str(config.retry_after)
+            return web.Response(status=status, body="{}", headers=headers)
+        return await handler(request)
+
+    app.middlewares.append(faults)
+
+    async def search_cb(request: web.Request) -> web.Response:
+        per_page = int(request.query.get("perPage", config.per_page))
+        total_pages = max(-(-config.total_issues // per_page), 1)
+        if config.scroll:
+            page = int(request.query.get("scrollId", 1))
+        else:
+            page = int(request.query.get("page", 1))
+        first = (page - 1) * per_page + 1
+        last = min(page * per_page, config.total_issues)
+        body = [
+            make_issue(num, config.issue_fields)
+            for num in range(first, last + 1)
+        ]
+
+        headers = CIMultiDict(json_headers)
+        url = URL(f"{request.scheme}://{request.host}{request.rel_url}")
+        headers.add("Link", f'<{url.update_query(page=1)}>; rel="first"')
+        if config.scroll:
+            if page < total_pages:
+                next_url = url.update_query(scrollId=page + 1)
+                headers.add("Link", f'<{next_url}>; rel="next"')
+        else:
+            headers.add("Link", f'<{url}>; rel="seek"')
+            headers["X-Total-Pages"] = str(total_pages)
+            headers["X-Total-Count"] = str(config.total_issues)
+        return web.Response(body=dumps(body), headers=headers)
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        num = int(request.match_info["id"].rsplit("-", 1)[-1])
+        if num < 1 or num > config.total_issues:
+            return web.Response(status=404, body="{}", headers=json_headers)
+        return web.Response(
+            body=dumps(make_issue(num, config.issue_fields)),
+            headers={**json_headers, "ETag": f'"{num}-1"'},
+        )
+
+    app.router.add_route("POST", f"/{API_VERSION}/issues/_search", search_cb)
+    app.router.add_route("*", f"/{API_VERSION}/issues/{{id}}", issue_cb)
+    return app
+
+
+class FakeTrackerServer:
+    def __init__(
+        self,
+        config: Optional[FakeTrackerConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.app = create_app(config)
+        self.host = host
+        self.port = port
+        self.__runner: Optional[web.AppRunner] = None
+
+    @property
+    def config(self) -> FakeTrackerConfig:
+        return self.app["config"]
+
+    @property
+    def api_root(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self.__runner = web.AppRunner(self.app, access_log=None)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, self.host, self.port)
+        await site.start()
+        # Port 0 means any free port, the real one is known after start
+        self.port = self.__runner.addresses[0][1]
+
+    async def close(self) -> None:
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+    async def __aenter__(self) -> "FakeTrackerServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
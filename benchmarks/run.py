@@ -0,0 +1,311 @@
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from statistics import median
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.api import Issue, create_collection
+from aio_yandex_tracker.models.http import HttpResponse
+from aio_yandex_tracker.retry import RetryPolicy
+from aio_yandex_tracker.tracker import YandexTracker
+from yarl import URL
+
+from benchmarks.fake_tracker import (
+    API_VERSION,
+    FakeTrackerConfig,
+    FakeTrackerServer,
+    make_issue,
+)
+
+BENCHMARKS: Dict[str, Callable[["BenchmarkOptions"], Awaitable[Dict]]] = {}
+
+
+class BenchmarkOptions:
+    def __init__(
+        self,
+        issues: int = 1000,
+        per_page: int = 50,
+        latency: float = 0.005,
+        concurrency: int = 8,
+        repeat: int = 3,
+    ):
+        self.issues = issues
+        self.per_page = per_page
+        self.latency = latency
+        self.concurrency = concurrency
+        self.repeat = repeat
+
+
+def benchmark(name: str) -> Callable:
+    def register(func: Callable) -> Callable:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percent / 100), len(values) - 1)]
+
+
+def summarize(
+    ops: int, durations: List[float], latencies: Optional[List[float]] = None
+) -> Dict[str, Any]:
+    # The best run is the least affected by noise of the machine
+    best = min(durations)
+    result = {
+        "ops": ops,
+        "seconds": round(best, 6),
+        "ops_per_second": round(ops / best, 2),
+        "seconds_median": round(median(durations), 6),
+    }
+    if latencies:
+        result["latency_p50"] = round(percentile(latencies, 50), 6)
+        result["latency_p95"] = round(percentile(latencies, 95), 6)
+    return result
+
+
+def create_tracker(server: FakeTrackerServer, **options) -> YandexTracker:
+    return YandexTracker(
+        const.TEST_TRACKER_TOKEN,
+        const.TEST_TRACKER_ORG_ID,
+        api_root=server.api_root,
+        api_schema="http",
+        api_version=API_VERSION,
+        **options,
+    )
+
+
+async def run_repeated(
+    options: BenchmarkOptions, func: Callable[[], Awaitable[Any]]
+) -> List[float]:
+    durations = []
+    for _ in range(options.repeat):
+        started_at = perf_counter()
+        await func()
+        durations.append(perf_counter() - started_at)
+    return durations
+
+
+async def bench_search(options: BenchmarkOptions, scroll: bool) -> Dict:
+    config = FakeTrackerConfig(
+        options.issues, options.per_page, options.latency, scroll=scroll
+    )
+    async with FakeTrackerServer(config) as server:
+        async with create_tracker(server) as tracker:
+            params = {"perPage": options.per_page}
+
+            async def sequential():
+                issues = [
+                    issue
+                    async for issue in tracker.issues.iter_search(
+                        params=params
+                    )
+                ]
+                assert len(issues) == options.issues
+
+            result = {
+                "sequential": summarize(
+                    options.issues, await run_repeated(options, sequential)
+                )
+            }
+            if scroll:
+                return result
+
+            async def concurrent():
+                first = await tracker.issues.search(params=params)
+                pages = await first.load_all(options.concurrency)
+                assert sum(len(page) for page in pages) == options.issues
+
+            result["concurrent"] = summarize(
+                options.issues, await run_repeated(options, concurrent)
+            )
+            return result
+
+
+@benchmark("search_pages")
+async def bench_search_pages(options: BenchmarkOptions) -> Dict:
+    return await bench_search(options, scroll=False)
+
+
+@benchmark("search_scroll")
+async def bench_search_scroll(options: BenchmarkOptions) -> Dict:
+    return await bench_search(options, scroll=True)
+
+
+@benchmark("get_fanout")
+async def bench_get_fanout(options: BenchmarkOptions) -> Dict:
+    config = FakeTrackerConfig(options.issues, latency=options.latency)
+    requests = min(options.issues, 200)
+    latencies: List[float] = []
+    async with FakeTrackerServer(config) as server:
+        async with create_tracker(server) as tracker:
+            semaphore = asyncio.Semaphore(options.concurrency)
+
+            async def get(num: int) -> Issue:
+                async with semaphore:
+                    started_at = perf_counter()
+                    issue = await tracker.issues.get(f"BENCH-{num}")
+                    latencies.append(perf_counter() - started_at)
+                    return issue
+
+            async def fanout():
+                await asyncio.gather(
+                    *(get(num) for num in range(1, requests + 1))
+                )
+
+            durations = await run_repeated(options, fanout)
+    return summarize(requests, durations, latencies)
+
+
+@benchmark("retries")
+async def bench_retries(options: BenchmarkOptions) -> Dict:
+    # A quarter of responses are 429 or 503 with Retry-After: 0
+    config = FakeTrackerConfig(
+        options.issues, latency=options.latency, fail_rate=0.25
+    )
+    requests = min(options.issues, 100)
+    async with FakeTrackerServer(config) as server:
+        policy = RetryPolicy(retries=10, base_delay=0.001)
+        async with create_tracker(server, retry_policy=policy) as tracker:
+            semaphore = asyncio.Semaphore(options.concurrency)
+
+            async def get(num: int) -> Issue:
+                async with semaphore:
+                    return await tracker.issues.get(f"BENCH-{num}")
+
+            async def run():
+                await asyncio.gather(
+                    *(get(num) for num in range(1, requests + 1))
+                )
+
+            durations = await run_repeated(options, run)
+            sent = server.app["requests"]
+    result = summarize(requests, durations)
+    result["server_requests"] = sent
+    return result
+
+
+@benchmark("entity_parsing")
+async def bench_entity_parsing(options: BenchmarkOptions) -> Dict:
+    # Pure CPU cost of building collections, no network involved
+    body = [make_issue(num) for num in range(1, options.per_page + 1)]
+    response = HttpResponse(
+        200,
+        "OK",
+        URL(f"http://tracker/{API_VERSION}/issues/_search"),
+        {},
+        body,
+    )
+    session = type(
+        "Session",
+        (),
+        {
+            "api_version": API_VERSION,
+            "serialize_headers_links": staticmethod(lambda headers: {}),
+        },
+    )()
+    pages = max(options.issues // options.per_page, 1)
+    result = {}
+    for entity_mode in const.ENTITY_MODE:
+        entity_cls = Issue.variant(entity_mode)
+
+        async def parse():
+            for _ in range(pages):
+                for issue in create_collection(
+                    response, session, entity_cls, "post"
+                ):
+                    issue.key
+
+        result[entity_mode.value] = summarize(
+            pages * len(body), await run_repeated(options, parse)
+        )
+    return result
+
+
+def flatten(results: Dict, prefix: str = "") -> Dict[str, Dict]:
+    flat = {}
+    for name, value in results.items():
+        if "ops_per_second" in value:
+            flat[f"{prefix}{name}"] = value
+        else:
+            flat.update(flatten(value, f"{prefix}{name}."))
+    return flat
+
+
+def compare(results: Dict, baseline: Dict) -> List[str]:
+    current, previous = flatten(results), flatten(baseline)
+    lines = [
+        f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'ratio':>7}"
+    ]
+    for name, value in current.items():
+        if name not in previous:
+            continue
+        before = previous[name]["ops_per_second"]
+        after = value["ops_per_second"]
+        lines.append(
+            f"{name:<40} {before:>12.2f} {after:>12.2f} "
+            f"{after / before if before else 0:>7.2f}"
+        )
+    return lines
+
+
+async def run(names: List[str], options: BenchmarkOptions) -> Dict:
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "aiohttp": aiohttp.__version__,
+            "platform": platform.platform(),
+        },
+        "options": vars(options),
+        "results": {name: await BENCHMARKS[name](options) for name in names},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks against a local fake Tracker API"
+    )
+    parser.add_argument(
+        "benchmarks", nargs="*", help=f"Any of: {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--per-page", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Save results as JSON")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    args = parser.parse_args(argv)
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    options = BenchmarkOptions(
+        args.issues,
+        args.per_page,
+        args.latency,
+        args.concurrency,
+        args.repeat,
+    )
+    report = asyncio.run(run(args.benchmarks or list(BENCHMARKS), options))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        print("\n".join(compare(report["results"], baseline)))
+    else:
+        sys.stdout.write(f"{output}\n")
+
+
+if __name__ == "__main__":
+    main()
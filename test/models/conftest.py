@@ -0,0 +1,48 @@
+from json import dumps
+from typing import Callable, Dict, List
+
+from aiohttp import web
+from multidict import CIMultiDict
+from pytest import fixture
+
+
+def issue_payload(key: str) -> Dict[str, str]:
+    return {"self": f"http://tracker/issues/{key}", "id": key, "key": key}
+
+
+@fixture
+def search_app(customized_session) -> Callable:
+    _, session_preset = customized_session
+
+    def create_app(pages: int, per_page: int = 2) -> web.Application:
+        app = web.Application()
+        app["requests"] = []
+        app["queries"] = []
+
+        async def search_cb(request: web.Request) -> web.Response:
+            page = int(request.query.get("page", 1))
+            app["requests"].append(page)
+            app["queries"].append(dict(request.query))
+            body: List[Dict] = [
+                issue_payload(f"TEST-{(page - 1) * per_page + num}")
+                for num in range(1, per_page + 1)
+            ]
+            headers = CIMultiDict(
+                {
+                    "Content-type": "application/json",
+                    "X-Total-Pages": str(pages),
+                    "X-Total-Count": str(pages * per_page),
+                }
+            )
+            headers.add("Link", f'<{request.path_qs}>; rel="first"')
+            headers.add("Link", f'<{request.path_qs}>; rel="seek"')
+            return web.Response(body=dumps(body), headers=headers)
+
+        app.router.add_route(
+            "POST",
+            f"/{session_preset['api_version']}/issues/_search",
+            search_cb,
+        )
+        return app
+
+    return create_app
@@ -0,0 +1,130 @@
+from asyncio import sleep
+from json import dumps
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.api import Issues
+from aiohttp import web
+from hamcrest import assert_that, contains_inanyorder, equal_to
+
+from .conftest import issue_payload
+
+EXISTING_KEYS = {f"TEST-{num}" for num in range(1, 6)}
+
+
+def issues_app(api_version: str, search_allowed: bool = True):
+    app = web.Application()
+    app["calls"] = []
+    app["in_flight"] = app["max_in_flight"] = 0
+    headers = {"Content-type": "application/json"}
+
+    async def search_cb(request: web.Request) -> web.Response:
+        keys = (await request.json())["keys"]
+        app["calls"].append(("search", len(keys)))
+        if not search_allowed:
+            return web.Response(status=400, body="{}", headers=headers)
+        body = [issue_payload(key) for key in keys if key in EXISTING_KEYS]
+        return web.Response(body=dumps(body), headers=headers)
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        key = request.match_info["id"]
+        app["calls"].append(("get", key))
+        app["in_flight"] += 1
+        app["max_in_flight"] = max(app["max_in_flight"], app["in_flight"])
+        await sleep(0.01)
+        app["in_flight"] -= 1
+        if key not in EXISTING_KEYS:
+            return web.Response(status=404, body="{}", headers=headers)
+        return web.Response(body=dumps(issue_payload(key)), headers=headers)
+
+    app.router.add_route("POST", f"/{api_version}/issues/_search", search_cb)
+    app.router.add_route("GET", f"/{api_version}/issues/{{id}}", issue_cb)
+    return app
+
+
+async def test_get_many_batched(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    app = issues_app(session_preset["api_version"])
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    keys = ["TEST-1", "TEST-2", "NOPE-1", "TEST-3", "TEST-4", "TEST-1"]
+    result = await Issues(session).get_many(keys, batch_size=2)
+
+    assert_that(
+        list(result),
+        contains_inanyorder("TEST-1", "TEST-2", "TEST-3", "TEST-4"),
+    )
+    assert_that(result["TEST-3"].key, equal_to("TEST-3"))
+    assert_that(result.missing, equal_to(["NOPE-1"]))
+    assert_that(result.errors, equal_to({}))
+    assert_that(
+        app["calls"], equal_to([("search", 2), ("search", 2), ("search", 1)])
+    )
+    await session.close()
+
+
+async def test_get_many_falls_back_to_direct_get(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = issues_app(session_preset["api_version"], search_allowed=False)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    result = await Issues(session).get_many(["TEST-1", "NOPE-1"])
+
+    assert_that(list(result), equal_to(["TEST-1"]))
+    assert_that(result.missing, equal_to(["NOPE-1"]))
+    assert_that(len(app["calls"]), equal_to(3))
+    await session.close()
+
+
+async def test_get_many_fallback_keeps_concurrency(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = issues_app(session_preset["api_version"], search_allowed=False)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    keys = [f"TEST-{num}" for num in range(1, 13)]
+    result = await Issues(session).get_many(keys, batch_size=3, concurrency=2)
+
+    assert_that(len(result.missing), equal_to(7))
+    # Batches fall back at the same time, yet share the limit
+    assert_that(app["max_in_flight"], equal_to(2))
+    await session.close()
+
+
+async def test_bulk_mutations_report_failures(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = issues_app(session_preset["api_version"])
+    api_version = session_preset["api_version"]
+
+    async def move_cb(request: web.Request) -> web.Response:
+        key = request.match_info["id"]
+        if key not in EXISTING_KEYS:
+            return web.Response(status=404, body="{}")
+        queue = request.query["queue"]
+        return web.Response(
+            body=dumps(issue_payload(f"{queue}-{key.split('-')[1]}")),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route(
+        "POST", f"/{api_version}/issues/{{id}}/_move", move_cb
+    )
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    result = await Issues(session).move_many(
+        ["TEST-1", "NOPE-1", "TEST-2"], "DONE", concurrency=2
+    )
+
+    assert_that(result["TEST-1"].key, equal_to("DONE-1"))
+    assert_that(result["TEST-2"].key, equal_to("DONE-2"))
+    assert_that(list(result.errors), equal_to(["NOPE-1"]))
+    assert_that(result.ok, equal_to(False))
+    await session.close()
@@ -0,0 +1,137 @@
+from json import dumps
+from typing import Any, Dict
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.api import Issues
+from aio_yandex_tracker.storage import MemoryStore, SQLiteStore
+from aiohttp import web
+from hamcrest import assert_that, equal_to
+from multidict import CIMultiDict
+
+
+def changelog_entry(issue: str, num: int) -> Dict:
+    return {
+        "self": f"http://tracker/issues/{issue}/changelog/{num}",
+        "id": f"{num:04d}",
+        "issue": {"key": issue},
+        "type": "IssueUpdated",
+        "transport": "front",
+    }
+
+
+class CountingStore(MemoryStore):
+    def __init__(self):
+        super(CountingStore, self).__init__()
+        self.writes = 0
+
+    def set(self, key: str, value: Any) -> None:
+        super(CountingStore, self).set(key, value)
+        self.writes += 1
+
+
+def changelog_app(api_version: str, entries: int) -> web.Application:
+    app = web.Application()
+    app["entries"] = entries
+    app["requests"] = []
+
+    async def changelog_cb(request: web.Request) -> web.Response:
+        issue = request.match_info["id"]
+        after = request.query.get("id", "")
+        per_page = int(request.query["perPage"])
+        app["requests"].append((issue, after))
+        body = [
+            changelog_entry(issue, num)
+            for num in range(1, app["entries"] + 1)
+            if f"{num:04d}" > after
+        ][:per_page]
+
+        headers = CIMultiDict({"Content-type": "application/json"})
+        url = f"http://{request.host}{request.path}?perPage={per_page}"
+        headers.add("Link", f'<{url}>; rel="first"')
+        if body and body[-1]["id"] < f"{app['entries']:04d}":
+            headers.add("Link", f'<{url}&id={body[-1]["id"]}>; rel="next"')
+        return web.Response(body=dumps(body), headers=headers)
+
+    app.router.add_route(
+        "GET", f"/{api_version}/issues/{{id}}/changelog", changelog_cb
+    )
+    return app
+
+
+async def test_iter_changelog_resumes_from_cursor(
+    aiohttp_server, customized_session, tmp_path
+):
+    get_session, session_preset = customized_session
+    app = changelog_app(session_preset["api_version"], 5)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    issues = Issues(session)
+    path = str(tmp_path / "cursors.sqlite")
+
+    with SQLiteStore(path) as cursor:
+        entries = [
+            entry.id
+            async for entry in issues.iter_changelog("TEST-1", cursor, 2)
+        ]
+    assert_that(entries, equal_to(["0001", "0002", "0003", "0004", "0005"]))
+
+    app["entries"] = 7
+    app["requests"].clear()
+    with SQLiteStore(path) as cursor:
+        assert_that(cursor.get("TEST-1"), equal_to("0005"))
+        entries = [
+            entry.id
+            async for entry in issues.iter_changelog("TEST-1", cursor, 2)
+        ]
+    assert_that(entries, equal_to(["0006", "0007"]))
+    assert_that(app["requests"], equal_to([("TEST-1", "0005")]))
+    await session.close()
+
+
+async def test_sync_changelogs(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    app = changelog_app(session_preset["api_version"], 3)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    cursor = MemoryStore({"TEST-2": "0002"})
+
+    synced = {
+        key: [entry.id for entry in entries]
+        async for key, entries, exc in Issues(session).sync_changelogs(
+            ["TEST-1", "TEST-2"], cursor
+        )
+    }
+
+    assert_that(
+        synced,
+        equal_to({"TEST-1": ["0001", "0002", "0003"], "TEST-2": ["0003"]}),
+    )
+    assert_that(cursor.get("TEST-1"), equal_to("0003"))
+    assert_that(cursor.get("TEST-2"), equal_to("0003"))
+    await session.close()
+
+
+async def test_iter_changelog_cursor_per_page(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = changelog_app(session_preset["api_version"], 5)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    issues = Issues(session)
+    cursor = CountingStore()
+
+    entries = issues.iter_changelog("TEST-1", cursor, 2)
+    async for entry in entries:
+        if entry.id == "0003":
+            break
+    await entries.aclose()
+    # The unfinished page is delivered again
+    assert_that(cursor.get("TEST-1"), equal_to("0002"))
+
+    entries = [
+        entry.id async for entry in issues.iter_changelog("TEST-1", cursor, 2)
+    ]
+    assert_that(entries, equal_to(["0003", "0004", "0005"]))
+    assert_that(cursor.writes, equal_to(3))
+    await session.close()
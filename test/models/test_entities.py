@@ -0,0 +1,165 @@
+import tracemalloc
+from typing import Type
+from unittest.mock import Mock
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.models.api import (
+    BaseEntity,
+    Issue,
+    Link,
+    Transition,
+    create_collection,
+)
+from aio_yandex_tracker.models.http import HttpResponse
+from hamcrest import (
+    assert_that,
+    calling,
+    equal_to,
+    has_entries,
+    instance_of,
+    is_not,
+    raises,
+    same_instance,
+)
+from yarl import URL
+
+from .conftest import issue_payload
+
+
+def test_compact_variant_uses_slots():
+    compact_cls = Issue.variant(const.ENTITY_MODE.COMPACT)
+    issue = compact_cls({**issue_payload("TEST-1"), "summary": "Text"}, None)
+
+    assert_that(issue, instance_of(compact_cls))
+    assert_that(issue, instance_of(Issue))
+    assert_that(issue.summary, equal_to("Text"))
+    assert_that(hasattr(issue, "__dict__"), equal_to(False))
+    assert_that(hasattr(issue, "description"), equal_to(False))
+    assert_that(issue.original_payload, has_entries(key="TEST-1"))
+    assert_that(compact_cls.variant("compact"), same_instance(compact_cls))
+    assert_that(type(issue).variant("compact"), same_instance(compact_cls))
+    assert_that(compact_cls.variant(), same_instance(Issue.variant()))
+    assert_that(
+        compact_cls._variant_of(Link),
+        same_instance(Link.variant(const.ENTITY_MODE.COMPACT)),
+    )
+
+
+def test_compact_variant_without_payload():
+    compact_cls = Transition.variant("compact", keep_payload=False)
+    payload = {"self": "http://tracker/t/1", "id": "1", "display": "Close"}
+    transition = compact_cls(payload, None)
+
+    assert_that(hasattr(transition, "__dict__"), equal_to(False))
+    assert_that(transition.original_payload, equal_to(payload))
+    assert_that(transition.original_payload, is_not(same_instance(payload)))
+
+
+def test_compact_variant_reloads_new_fields():
+    compact_cls = Issue.variant(const.ENTITY_MODE.COMPACT)
+    issue = compact_cls(issue_payload("TEST-1"), None)
+    issue.original_payload = {**issue_payload("TEST-1"), "summary": "New"}
+
+    assert_that(issue.summary, equal_to("New"))
+    assert_that(issue.as_dict(), has_entries(key="TEST-1", summary="New"))
+
+
+def test_default_entities_keep_dict():
+    issue = Issue(issue_payload("TEST-1"), None)
+    issue.custom = "value"
+
+    assert_that(issue, instance_of(Issue.variant()))
+    assert_that(issue.__dict__, has_entries(key="TEST-1", custom="value"))
+
+
+def measure(entity_cls: Type[BaseEntity], payload: dict) -> int:
+    # Payload is shared, so only the instances themselves are counted
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities = [entity_cls(payload, None) for _ in range(1000)]
+        size = tracemalloc.get_traced_memory()[0] - before
+        del entities
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def test_compact_variant_is_smaller():
+    payload = {
+        **issue_payload("TEST-1"),
+        "summary": "Text",
+        "status": {"key": "open"},
+        "queue": {"key": "TEST"},
+        "type": {"key": "bug"},
+        "priority": {"key": "normal"},
+        "createdAt": "2020-01-01",
+        "updatedAt": "2020-01-02",
+    }
+    for keep_payload in (True, False):
+        compact_cls = Issue.variant("compact", keep_payload=keep_payload)
+        measure(compact_cls, payload)
+        assert_that(
+            measure(compact_cls, payload) < measure(Issue, payload),
+            equal_to(True),
+        )
+
+
+def test_lazy_variant_resolves_fields_from_payload():
+    lazy_cls = Issue.variant(const.ENTITY_MODE.LAZY)
+    payload = {**issue_payload("TEST-1"), "createdAt": "2020-01-01"}
+    issue = lazy_cls(payload, None)
+
+    assert_that(issue.original_payload, same_instance(payload))
+    assert_that(issue.created_at, equal_to("2020-01-01"))
+    assert_that(
+        issue.as_dict(), has_entries(key="TEST-1", self_url=issue.self_url)
+    )
+    assert_that(hasattr(issue, "summary"), equal_to(False))
+
+    issue.created_at = "2021-01-01"
+    assert_that(issue.created_at, equal_to("2021-01-01"))
+    issue.original_payload = {**payload, "createdAt": "2022-01-01"}
+    assert_that(issue.created_at, equal_to("2022-01-01"))
+
+    assert_that(
+        calling(lazy_cls).with_args({"key": "TEST-1"}, None),
+        raises(errors.FieldMissingError),
+    )
+
+
+def test_collection_passes_parent_id():
+    payload = {"self": "http://tracker/t/1", "id": "1", "display": "Close"}
+    response = HttpResponse(
+        200,
+        "OK",
+        URL("http://tracker/v2/issues/TEST-1/transitions"),
+        {},
+        [payload],
+    )
+    session = Mock(api_version="v2")
+    session.serialize_headers_links.return_value = {}
+
+    for entity_mode in const.ENTITY_MODE:
+        entity_cls = Transition.variant(entity_mode)
+        transition = create_collection(
+            response, session, entity_cls, "get", "TEST-1"
+        )[0]
+        assert_that(transition._parent_id, equal_to("TEST-1"))
+        assert_that(transition.original_payload, equal_to(payload))
+
+
+def test_projected_entity_expects_requested_fields_only():
+    payload = {"key": "TEST-1", "status": {"key": "open"}}
+    for entity_mode in const.ENTITY_MODE:
+        entity_cls = Issue.projected(["key", "status"]).variant(entity_mode)
+        issue = entity_cls(payload, None)
+
+        assert_that(issue, instance_of(Issue))
+        assert_that(issue.status, equal_to({"key": "open"}))
+        assert_that(issue.as_dict(original_names=True), equal_to(payload))
+    assert_that(Issue.projected(), same_instance(Issue))
+    assert_that(
+        Issue.projected(["status", "key"]),
+        same_instance(Issue.projected(["key", "status"])),
+    )
@@ -0,0 +1,121 @@
+from json import dumps
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.api import Issues
+from aio_yandex_tracker.storage import FileStore
+from aiohttp import web
+from hamcrest import assert_that, equal_to, has_length
+from pytest import raises
+
+from .conftest import issue_payload
+
+
+def import_app(api_version: str) -> web.Application:
+    app = web.Application()
+    app["imported"] = {}
+
+    async def import_cb(request: web.Request) -> web.Response:
+        payload = await request.json()
+        if payload["unique"] in app["imported"]:
+            return web.Response(status=409, body="{}")
+        key = f"TEST-{len(app['imported']) + 1}"
+        app["imported"][payload["unique"]] = key
+        return web.Response(
+            status=201,
+            body=dumps(issue_payload(key)),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route("POST", f"/{api_version}/issues/_import", import_cb)
+    return app
+
+
+async def test_import_stream_resumes_from_checkpoint(
+    aiohttp_server, customized_session, tmp_path
+):
+    get_session, session_preset = customized_session
+    app = import_app(session_preset["api_version"])
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    source = tmp_path / "issues.jsonl"
+    source.write_text(
+        "\n".join(dumps({"summary": f"Issue {num}"}) for num in range(5))
+    )
+    checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+    issues = Issues(session)
+
+    with FileStore(checkpoint_path) as checkpoint:
+        results = issues.import_stream(str(source), 2, checkpoint)
+        async for unique, issue, exc in results:
+            assert_that(exc, equal_to(None))
+            if len(checkpoint) == 3:
+                break
+        await results.aclose()
+
+    with FileStore(checkpoint_path) as checkpoint:
+        assert_that(checkpoint, has_length(3))
+        results = [
+            result
+            async for result in issues.import_stream(
+                str(source), 2, checkpoint
+            )
+        ]
+        assert_that(checkpoint, has_length(5))
+
+    assert_that(results, has_length(2))
+    assert_that(app["imported"], has_length(5))
+    await session.close()
+
+
+async def test_import_stream_keeps_identical_records(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = import_app(session_preset["api_version"])
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    records = [{"summary": "Same"}, {"summary": "Same"}]
+    issues = Issues(session)
+
+    results = [
+        result
+        async for result in issues.import_stream(records, source_id="legacy")
+    ]
+    assert_that({exc for _, _, exc in results}, equal_to({None}))
+    assert_that(app["imported"], has_length(2))
+    assert_that(records, equal_to([{"summary": "Same"}] * 2))
+
+    # Keys follow the legacy ids, so a rerun is deduplicated
+    legacy = [{"id": 1, "summary": "Same"}, {"id": 2, "summary": "Same"}]
+    for _ in range(2):
+        async for _, _, exc in issues.import_stream(
+            legacy, source_id="legacy-db", id_field="id"
+        ):
+            assert_that(exc, equal_to(None))
+    assert_that(app["imported"], has_length(4))
+
+    with raises(ValueError):
+        async for _ in issues.import_stream(records):
+            pass
+    await session.close()
+
+
+def test_file_store_compacted(tmp_path):
+    path = tmp_path / "cursors.jsonl"
+    with FileStore(str(path)) as store:
+        for num in range(100):
+            store.set("TEST-1", num)
+        store.set("TEST-2", "value")
+        store.delete("TEST-3")
+    assert_that(path.read_text().splitlines(), has_length(2))
+
+    # A log left by an interrupted run is compacted on load
+    path.write_text(path.read_text() + '{"key": "TEST-1", "value": 100}\n{')
+    with FileStore(str(path)) as store:
+        assert_that(path.read_text().splitlines(), has_length(2))
+        assert_that(store.get("TEST-1"), equal_to(100))
+        assert_that(store.get("TEST-2"), equal_to("value"))
+        store.set("TEST-2", "new")
+    with FileStore(str(path)) as store:
+        assert_that(store.get("TEST-2"), equal_to("new"))
+    assert_that(list(tmp_path.iterdir()), equal_to([path]))
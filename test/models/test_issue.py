@@ -0,0 +1,183 @@
+from json import dumps
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.models.api import Issues
+from aio_yandex_tracker.retry import RetryPolicy
+from aiohttp import web
+from hamcrest import assert_that, equal_to, is_not, same_instance
+from pytest import raises
+
+from .conftest import issue_payload
+
+
+def conditional_app(api_version: str) -> web.Application:
+    app = web.Application()
+    app["state"] = {"version": 1, "requests": []}
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        state = app["state"]
+        etag = f'"{state["version"]}"'
+        state["requests"].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=dumps(
+                {**issue_payload("TEST-1"), "version": state["version"]}
+            ),
+            headers={"Content-type": "application/json", "ETag": etag},
+        )
+
+    app.router.add_route("GET", f"/{api_version}/issues/{{id}}", issue_cb)
+    return app
+
+
+async def test_issue_reload_not_modified(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    app = conditional_app(session_preset["api_version"])
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    issue = await Issues(session).get("TEST-1")
+    payload = issue.original_payload
+    assert_that(issue.etag, equal_to('"1"'))
+
+    await issue.reload()
+    assert_that(issue.original_payload, same_instance(payload))
+
+    app["state"]["version"] = 2
+    await issue.reload()
+    assert_that(issue.version, equal_to(2))
+    assert_that(issue.etag, equal_to('"2"'))
+    assert_that(app["state"]["requests"], equal_to([None, '"1"', '"1"']))
+    await session.close()
+
+
+async def test_compact_issue_requests(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    app = conditional_app(session_preset["api_version"])
+
+    async def create_cb(request: web.Request) -> web.Response:
+        payload = await request.json()
+        return web.Response(
+            status=201,
+            body=dumps({**issue_payload("TEST-2"), **payload}),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route(
+        "POST", f"/{session_preset['api_version']}/issues", create_cb
+    )
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    issues = Issues(session, const.ENTITY_MODE.COMPACT)
+
+    issue = await issues.get("TEST-1")
+    assert_that(issue.etag, equal_to('"1"'))
+    assert_that(issue._parent_id, equal_to(None))
+    await issue.reload()
+    assert_that(app["state"]["requests"], equal_to([None, '"1"']))
+
+    projected = await issues.get("TEST-1", fields=["key"])
+    assert_that(projected.key, equal_to("TEST-1"))
+
+    created = await issues.create({"summary": "Compact"})
+    assert_that(created.key, equal_to("TEST-2"))
+    assert_that(created.summary, equal_to("Compact"))
+    assert_that(created.last_modified, equal_to(None))
+    await session.close()
+
+
+async def test_apply_transition_keeps_payload(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = conditional_app(session_preset["api_version"])
+    app["payloads"] = []
+
+    async def execute_cb(request: web.Request) -> web.Response:
+        app["payloads"].append(await request.json())
+        transition = {"self": "http://tracker/t/1", "id": "1", "display": "1"}
+        return web.Response(
+            body=dumps([transition]),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route(
+        "POST",
+        f"/{session_preset['api_version']}/issues/{{id}}"
+        "/transitions/{transition_id}/_execute",
+        execute_cb,
+    )
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    issues = Issues(session)
+
+    payload = {"resolution": "fixed"}
+    issue = await issues.get("TEST-1")
+    transitions = await issue.apply_transition("close", payload, "First")
+    await transitions[0].apply(payload, "Second")
+    await issues.apply_transition("TEST-1", "close", payload, "Third")
+    # A payload reused for many issues does not collect their comments
+    assert_that(payload, equal_to({"resolution": "fixed"}))
+    assert_that(
+        [sent["comment"] for sent in app["payloads"]],
+        equal_to(["First", "Second", "Third"]),
+    )
+    await session.close()
+
+
+def create_app(api_version: str) -> web.Application:
+    # The first creation succeeds on the server, but its response is lost
+    app = web.Application()
+    app["created"] = {}
+    app["uniques"] = []
+    json_headers = {"Content-type": "application/json"}
+
+    async def create_cb(request: web.Request) -> web.Response:
+        payload = await request.json()
+        app["uniques"].append(payload["unique"])
+        if payload["unique"] in app["created"]:
+            return web.Response(status=409, body="{}", headers=json_headers)
+        key = f"TEST-{len(app['created']) + 1}"
+        app["created"][payload["unique"]] = {**issue_payload(key), **payload}
+        if len(app["uniques"]) == 1:
+            return web.Response(status=503, body="{}", headers=json_headers)
+        return web.Response(
+            status=201,
+            body=dumps(app["created"][payload["unique"]]),
+            headers=json_headers,
+        )
+
+    async def search_cb(request: web.Request) -> web.Response:
+        unique = (await request.json())["filter"]["unique"]
+        body = [app["created"][unique]] if unique in app["created"] else []
+        return web.Response(body=dumps(body), headers=json_headers)
+
+    app.router.add_route("POST", f"/{api_version}/issues", create_cb)
+    app.router.add_route("POST", f"/{api_version}/issues/_search", search_cb)
+    return app
+
+
+async def test_issue_create_retried(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    app = create_app(session_preset["api_version"])
+    session = get_session(app._loop)
+    session.retry_policy = RetryPolicy(retries=1, base_delay=0.01)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    issues = Issues(session)
+    template = {"summary": "Template"}
+
+    first = await issues.create(template)
+    assert_that(first.key, equal_to("TEST-1"))
+    assert_that(template, equal_to({"summary": "Template"}))
+    second = await issues.create(template)
+    assert_that(second.key, equal_to("TEST-2"))
+    uniques = app["uniques"]
+    assert_that(len(uniques), equal_to(3))
+    assert_that(uniques[0], equal_to(uniques[1]))
+    assert_that(uniques[2], is_not(equal_to(uniques[0])))
+
+    # A conflicting key given by the caller is reported as is
+    with raises(errors.ConflictError):
+        await issues.create({"summary": "Again", "unique": uniques[2]})
+    await session.close()
@@ -0,0 +1,154 @@
+from json import dumps
+from typing import Dict
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.mirror import IssueMirror
+from aio_yandex_tracker.models.api import Issue, Issues
+from aiohttp import web
+from hamcrest import assert_that, equal_to, instance_of, none
+from multidict import CIMultiDict
+
+from .conftest import issue_payload
+
+
+def mirrored_issue(num: int, status: str, updated_at: str) -> Dict:
+    return {
+        **issue_payload(f"TEST-{num}"),
+        "queue": {"key": "TEST"},
+        "status": {"key": status},
+        "updatedAt": updated_at,
+    }
+
+
+def tracker_app(api_version: str) -> web.Application:
+    app = web.Application()
+    app["issues"] = {}
+    app["filters"] = []
+
+    async def search_cb(request: web.Request) -> web.Response:
+        search_request = await request.json()
+        app["filters"].append(search_request["filter"])
+        since = search_request["filter"].get("updatedAt", {}).get("from", "")
+        found = sorted(
+            (
+                issue
+                for issue in app["issues"].values()
+                if issue["updatedAt"] >= since
+            ),
+            key=lambda issue: issue["updatedAt"],
+        )
+        page = int(request.query.get("page", 1))
+        per_page = int(request.query["perPage"])
+        headers = CIMultiDict(
+            {
+                "Content-type": "application/json",
+                "X-Total-Pages": str(-(-len(found) // per_page)),
+            }
+        )
+        headers.add("Link", f'<{request.path_qs}>; rel="first"')
+        headers.add("Link", f'<{request.path_qs}>; rel="seek"')
+        body = found[(page - 1) * per_page : page * per_page]  # noqa E203
+        return web.Response(body=dumps(body), headers=headers)
+
+    app.router.add_route("POST", f"/{api_version}/issues/_search", search_cb)
+    return app
+
+
+async def test_mirror_bootstrap_and_delta_sync(
+    aiohttp_server, customized_session, tmp_path
+):
+    get_session, session_preset = customized_session
+    app = tracker_app(session_preset["api_version"])
+    app["issues"] = {
+        num: mirrored_issue(num, "open", f"2026-01-0{num}T00:00:00")
+        for num in range(1, 4)
+    }
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    path = str(tmp_path / "mirror.sqlite")
+
+    with IssueMirror(Issues(session), path, {"queue": "TEST"}, 2) as mirror:
+        assert_that(await mirror.sync(), equal_to(3))
+        assert_that(mirror.last_sync, equal_to("2026-01-03T00:00:00"))
+
+    app["issues"][2] = mirrored_issue(2, "closed", "2026-01-05T00:00:00")
+    with IssueMirror(Issues(session), path, {"queue": "TEST"}, 2) as mirror:
+        assert_that(await mirror.sync(), equal_to(2))
+        assert_that(len(mirror), equal_to(3))
+        issue = mirror.get("TEST-2")
+        assert_that(issue, instance_of(Issue))
+        assert_that(issue.status, equal_to({"key": "closed"}))
+        assert_that(
+            [issue.key for issue in mirror.query(queue="TEST", status="open")],
+            equal_to(["TEST-1", "TEST-3"]),
+        )
+        assert_that(mirror.get("TEST-4"), none())
+
+    # Each request continues from the latest updatedAt seen
+    assert_that(
+        app["filters"][-2:],
+        equal_to(
+            [
+                {
+                    "queue": "TEST",
+                    "updatedAt": {"from": "2026-01-03T00:00:00"},
+                },
+                {
+                    "queue": "TEST",
+                    "updatedAt": {"from": "2026-01-05T00:00:00"},
+                },
+            ]
+        ),
+    )
+    await session.close()
+
+
+async def test_mirror_sync_survives_shifting_results(
+    aiohttp_server, customized_session, tmp_path
+):
+    get_session, session_preset = customized_session
+    app = tracker_app(session_preset["api_version"])
+    app["issues"] = {
+        num: mirrored_issue(num, "open", f"2026-01-0{num}T00:00:00")
+        for num in range(1, 6)
+    }
+
+    @web.middleware
+    async def update_between_pages(request, handler):
+        response = await handler(request)
+        if len(app["filters"]) == 1:
+            # Moves to the end and shifts the rest of the results back
+            app["issues"][1] = mirrored_issue(1, "closed", "2026-01-09")
+        return response
+
+    app.middlewares.append(update_between_pages)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    with IssueMirror(
+        Issues(session), str(tmp_path / "mirror.sqlite"), {}, 2
+    ) as mirror:
+        await mirror.sync()
+        assert_that(len(mirror), equal_to(5))
+        assert_that(mirror.get("TEST-1").status, equal_to({"key": "closed"}))
+    await session.close()
+
+
+async def test_mirror_sync_same_moment(
+    aiohttp_server, customized_session, tmp_path
+):
+    get_session, session_preset = customized_session
+    app = tracker_app(session_preset["api_version"])
+    app["issues"] = {
+        num: mirrored_issue(num, "open", "2026-01-01T00:00:00")
+        for num in range(1, 6)
+    }
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    with IssueMirror(
+        Issues(session), str(tmp_path / "mirror.sqlite"), {}, 2
+    ) as mirror:
+        assert_that(await mirror.sync(), equal_to(5))
+        assert_that(len(mirror), equal_to(5))
+    await session.close()
@@ -0,0 +1,94 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import get_ident
+from unittest.mock import Mock
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.api import Issue, Issues, build_collection
+from aio_yandex_tracker.models.http import HttpResponse
+from aio_yandex_tracker.offload import Offloader
+from hamcrest import assert_that, equal_to, is_not
+from yarl import URL
+
+from .conftest import issue_payload
+
+
+class ThreadIssue(Issue):
+    def set_fields(self, payload):
+        super().set_fields(payload)
+        self.thread_id = get_ident()
+
+
+async def test_build_collection_in_thread_pool():
+    response = HttpResponse(
+        200,
+        "OK",
+        URL("http://tracker/v2/issues/_search"),
+        {},
+        [issue_payload("TEST-1")],
+        size=1024,
+    )
+    session = Mock(api_version="v2")
+    session.serialize_headers_links.return_value = {}
+
+    with ThreadPoolExecutor(1) as executor:
+        session.offload = Offloader(executor, threshold=1024)
+        offloaded = await build_collection(
+            response, session, ThreadIssue, "post"
+        )
+        session.offload.threshold = 1025
+        inline = await build_collection(response, session, ThreadIssue, "post")
+
+    assert_that(offloaded[0].key, equal_to("TEST-1"))
+    assert_that(offloaded[0].thread_id, is_not(equal_to(get_ident())))
+    assert_that(inline[0].thread_id, equal_to(get_ident()))
+
+
+async def test_search_pages_offloaded(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=2)
+    session = get_session(app._loop)
+    session.offload = Offloader(threshold=0)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    keys = [issue.key async for issue in Issues(session).iter_search()]
+
+    assert_that(keys, equal_to([f"TEST-{num}" for num in range(1, 5)]))
+    # Body decoding and entity construction of both pages
+    assert_that(session.offload.offloaded, equal_to(4))
+    await session.close()
+
+
+async def test_process_pool_only_decodes(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=1)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    with ProcessPoolExecutor(1) as executor:
+        session.offload = Offloader(executor, threshold=0)
+        collection = await Issues(session).search()
+
+    assert_that(
+        [issue.key for issue in collection], equal_to(["TEST-1", "TEST-2"])
+    )
+    assert_that(session.offload.offloaded, equal_to(1))
+    await session.close()
+
+
+async def test_small_body_not_offloaded(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=1)
+    session = get_session(app._loop)
+    session.offload = Offloader()
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    await Issues(session).search()
+
+    assert_that(session.offload.offloaded, equal_to(0))
+    await session.close()
@@ -0,0 +1,143 @@
+import gc
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.models.api import Issues, PaginatedCollection
+from hamcrest import assert_that, contains_exactly, equal_to, instance_of
+from pytest import raises
+
+
+async def test_collection_aiter(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=3)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    collection = await Issues(session).search({"queue": "TEST"})
+    assert_that(collection, instance_of(PaginatedCollection))
+    keys = [issue.key async for issue in collection]
+
+    assert_that(keys, equal_to([f"TEST-{num}" for num in range(1, 7)]))
+    assert_that(app["requests"], contains_exactly(1, 2, 3))
+    await session.close()
+
+
+async def test_iter_search_stops_early(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=5)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    pages = (await Issues(session).search()).iter_pages(prefetch=False)
+    async for page in pages:
+        if page.page == 2:
+            break
+    await pages.aclose()
+
+    assert_that(app["requests"], contains_exactly(1, 2))
+    await session.close()
+
+
+async def test_iter_search_releases_pages(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=5)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    alive = []
+    async for issue in Issues(session).iter_search(prefetch=False):
+        if issue.key == "TEST-9":
+            gc.collect()
+            alive = [
+                page.page
+                for page in gc.get_objects()
+                if isinstance(page, PaginatedCollection)
+            ]
+
+    # Only the page being consumed is still referenced
+    assert_that(alive, equal_to([5]))
+    await session.close()
+
+
+async def test_load_all_keeps_page_order(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=6)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    first_page = await Issues(session).search()
+    pages = await first_page.load_all(concurrency=3)
+
+    assert_that([page.page for page in pages], equal_to([1, 2, 3, 4, 5, 6]))
+    assert_that(sorted(app["requests"]), equal_to([1, 2, 3, 4, 5, 6]))
+    await session.close()
+
+
+async def test_iter_all_streams_in_order(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=5)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    first_page = await Issues(session).search()
+    pages = [page.page async for page in first_page.iter_all(concurrency=2)]
+
+    assert_that(pages, equal_to([1, 2, 3, 4, 5]))
+    await session.close()
+
+
+async def test_load_all_from_middle_page(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=4)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    third_page = await (await Issues(session).search()).load_page_num(3)
+    app["requests"].clear()
+    pages = await third_page.load_all(concurrency=2)
+    assert_that([page.page for page in pages], equal_to([1, 2, 3, 4]))
+    assert_that(pages[2], equal_to(third_page))
+    assert_that(sorted(app["requests"]), equal_to([1, 2, 4]))
+
+    pages = [page.page async for page in third_page.iter_all(concurrency=2)]
+    assert_that(pages, equal_to([1, 2, 3, 4]))
+
+    with raises(ValueError):
+        await third_page.load_all(concurrency=0)
+    with raises(ValueError):
+        third_page.iter_all(concurrency=0)
+    await session.close()
+
+
+async def test_search_fields_projection(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=2)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    keys = [
+        issue.key
+        async for issue in Issues(session).iter_search(
+            fields=["key", "status"]
+        )
+    ]
+
+    assert_that(keys, equal_to(["TEST-1", "TEST-2", "TEST-3", "TEST-4"]))
+    assert_that(
+        [query.get("fields") for query in app["queries"]],
+        equal_to(["key,status", "key,status"]),
+    )
+    await session.close()
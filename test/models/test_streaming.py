@@ -0,0 +1,123 @@
+import gc
+from asyncio import TimeoutError, wait_for
+from json import dumps
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.limiter import RateLimiter
+from aio_yandex_tracker.models.api import Issue, Issues
+from aio_yandex_tracker.session import HttpSession
+from aio_yandex_tracker.streaming import JsonArrayParser
+from hamcrest import assert_that, contains_exactly, equal_to, instance_of
+from pytest import raises
+
+
+def test_parser_items_split_across_chunks():
+    items = [
+        {"summary": 'Quote " and ] } [ {', "tags": ["a", {"b": "\\"}]},
+        "Задача",
+        12.5,
+        None,
+        [1, [2, []]],
+    ]
+    body = dumps(items, ensure_ascii=False).encode()
+    for size in (1, 2, 3, 7, len(body)):
+        parser = JsonArrayParser()
+        parsed = []
+        for pos in range(0, len(body), size):
+            parsed.extend(parser.feed(body[pos : pos + size]))  # noqa E203
+        parsed.extend(parser.close())
+        assert_that(parsed, equal_to(items))
+
+
+def test_parser_large_item_in_small_chunks():
+    item = {"description": "\\" * 5000 + '"' * 5000, "tags": ["x"] * 5000}
+    body = dumps([item, item]).encode()
+    parser = JsonArrayParser()
+    parsed = []
+    for pos in range(0, len(body), 16):
+        parsed.extend(parser.feed(body[pos : pos + 16]))  # noqa E203
+    parsed.extend(parser.close())
+    assert_that(parsed, equal_to([item, item]))
+
+
+def test_parser_returns_complete_items_only():
+    parser = JsonArrayParser()
+    assert_that(
+        parser.feed(b'[{"key": "TEST-1"}, {"key": '),
+        equal_to([{"key": "TEST-1"}]),
+    )
+    assert_that(parser.feed(b'"TEST-2"}]'), equal_to([{"key": "TEST-2"}]))
+    assert_that(parser.close(), equal_to([]))
+
+
+def test_parser_rejects_invalid_body():
+    with raises(errors.StreamParseError):
+        JsonArrayParser().feed(b'{"key": "TEST-1"}')
+    parser = JsonArrayParser()
+    parser.feed(b'[{"key": "TEST-1"}')
+    with raises(errors.StreamParseError):
+        parser.close()
+
+
+async def test_iter_search_stream(
+    aiohttp_server, customized_session, search_app
+):
+    get_session, _ = customized_session
+    app = search_app(pages=3)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    issues = [
+        issue
+        async for issue in Issues(session).iter_search(
+            {"queue": "TEST"}, stream=True
+        )
+    ]
+
+    assert_that(
+        [issue.key for issue in issues],
+        equal_to([f"TEST-{num}" for num in range(1, 7)]),
+    )
+    assert_that(issues[0], instance_of(Issue))
+    assert_that(app["requests"], contains_exactly(1, 2, 3))
+    await session.close()
+
+
+async def test_stream_holds_limiter_slot(
+    aiohttp_server, customized_session, search_app
+):
+    _, session_preset = customized_session
+    app = search_app(pages=1)
+    session = HttpSession(
+        **session_preset,
+        rate_limiter=RateLimiter(max_concurrency=1),
+        loop=app._loop,
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    async def fetch_stream():
+        return await session.fetch(
+            "issues/_search", "post", json={}, stream=True
+        )
+
+    # An unread body keeps its connection and its concurrency slot
+    response = await fetch_stream()
+    with raises(TimeoutError):
+        await wait_for(fetch_stream(), 0.2)
+
+    async with response.body as items:
+        assert_that(len([item async for item in items]), equal_to(2))
+    assert_that(response.body.closed, equal_to(True))
+
+    # Closed without reading
+    response = await wait_for(fetch_stream(), 1)
+    await response.body.aclose()
+
+    # Abandoned and garbage collected
+    response = await wait_for(fetch_stream(), 1)
+    assert_that(await response.body.__anext__(), instance_of(dict))
+    del response
+    gc.collect()
+    response = await wait_for(fetch_stream(), 1)
+    await response.body.aclose()
+    await session.close()
@@ -1,3 +1,5 @@
+from aio_yandex_tracker import const
+from aio_yandex_tracker.session import HttpSession, create_connector
 from hamcrest import assert_that, equal_to
 
 
@@ -11,3 +13,29 @@ async def test_session_close(base_session, event_loop):
     session = base_session(loop=event_loop)
     await session.close()
     assert_that(session.is_closed, equal_to(True))
+
+
+async def test_sessions_share_connector(event_loop):
+    connector = create_connector(limit=10, loop=event_loop)
+    first = HttpSession(
+        const.TEST_TRACKER_TOKEN, "1", connector=connector, loop=event_loop
+    )
+    second = HttpSession(
+        const.TEST_TRACKER_TOKEN, "2", connector=connector, loop=event_loop
+    )
+    await first.close()
+    assert_that(connector.closed, equal_to(False))
+    await second.close()
+    await connector.close()
+
+
+async def test_session_connector_options(event_loop):
+    session = HttpSession(
+        const.TEST_TRACKER_TOKEN,
+        const.TEST_TRACKER_ORG_ID,
+        connector_options={"limit": 7, "limit_per_host": 3},
+        loop=event_loop,
+    )
+    assert_that(session.connector.limit, equal_to(7))
+    assert_that(session.connector.limit_per_host, equal_to(3))
+    await session.close()
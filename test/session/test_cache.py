@@ -0,0 +1,99 @@
+from json import dumps
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.cache import ResponseCache, make_cache_key
+from aio_yandex_tracker.models.api import Issues
+from aio_yandex_tracker.models.http import HttpResponse
+from aiohttp import web
+from hamcrest import assert_that, equal_to, none
+
+
+def tracker_app(api_version: str) -> web.Application:
+    app = web.Application()
+    app["calls"] = []
+    headers = {"Content-type": "application/json"}
+    issue = {
+        "self": "http://tracker/issues/TEST-1",
+        "id": "1",
+        "key": "TEST-1",
+    }
+    transition = {
+        "self": "http://tracker/t/close",
+        "id": "close",
+        "display": "Close",
+    }
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        app["calls"].append(f"{request.method} {request.path}")
+        return web.Response(body=dumps(issue), headers=headers)
+
+    async def transitions_cb(request: web.Request) -> web.Response:
+        app["calls"].append(f"{request.method} {request.path}")
+        return web.Response(body=dumps([transition]), headers=headers)
+
+    app.router.add_route("*", f"/{api_version}/issues/{{id}}", issue_cb)
+    app.router.add_route(
+        "GET", f"/{api_version}/issues/{{id}}/transitions", transitions_cb
+    )
+    return app
+
+
+def test_cache_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    responses = [HttpResponse(200, "OK", None, {}, num) for num in range(3)]
+    for num, response in enumerate(responses):
+        cache.set(make_cache_key(f"endpoint/{num}"), response, ttl=60)
+
+    assert_that(cache.get(make_cache_key("endpoint/0")), none())
+    assert_that(cache.get(make_cache_key("endpoint/2")).body, equal_to(2))
+    assert_that(
+        (cache.hits, cache.misses, cache.evictions), equal_to((1, 1, 1))
+    )
+
+
+def test_cache_hits_do_not_share_body():
+    cache = ResponseCache()
+    key = make_cache_key(const.ISSUES_DIRECT_URL.format(id="TEST-1"))
+    response = HttpResponse(200, "OK", None, {}, {"tags": ["a"]})
+    cache.set(key, response, ttl=60)
+    response.body["tags"].append("b")
+    cache.get(key).body["tags"].append("c")
+    assert_that(cache.get(key).body, equal_to({"tags": ["a"]}))
+
+
+def test_cache_ttl_expiration():
+    cache = ResponseCache()
+    key = make_cache_key(const.PRIORITIES_URL, {"localized": "false"})
+    cache.set(key, HttpResponse(200, "OK", None, {}, []), ttl=-1)
+    assert_that(cache.get(key), none())
+    assert_that(len(cache), equal_to(0))
+
+
+async def test_transitions_cached_and_invalidated(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = tracker_app(session_preset["api_version"])
+    session = get_session(app._loop)
+    session.cache = ResponseCache()
+    issues = Issues(session)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    await issues.transitions("TEST-1")
+    await issues.transitions("TEST-1")
+    await issues.edit("1", {"summary": "Updated"})
+    await issues.transitions("TEST-1")
+
+    transitions_path = f"/{session_preset['api_version']}/issues/TEST-1"
+    assert_that(
+        app["calls"],
+        equal_to(
+            [
+                f"GET {transitions_path}/transitions",
+                f"PATCH /{session_preset['api_version']}/issues/1",
+                f"GET {transitions_path}/transitions",
+            ]
+        ),
+    )
+    assert_that((session.cache.hits, session.cache.misses), equal_to((1, 2)))
+    await session.close()
@@ -0,0 +1,168 @@
+import gzip
+import zlib
+from json import dumps, loads
+from threading import get_ident
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker import session as session_module
+from aio_yandex_tracker.compression import (
+    brotli,
+    decompress,
+    get_accept_encoding,
+    zstandard,
+)
+from aio_yandex_tracker.instrumentation import MetricsCollector
+from aio_yandex_tracker.offload import Offloader
+from aio_yandex_tracker.session import HttpSession
+from aiohttp import web
+from hamcrest import assert_that, equal_to, is_not, less_than
+from pytest import mark, raises, skip
+
+BODY = [{"key": f"TEST-{num}", "summary": "Compressed"} for num in range(200)]
+ENCODERS = {
+    "gzip": gzip.compress,
+    "deflate": zlib.compress,
+    "br": brotli.compress if brotli else None,
+    "zstd": zstandard.compress if zstandard else None,
+}
+
+
+def compressed_app(api_version: str, encoding: str) -> web.Application:
+    app = web.Application()
+    app["requests"] = []
+
+    async def search_cb(request: web.Request) -> web.Response:
+        body = await request.read()
+        app["requests"].append((request.headers, body))
+        payload = dumps(BODY).encode()
+        headers = {"Content-type": "application/json"}
+        if encoding != "identity":
+            payload = ENCODERS[encoding](payload)
+            headers["Content-Encoding"] = encoding
+        return web.Response(body=payload, headers=headers)
+
+    app.router.add_route("*", f"/{api_version}/issues/_search", search_cb)
+    return app
+
+
+@mark.parametrize("encoding", ["identity", *ENCODERS])
+async def test_response_decompressed(
+    aiohttp_server, customized_session, encoding
+):
+    if encoding != "identity" and ENCODERS[encoding] is None:
+        skip(f"{encoding} library is not installed")
+    _, session_preset = customized_session
+    app = compressed_app(session_preset["api_version"], encoding)
+    metrics = MetricsCollector()
+    session = HttpSession(
+        **session_preset, instrumentation=metrics, loop=app._loop
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    response = await session.fetch("issues/_search", "post", json={})
+    assert_that(response.body, equal_to(BODY))
+    assert_that(response.size, equal_to(len(dumps(BODY).encode())))
+    headers, _ = app["requests"][0]
+    assert_that(
+        headers["Accept-Encoding"], equal_to(", ".join(get_accept_encoding()))
+    )
+    stats = metrics.get("post", const.ISSUES_SEARCH_URL)
+    assert_that(stats.bytes_received, equal_to(response.size))
+    assert_that(
+        stats.bytes_received_compressed, equal_to(response.compressed_size)
+    )
+    if encoding == "identity":
+        assert_that(response.compressed_size, equal_to(response.size))
+    else:
+        assert_that(response.compressed_size, less_than(response.size))
+    await session.close()
+
+
+async def test_stream_decompressed(aiohttp_server, customized_session):
+    _, session_preset = customized_session
+    app = compressed_app(session_preset["api_version"], "gzip")
+    session = HttpSession(**session_preset, loop=app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    response = await session.fetch(
+        "issues/_search", "post", json={}, stream=True
+    )
+    assert_that([item async for item in response.body], equal_to(BODY))
+    await session.close()
+
+
+async def test_request_compressed(aiohttp_server, customized_session):
+    _, session_preset = customized_session
+    app = compressed_app(session_preset["api_version"], "identity")
+    session = HttpSession(
+        **session_preset,
+        accept_encoding=(),
+        compress_threshold=1024,
+        loop=app._loop,
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    await session.fetch("issues/_search", "post", json={"filter": {}})
+    await session.fetch("issues/_search", "post", json={"issues": BODY})
+    (small_headers, small_body), (big_headers, big_body) = app["requests"]
+    assert_that(small_headers["Accept-Encoding"], equal_to("identity"))
+    assert_that("Content-Encoding" in small_headers, equal_to(False))
+    assert_that(loads(small_body), equal_to({"filter": {}}))
+    assert_that(big_headers["Content-Encoding"], equal_to("gzip"))
+    # The test server decompresses request bodies by itself
+    assert_that(loads(big_body), equal_to({"issues": BODY}))
+    assert_that(
+        int(big_headers["Content-Length"]),
+        less_than(len(dumps({"issues": BODY}))),
+    )
+    await session.close()
+
+
+def test_decompress():
+    body = dumps(BODY).encode()
+    raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    deflated = raw_deflate.compress(body) + raw_deflate.flush()
+    assert_that(decompress(deflated, "deflate"), equal_to(body))
+    assert_that(decompress(body, "identity"), equal_to(body))
+    with raises(errors.UnsupportedEncodingError):
+        decompress(body, "compress")
+    for encoding in ("gzip", "deflate", "br", "zstd"):
+        if encoding in get_accept_encoding():
+            with raises(errors.DecompressionError):
+                decompress(b"not compressed at all", encoding)
+
+
+async def test_decompression_offloaded(
+    aiohttp_server, customized_session, monkeypatch
+):
+    threads = []
+
+    def tracked_decompress(*args):
+        threads.append(get_ident())
+        return decompress(*args)
+
+    monkeypatch.setattr(session_module, "decompress", tracked_decompress)
+    _, session_preset = customized_session
+    app = compressed_app(session_preset["api_version"], "gzip")
+    session = HttpSession(
+        **session_preset,
+        offload=Offloader(threshold=const.OFFLOAD_THRESHOLD_DEFAULT),
+        loop=app._loop,
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    # Compressed body is below the threshold, the decompressed one is not
+    session.offload.threshold = len(dumps(BODY).encode()) // 2
+    response = await session.fetch("issues/_search", "post", json={})
+    assert_that(response.body, equal_to(BODY))
+    assert_that(session.offload.offloaded, equal_to(1))
+    assert_that(threads[-1], equal_to(get_ident()))
+
+    # Decompression and decoding both leave the event loop
+    session.offload.threshold = response.compressed_size
+    response = await session.fetch("issues/_search", "post", json={})
+    assert_that(response.body, equal_to(BODY))
+    assert_that(response.size, equal_to(len(dumps(BODY).encode())))
+    assert_that(session.offload.offloaded, equal_to(2))
+    assert_that(threads[-1], is_not(equal_to(get_ident())))
+    await session.close()
@@ -0,0 +1,180 @@
+from json import dumps
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.instrumentation import (
+    CompositeHooks,
+    MetricsCollector,
+    OpenTelemetryHooks,
+    PrometheusHooks,
+    otel_trace,
+    prometheus_client,
+)
+from aio_yandex_tracker.retry import RetryPolicy
+from aio_yandex_tracker.session import HttpSession
+from aiohttp import web
+from hamcrest import assert_that, equal_to, greater_than
+from pytest import mark, raises
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:  # pragma: no cover
+    TracerProvider = None
+
+
+def issue_app(api_version: str, statuses) -> web.Application:
+    app = web.Application()
+    app["calls"] = 0
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        app["calls"] += 1
+        return web.Response(
+            body=dumps({"key": request.match_info["id"]}),
+            status=statuses[min(app["calls"], len(statuses)) - 1],
+            headers={"Content-type": "application/json"},
+        )
+
+    async def search_cb(request: web.Request) -> web.Response:
+        return web.Response(
+            body=dumps([{"key": "TEST-1"}, {"key": "TEST-2"}]),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route("POST", f"/{api_version}/issues/_search", search_cb)
+    app.router.add_route("*", f"/{api_version}/issues/{{id}}", issue_cb)
+    return app
+
+
+async def test_endpoint_template(base_session, event_loop):
+    session = base_session(loop=event_loop)
+    url = f"{session.base_url}/{session.api_version}/issues/TEST-1/links/2"
+    assert_that(
+        session.get_endpoint_template(f"{url}?expand=all"),
+        equal_to(const.LINKS_DIRECT_URL),
+    )
+    assert_that(
+        session.get_endpoint_template("http://other/v2/issues"),
+        equal_to(const.METRICS_ENDPOINT_UNKNOWN),
+    )
+    await session.close()
+
+
+async def test_metrics_collected(aiohttp_server, customized_session):
+    _, session_preset = customized_session
+    app = issue_app(session_preset["api_version"], [429, 200, 404])
+    metrics = MetricsCollector()
+    session = HttpSession(
+        **session_preset,
+        retry_policy=RetryPolicy(retries=1, base_delay=0.01),
+        instrumentation=CompositeHooks(metrics),
+        loop=app._loop,
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    await session.fetch("issues/TEST-1", "get")
+    with raises(errors.NotFoundError):
+        await session.fetch("issues/TEST-2", "patch")
+
+    get_stats = metrics.get("get", const.ISSUES_DIRECT_URL)
+    assert_that(
+        (get_stats.requests, get_stats.retries, get_stats.throttled),
+        equal_to((1, 1, 1)),
+    )
+    assert_that(get_stats.bytes_received, greater_than(0))
+    assert_that(sum(get_stats.latency_buckets), equal_to(1))
+    patch_stats = metrics.get("patch", const.ISSUES_DIRECT_URL)
+    assert_that((patch_stats.requests, patch_stats.errors), equal_to((1, 1)))
+    await session.close()
+
+
+@mark.skipif(prometheus_client is None, reason="prometheus_client missing")
+async def test_prometheus_hooks(aiohttp_server, customized_session):
+    _, session_preset = customized_session
+    app = issue_app(session_preset["api_version"], [200])
+    registry = prometheus_client.CollectorRegistry()
+    session = HttpSession(
+        **session_preset,
+        instrumentation=PrometheusHooks(registry),
+        loop=app._loop,
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    await session.fetch("issues/TEST-1", "get")
+
+    labels = {"method": "get", "endpoint": const.ISSUES_DIRECT_URL}
+    assert_that(
+        registry.get_sample_value(
+            "yandex_tracker_request_duration_seconds_count",
+            {**labels, "status": "200"},
+        ),
+        equal_to(1),
+    )
+    assert_that(
+        registry.get_sample_value(
+            "yandex_tracker_received_bytes_total", labels
+        ),
+        greater_than(0),
+    )
+    await session.close()
+
+
+async def test_stream_ends_when_closed(aiohttp_server, customized_session):
+    _, session_preset = customized_session
+    app = issue_app(session_preset["api_version"], [200])
+    metrics = MetricsCollector()
+    session = HttpSession(
+        **session_preset, instrumentation=metrics, loop=app._loop
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    response = await session.fetch(
+        "issues/_search", "post", json={}, stream=True
+    )
+    stats = metrics.get("post", const.ISSUES_SEARCH_URL)
+    assert_that(stats.requests, equal_to(0))
+    items = [item async for item in response.body]
+    assert_that(len(items), equal_to(2))
+    assert_that(stats.requests, equal_to(1))
+    assert_that(
+        stats.bytes_received,
+        equal_to(len(dumps([{"key": "TEST-1"}, {"key": "TEST-2"}]))),
+    )
+    await session.close()
+
+
+@mark.skipif(TracerProvider is None, reason="opentelemetry-sdk missing")
+async def test_opentelemetry_hooks(aiohttp_server, customized_session):
+    _, session_preset = customized_session
+    app = issue_app(session_preset["api_version"], [503, 200, 404])
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    session = HttpSession(
+        **session_preset,
+        retry_policy=RetryPolicy(retries=1, base_delay=0.01),
+        instrumentation=OpenTelemetryHooks(provider.get_tracer(__name__)),
+        loop=app._loop,
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    await session.fetch("issues/TEST-1", "get")
+    with raises(errors.NotFoundError):
+        await session.fetch("issues/TEST-2", "get")
+
+    success, failure = exporter.get_finished_spans()
+    assert_that(success.name, equal_to(f"GET {const.ISSUES_DIRECT_URL}"))
+    assert_that(success.kind, equal_to(otel_trace.SpanKind.CLIENT))
+    assert_that(success.attributes["http.status_code"], equal_to(200))
+    assert_that(success.attributes["tracker.attempts"], equal_to(2))
+    assert_that([event.name for event in success.events], equal_to(["retry"]))
+    assert_that(
+        failure.status.status_code, equal_to(otel_trace.StatusCode.ERROR)
+    )
+    assert_that(failure.attributes["http.status_code"], equal_to(404))
+    assert_that(
+        [event.name for event in failure.events], equal_to(["exception"])
+    )
+    await session.close()
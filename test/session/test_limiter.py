@@ -0,0 +1,43 @@
+from time import monotonic
+
+from aio_yandex_tracker.limiter import RateLimiter, parse_retry_after
+from hamcrest import (
+    assert_that,
+    close_to,
+    equal_to,
+    greater_than_or_equal_to,
+    less_than,
+)
+
+
+def test_parse_retry_after():
+    assert_that(parse_retry_after({"Retry-After": "3"}), equal_to(3.0))
+    assert_that(
+        parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+        equal_to(0.0),
+    )
+    assert_that(parse_retry_after({}), equal_to(None))
+
+
+async def test_limiter_rate():
+    limiter = RateLimiter(rate=20, burst=1)
+    started_at = monotonic()
+    for _ in range(5):
+        async with limiter:
+            pass
+    assert_that(monotonic() - started_at, greater_than_or_equal_to(0.19))
+
+
+async def test_limiter_adapts_to_429():
+    limiter = RateLimiter(rate=8, min_rate=1)
+    limiter.on_response(429, {"Retry-After": "0.2"})
+    assert_that(limiter.rate, equal_to(4))
+    assert_that(limiter.paused_for, close_to(0.2, 0.05))
+
+    started_at = monotonic()
+    async with limiter:
+        pass
+    assert_that(monotonic() - started_at, greater_than_or_equal_to(0.19))
+
+    limiter.on_response(200, {})
+    assert_that(limiter.rate, less_than(8))
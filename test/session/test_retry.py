@@ -0,0 +1,118 @@
+from json import dumps
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.retry import RetryPolicy
+from aiohttp import web
+from hamcrest import assert_that, equal_to, less_than_or_equal_to
+from pytest import raises
+
+
+def flaky_app(api_version: str, statuses, headers=None) -> web.Application:
+    app = web.Application()
+    app["calls"] = 0
+
+    async def flaky_cb(request: web.Request) -> web.Response:
+        app["calls"] += 1
+        status = statuses[min(app["calls"], len(statuses)) - 1]
+        return web.Response(
+            body=dumps({"key": "1"}),
+            status=status,
+            headers={"Content-type": "application/json", **(headers or {})},
+        )
+
+    app.router.add_route("*", f"/{api_version}/test_retry", flaky_cb)
+    return app
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    assert_that(policy.get_delay(0), equal_to(1))
+    assert_that(policy.get_delay(2), equal_to(4))
+    assert_that(policy.get_delay(10), equal_to(5))
+    assert_that(policy.get_delay(0, {"Retry-After": "3"}), equal_to(3))
+    assert_that(policy.get_delay(0, {"Retry-After": "7"}), equal_to(5))
+    jittered = RetryPolicy(base_delay=1, max_delay=5).get_delay(10)
+    assert_that(jittered, less_than_or_equal_to(5))
+
+
+def test_retry_policy_idempotency():
+    policy = RetryPolicy()
+    assert_that(policy.should_retry("get", 503), equal_to(True))
+    assert_that(policy.should_retry("post", 503), equal_to(False))
+    assert_that(policy.should_retry("post", 503, True), equal_to(True))
+    assert_that(policy.should_retry("post", 429), equal_to(True))
+    assert_that(policy.should_retry("get", 404), equal_to(False))
+    with raises(TypeError):
+        policy.replace(unknown=1)
+
+
+async def test_request_retried(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    app = flaky_app(session_preset["api_version"], [503, 502, 200])
+    session = get_session(app._loop)
+    session.retry_policy = RetryPolicy(retries=2, base_delay=0.01)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    resp = await session.fetch("test_retry", "get")
+
+    assert_that(resp.status, equal_to(200))
+    assert_that(app["calls"], equal_to(3))
+    await session.close()
+
+
+async def test_retry_attributes_update_policy(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = flaky_app(session_preset["api_version"], [503, 200])
+    session = get_session(app._loop)
+    session.retry_policy = RetryPolicy(retries=2, base_delay=0.01)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    session.retries = 0
+    session.retry_interval = 0.02
+
+    assert_that(session.retry_policy.retries, equal_to(0))
+    assert_that(session.retry_policy.base_delay, equal_to(0.02))
+    assert_that(session.retries, equal_to(0))
+    assert_that(session.retry_interval, equal_to(0.02))
+    with raises(errors.ApiUnavailableError):
+        await session.fetch("test_retry", "get")
+    assert_that(app["calls"], equal_to(1))
+    await session.close()
+
+
+async def test_non_idempotent_request_not_retried(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = flaky_app(session_preset["api_version"], [503, 200])
+    session = get_session(app._loop)
+    session.retry_policy = RetryPolicy(retries=2, base_delay=0.01)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    with raises(errors.ApiUnavailableError) as exc_info:
+        await session.fetch("test_retry", "post")
+    assert_that(exc_info.value.status_code, equal_to(503))
+    assert_that(app["calls"], equal_to(1))
+
+    resp = await session.fetch("test_retry", "post", idempotent=True)
+    assert_that(resp.status, equal_to(200))
+    await session.close()
+
+
+async def test_too_many_requests_respects_retry_after(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = flaky_app(
+        session_preset["api_version"], [429, 201], {"Retry-After": "0"}
+    )
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    resp = await session.fetch("test_retry", "post", retries=1)
+
+    assert_that(resp.status, equal_to(201))
+    assert_that(app["calls"], equal_to(2))
+    await session.close()
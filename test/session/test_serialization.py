@@ -0,0 +1,54 @@
+from aio_yandex_tracker import const
+from aio_yandex_tracker.serialization import (
+    JsonCodec,
+    OrjsonCodec,
+    get_default_codec,
+    orjson,
+)
+from aio_yandex_tracker.session import HttpSession, decode_json
+from aiohttp import web
+from hamcrest import assert_that, equal_to, instance_of
+
+
+def test_codecs_round_trip():
+    value = {"key": "TEST-1", "summary": "Задача", "tags": [1, None, True]}
+    codecs = [JsonCodec(), get_default_codec()]
+    if orjson is not None:
+        assert_that(get_default_codec(), instance_of(OrjsonCodec))
+    for codec in codecs:
+        assert_that(codec.loads(codec.dumps(value)), equal_to(value))
+
+
+def test_decode_json():
+    body = '{"summary": "Задача"}'
+    assert_that(decode_json(body.encode()), equal_to({"summary": "Задача"}))
+    assert_that(
+        decode_json(body.encode("cp1251"), "cp1251"),
+        equal_to({"summary": "Задача"}),
+    )
+    assert_that(decode_json(b" "), equal_to(None))
+
+
+async def test_session_json_codec(aiohttp_server, customized_session):
+    _, session_preset = customized_session
+    app = web.Application()
+
+    async def echo_cb(request: web.Request) -> web.Response:
+        return web.Response(
+            body=await request.read(),
+            headers={"Content-type": request.headers["Content-type"]},
+        )
+
+    app.router.add_route(
+        "POST", f"/{session_preset['api_version']}/test_echo", echo_cb
+    )
+    session = HttpSession(
+        **session_preset, json_codec=JsonCodec(), loop=app._loop
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    resp = await session.fetch("test_echo", "post", json={"key": "TEST-1"})
+
+    assert_that(resp.body, equal_to({"key": "TEST-1"}))
+    assert_that(resp.headers["Content-type"], equal_to("application/json"))
+    await session.close()
@@ -0,0 +1,59 @@
+from asyncio import gather, sleep
+from json import dumps
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.session import HttpSession
+from aiohttp import web
+from hamcrest import assert_that, equal_to
+
+
+def counting_app(api_version: str) -> web.Application:
+    app = web.Application()
+    app["calls"] = 0
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        app["calls"] += 1
+        await sleep(0.05)
+        return web.Response(
+            body=dumps({"key": request.match_info["id"]}),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route("*", f"/{api_version}/issues/{{id}}", issue_cb)
+    return app
+
+
+async def test_identical_requests_coalesced(
+    aiohttp_server, customized_session
+):
+    _, session_preset = customized_session
+    app = counting_app(session_preset["api_version"])
+    session = HttpSession(
+        **session_preset, coalesce_requests=True, loop=app._loop
+    )
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    responses = await gather(
+        *[session.fetch("issues/TEST-1", "get") for _ in range(5)],
+        session.fetch("issues/TEST-2", "get"),
+        session.fetch("issues/TEST-1", "get", params={"expand": "links"}),
+    )
+
+    assert_that(
+        [resp.body["key"] for resp in responses],
+        equal_to(["TEST-1"] * 5 + ["TEST-2", "TEST-1"]),
+    )
+    assert_that(app["calls"], equal_to(3))
+    responses[0].body["key"] = "CHANGED"
+    assert_that(responses[1].body["key"], equal_to("TEST-1"))
+
+    # A shorter deadline is not attached to a slower call
+    await gather(
+        session.fetch("issues/TEST-1", "get"),
+        session.fetch("issues/TEST-1", "get", deadline=1),
+    )
+    assert_that(app["calls"], equal_to(5))
+
+    await gather(*[session.fetch("issues/TEST-1", "patch") for _ in range(2)])
+    assert_that(app["calls"], equal_to(7))
+    await session.close()
@@ -0,0 +1,84 @@
+from asyncio import sleep
+from json import dumps
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.models.api import Issues
+from aio_yandex_tracker.retry import RetryPolicy
+from aiohttp import web
+from hamcrest import assert_that, equal_to, less_than
+from pytest import raises
+
+
+def slow_app(api_version: str, delay: float) -> web.Application:
+    app = web.Application()
+    app["calls"] = 0
+
+    async def slow_cb(request: web.Request) -> web.Response:
+        app["calls"] += 1
+        await sleep(delay)
+        return web.Response(
+            body=dumps({"key": "1"}),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route("GET", f"/{api_version}/test_slow", slow_cb)
+    return app
+
+
+async def test_request_timeout(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    app = slow_app(session_preset["api_version"], 0.5)
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    with raises(errors.ApiTimeoutError):
+        await session.fetch("test_slow", "get", timeout=0.05)
+    await session.close()
+
+
+async def test_request_deadline_covers_retries(
+    aiohttp_server, customized_session
+):
+    get_session, session_preset = customized_session
+    app = slow_app(session_preset["api_version"], 0.2)
+    session = get_session(app._loop)
+    session.retry_policy = RetryPolicy(retries=10, base_delay=0.01)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    started_at = app.loop.time()
+    with raises(errors.ApiTimeoutError):
+        await session.fetch("test_slow", "get", timeout=0.1, deadline=0.35)
+    assert_that(app.loop.time() - started_at, less_than(0.5))
+    assert_that(app["calls"], less_than(5))
+    await session.close()
+
+
+async def test_issue_methods_timeout(aiohttp_server, customized_session):
+    get_session, session_preset = customized_session
+    api_version = session_preset["api_version"]
+    app = slow_app(api_version, 0.5)
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        app["calls"] += 1
+        await sleep(0.5)
+        return web.Response(body="[]")
+
+    for path in ("", "/links", "/changelog"):
+        app.router.add_route(
+            "GET", f"/{api_version}/issues/{{id}}{path}", issue_cb
+        )
+    session = get_session(app._loop)
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+    issue = Issues(session).from_payload(
+        {"self": "http://tracker/issues/TEST-1", "id": "1", "key": "TEST-1"}
+    )
+
+    for call in (
+        lambda: issue.reload(timeout=0.05),
+        lambda: issue.links(deadline=0.05),
+        lambda: issue.changelog(timeout=0.05),
+    ):
+        with raises(errors.ApiTimeoutError):
+            await call()
+    assert_that(app["calls"], equal_to(3))
+    await session.close()
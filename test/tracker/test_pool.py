@@ -0,0 +1,134 @@
+from json import dumps
+
+from aio_yandex_tracker import const
+from aio_yandex_tracker.cache import ResponseCache
+from aio_yandex_tracker.pool import TrackerPool
+from aiohttp import web
+from hamcrest import assert_that, equal_to, is_not, same_instance
+from pytest import raises
+
+API_VERSION = "v2"
+
+
+def tenant_app() -> web.Application:
+    app = web.Application()
+    app["requests"] = []
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        app["requests"].append(
+            (
+                request.headers["Authorization"],
+                request.headers["X-Org-ID"],
+                request.transport.get_extra_info("peername"),
+            )
+        )
+        key = request.match_info["id"]
+        return web.Response(
+            body=dumps(
+                {"self": f"http://tracker/issues/{key}", "id": key, "key": key}
+            ),
+            headers={"Content-type": "application/json"},
+        )
+
+    app.router.add_route("*", f"/{API_VERSION}/issues/{{id}}", issue_cb)
+    return app
+
+
+def create_pool(**options) -> TrackerPool:
+    return TrackerPool(
+        api_root=f"localhost.localdomain:{const.TEST_AIOHTTP_SERVER_PORT}",
+        api_schema="http",
+        api_version=API_VERSION,
+        **options,
+    )
+
+
+async def test_pool_tenant_headers(aiohttp_server):
+    app = tenant_app()
+    await aiohttp_server(app, port=const.TEST_AIOHTTP_SERVER_PORT)
+
+    async with create_pool() as pool:
+        first = pool.get(1, "token-1")
+        second = pool.get("2", "token-2")
+        assert_that(pool.get("1", "token-1"), same_instance(first))
+        await first.issues.get("TEST-1")
+        await second.issues.get("TEST-2")
+        await first.issues.get("TEST-3")
+
+        auth = [(token, org_id) for token, org_id, _ in app["requests"]]
+        assert_that(
+            auth,
+            equal_to(
+                [
+                    ("OAuth token-1", "1"),
+                    ("OAuth token-2", "2"),
+                    ("OAuth token-1", "1"),
+                ]
+            ),
+        )
+        # A single keep-alive connection serves both tenants
+        peers = {peer for _, _, peer in app["requests"]}
+        assert_that(len(peers), equal_to(1))
+        assert_that(
+            pool.get_rate_limiter(1),
+            is_not(same_instance(pool.get_rate_limiter(2))),
+        )
+
+        rotated = pool.get(1, "token-3")
+        assert_that(rotated, is_not(same_instance(first)))
+        await rotated.issues.get("TEST-4")
+        assert_that(app["requests"][-1][0], equal_to("OAuth token-3"))
+    assert_that(pool.is_closed, equal_to(True))
+    assert_that(len(pool), equal_to(0))
+
+
+async def test_pool_eviction():
+    pool = create_pool(max_tenants=2, rate_limiter_factory=None)
+    pool.get(1, "token")
+    pool.get(2, "token")
+    pool.get(1, "token")
+    pool.get(3, "token")
+    # Tenant 2 is the least recently used one
+    assert_that(
+        (1 in pool, 2 in pool, 3 in pool), equal_to((True, False, True))
+    )
+    assert_that(pool.get_rate_limiter(1), equal_to(None))
+
+    pool.idle_timeout = 0
+    assert_that(pool.evict_idle(), equal_to(2))
+    assert_that((len(pool), pool.evicted), equal_to((0, 3)))
+    await pool.close()
+
+
+async def test_pool_rate_limiters_outlive_tenants():
+    pool = create_pool(max_tenants=1, max_rate_limiters=2)
+    pool.get(1, "token")
+    limiter = pool.get_rate_limiter(1)
+    pool.get(2, "token")
+    assert_that(1 in pool, equal_to(False))
+    # An evicted tenant comes back with its throttling state
+    pool.get(1, "token")
+    assert_that(pool.get_rate_limiter(1), same_instance(limiter))
+
+    pool.get(3, "token")
+    assert_that(pool.get_rate_limiter(2), equal_to(None))
+    assert_that(pool.get_rate_limiter(1), same_instance(limiter))
+    await pool.close()
+
+
+async def test_pool_caches_per_tenant():
+    with raises(TypeError):
+        create_pool(cache=ResponseCache())
+
+    caches = []
+
+    def cache_factory() -> ResponseCache:
+        caches.append(ResponseCache())
+        return caches[-1]
+
+    pool = create_pool(cache_factory=cache_factory)
+    pool.get(1, "token")
+    pool.get(2, "token")
+    pool.get(1, "token")
+    assert_that(len(caches), equal_to(2))
+    await pool.close()
@@ -0,0 +1,176 @@
+from asyncio import sleep
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps
+from threading import enumerate as enumerate_threads
+
+from aio_yandex_tracker import const, errors
+from aio_yandex_tracker.models.api import Issue
+from aio_yandex_tracker.sync import LoopThread, SyncYandexTracker
+from aiohttp import web
+from hamcrest import assert_that, equal_to, instance_of
+from multidict import CIMultiDict
+from pytest import fixture, raises
+
+API_VERSION = "v2"
+TOTAL_PAGES = 3
+PER_PAGE = 2
+
+
+def make_issue(key: str) -> dict:
+    return {"self": f"http://tracker/issues/{key}", "id": key, "key": key}
+
+
+def sync_app() -> web.Application:
+    app = web.Application()
+    app["peers"] = set()
+    json_headers = {"Content-type": "application/json"}
+
+    async def search_cb(request: web.Request) -> web.Response:
+        app["peers"].add(request.transport.get_extra_info("peername"))
+        page = int(request.query.get("page", 1))
+        body = [
+            make_issue(f"TEST-{num}")
+            for num in range((page - 1) * PER_PAGE + 1, page * PER_PAGE + 1)
+        ]
+        url = f"http://{request.host}{request.rel_url}"
+        headers = CIMultiDict(json_headers)
+        headers.add("Link", f'<{url}>; rel="first"')
+        headers.add("Link", f'<{url}>; rel="seek"')
+        headers["X-Total-Pages"] = str(TOTAL_PAGES)
+        headers["X-Total-Count"] = str(TOTAL_PAGES * PER_PAGE)
+        return web.Response(body=dumps(body), headers=headers)
+
+    async def issue_cb(request: web.Request) -> web.Response:
+        app["peers"].add(request.transport.get_extra_info("peername"))
+        key = request.match_info["id"]
+        if key == "MISSING-1":
+            return web.Response(status=404, body="{}", headers=json_headers)
+        return web.Response(body=dumps(make_issue(key)), headers=json_headers)
+
+    app.router.add_route("POST", f"/{API_VERSION}/issues/_search", search_cb)
+    app.router.add_route("*", f"/{API_VERSION}/issues/{{id}}", issue_cb)
+    return app
+
+
+@fixture
+def sync_server():
+    # The test blocks its thread, so the server needs a loop of its own
+    server_thread = LoopThread("test-server")
+    app = sync_app()
+    runner = web.AppRunner(app, access_log=None)
+    server_thread.run(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    server_thread.run(site.start())
+    yield app, runner.addresses[0][1]
+    server_thread.run(runner.cleanup())
+    server_thread.close()
+
+
+def create_tracker(port: int) -> SyncYandexTracker:
+    return SyncYandexTracker(
+        const.TEST_TRACKER_TOKEN,
+        const.TEST_TRACKER_ORG_ID,
+        api_root=f"127.0.0.1:{port}",
+        api_schema="http",
+        api_version=API_VERSION,
+    )
+
+
+def test_sync_requests(sync_server):
+    app, port = sync_server
+    with create_tracker(port) as tracker:
+        issue = tracker.issues.get("TEST-1")
+        assert_that(issue.key, equal_to("TEST-1"))
+        assert_that(issue.wrapped, instance_of(Issue))
+
+        page = tracker.issues.search()
+        assert_that(
+            [issue.key for issue in page], equal_to(["TEST-1", "TEST-2"])
+        )
+        assert_that(page.load_next().page, equal_to(2))
+        keys = [issue.key for issue in tracker.issues.iter_search()]
+        assert_that(len(keys), equal_to(TOTAL_PAGES * PER_PAGE))
+
+        with raises(errors.NotFoundError):
+            tracker.issues.get("MISSING-1")
+
+        # Calls of many threads share the loop and the connection pool
+        with ThreadPoolExecutor(4) as executor:
+            keys = list(
+                executor.map(
+                    lambda num: tracker.issues.get(f"TEST-{num}").key,
+                    range(20),
+                )
+            )
+        assert_that(keys, equal_to([f"TEST-{num}" for num in range(20)]))
+        assert_that(len(app["peers"]) <= 4, equal_to(True))
+    assert_that(tracker.is_closed, equal_to(True))
+
+
+def test_sync_containers_wrapped(sync_server):
+    _, port = sync_server
+    with create_tracker(port) as tracker:
+        pages = tracker.issues.search().load_all(2)
+        assert_that([page.page for page in pages], equal_to(list(range(1, 4))))
+        issue = pages[1][0].reload()
+        assert_that(issue.wrapped, instance_of(Issue))
+        assert_that(issue.key, equal_to("TEST-3"))
+
+        result = tracker.issues.get_many(["TEST-1", "NOPE-1"])
+        assert_that(result.missing, equal_to(["NOPE-1"]))
+        assert_that(result.errors, equal_to({}))
+        assert_that(result["TEST-1"].reload().key, equal_to("TEST-1"))
+
+
+def test_sync_abandoned_iteration(sync_server):
+    _, port = sync_server
+    tracker = create_tracker(port)
+    for issue in tracker.issues.iter_search():
+        break
+    assert_that(issue.key, equal_to("TEST-1"))
+    tracker.close()
+    tracker.close()
+    assert_that(tracker.is_closed, equal_to(True))
+
+
+def test_loop_thread_close_cleans_up():
+    runner = LoopThread("test-close")
+    cancelled, closed, suspended = [], [], []
+
+    async def pending():
+        try:
+            await sleep(3600)
+        finally:
+            cancelled.append(True)
+
+    async def generator():
+        try:
+            yield 1
+            yield 2
+        finally:
+            closed.append(True)
+
+    async def start():
+        runner.loop.create_task(pending())
+        items = generator()
+        await items.__anext__()
+        # The generator is left suspended
+        suspended.append(items)
+
+    runner.run(start())
+    runner.close()
+    assert_that(cancelled, equal_to([True]))
+    assert_that(closed, equal_to([True]))
+    assert_that(runner.is_closed, equal_to(True))
+
+
+def test_sync_tracker_init_failure():
+    with raises(TypeError):
+        SyncYandexTracker(
+            const.TEST_TRACKER_TOKEN,
+            const.TEST_TRACKER_ORG_ID,
+            unknown_option=True,
+            thread_name="test-init-failure",
+        )
+    names = [thread.name for thread in enumerate_threads()]
+    assert_that("test-init-failure" in names, equal_to(False))